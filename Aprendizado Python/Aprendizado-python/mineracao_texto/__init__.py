@@ -0,0 +1,26 @@
+"""
+Mineração de texto: contagem de frequência de palavras em corpora
+
+O núcleo (tokenização, índice, snapshots, n-gramas, co-ocorrência, analisador)
+só usa a biblioteca padrão. Relatórios (pandas), gráficos (matplotlib/seaborn)
+e menus ficam em módulos próprios, importados sob demanda pelo analisador.
+"""
+from .tokenizacao import (TOKEN_PATTERN, SENTENCE_TOKEN_PATTERN, TextNormalizer, fold_case_counts,
+                          stem_portuguese, stem_english, strip_accents, STEMMERS)
+from .indice import Vocabulary, DocumentCounts, PositionalIndex, PresenceFilter
+from .estatisticas import P2Quantile, RunningStats, RatioEstimator, log_likelihood, log_ratio
+from .snapshot import write_snapshot, read_snapshot
+from .coocorrencia import CooccurrenceMatrix
+from .ngramas import ngram_hash, count_ngrams
+from .memoria import resident_bytes, SpillStore
+from .progresso import ProgressReporter
+from .carregadores import (register_loader, loader_for, read_text, extract_text, sniff_file,
+                           archive_format, iter_archive, LineCounter)
+from .amostragem import sampling_units, estimate_frequency
+from .paralelo import count_files
+from .similaridade import SimilarityIndex
+from .monitor import FolderWatcher
+from .servidor import CorpusQueryService, serve_corpus
+from .analisador import TextFrequencyAnalyzer
+from .particoes import shard_of, shard_files, run_shard, claim_shards, merge_shards
+from .contraste import load_corpus, key_counts, keyness, compare_corpora
@@ -0,0 +1,171 @@
+"""Prévia por amostragem: frequências estimadas com intervalos de confiança"""
+import time
+import random
+from collections import Counter
+from pathlib import Path
+
+from .tokenizacao import TOKEN_PATTERN
+from .estatisticas import RatioEstimator
+from .carregadores import (LOADERS, archive_format, extract_text, iter_archive, read_chunk,
+                           sniff_file)
+
+
+def sampling_units(paths, chunk_bytes=4 * 1024 * 1024):
+    """
+    Divide os arquivos em unidades de amostragem (caminho, início, fim)
+
+    Arquivos de texto simples maiores que chunk_bytes viram vários trechos de
+    chunk_bytes bytes; os demais (pequenos, .docx, compactados...) são uma
+    unidade inteira, com início e fim None. Só os arquivos grandes são
+    classificados aqui, então o plano de uma pasta enorme custa um stat por
+    arquivo.
+    """
+    units = []
+    for path in paths:
+        size = path.stat().st_size
+        chunked = (size > chunk_bytes and not archive_format(path)
+                   and path.suffix.lower() not in LOADERS and sniff_file(path) == 'texto')
+        if not chunked:
+            units.append((path, None, None, size))
+            continue
+        for start in range(0, size, chunk_bytes):
+            units.append((path, start, min(start + chunk_bytes, size), min(chunk_bytes, size - start)))
+    return units
+
+
+def _unit_texts(path, start, end, encoding):
+    """Textos de uma unidade: o trecho, o arquivo inteiro ou cada membro de um compactado"""
+    if start is not None:
+        yield read_chunk(path, start, end, encoding)
+    elif archive_format(path):
+        for _, _, text in iter_archive(path, encoding):
+            if text is not None:
+                yield text
+    else:
+        _, text = extract_text(path, encoding)
+        if text is not None:
+            yield text
+
+
+def estimate_frequency(analyzer, source, target_words, case_sensitive=False, sample_size=30,
+                       chunk_mb=1, confidence=0.95, precision=None, time_budget=None,
+                       encoding='utf-8', seed=None):
+    """
+    Estima a frequência das palavras-alvo em uma pasta ou arquivo grande
+    lendo só uma amostra aleatória de documentos (ou trechos de bytes)
+
+    A amostra cresce em rodadas de sample_size unidades. Sem precision e sem
+    time_budget, só a primeira rodada é lida; com eles, as rodadas continuam
+    até que o erro relativo de todas as palavras fique abaixo de precision
+    (ex.: 0.05 = ±5%) ou até esgotar time_budget segundos. Os totais do corpus
+    são extrapolados pelo estimador de razão sobre os bytes de cada unidade.
+    Palavras ainda não encontradas têm erro relativo infinito, então com
+    precision convém informar também time_budget.
+
+    Args:
+        analyzer: TextFrequencyAnalyzer (normalização e chaves de consulta)
+        source: pasta, arquivo ou lista de arquivos
+        chunk_mb: tamanho dos trechos em que arquivos de texto grandes são divididos
+        confidence: nível de confiança dos intervalos
+
+    Returns:
+        dicionário com 'palavras' ({palavra: estimativa, inferior, superior,
+        erro_relativo, por_mil_tokens}), 'tokens' e dados da amostra
+    """
+    if isinstance(source, (str, Path)):
+        source = Path(source)
+        paths = sorted(f for f in source.iterdir() if f.is_file()) if source.is_dir() else [source]
+    else:
+        paths = [Path(path) for path in source]
+
+    target_words = [word for word in target_words if word.strip()]
+    if not case_sensitive:
+        target_words = [word.lower() for word in target_words]
+    units = sampling_units(paths, int(chunk_mb * 1024 * 1024))
+    if not units or not target_words:
+        print("✗ Erro: É preciso ter arquivos e ao menos uma palavra para a amostragem!")
+        return {}
+
+    population_bytes = sum(unit[3] for unit in units)
+    order = list(range(len(units)))
+    random.Random(seed).shuffle(order)
+
+    plan = analyzer._ngram_plan(target_words, case_sensitive, None)
+    keys = {word: analyzer.lookup_key(word, case_sensitive) for word in target_words}
+    # Partes de cada expressão: o n-grama só é contado se todas aparecem na unidade
+    phrase_parts = {word: [analyzer.lookup_key(part, case_sensitive) for part in TOKEN_PATTERN.findall(word)]
+                    for word in (plan['hashes'] if plan is not None else ())}
+    estimators = {word: RatioEstimator() for word in target_words}
+    tokens = RatioEstimator()
+    resolved = {}
+    started = time.perf_counter()
+    read = 0
+
+    def summary():
+        results = {}
+        for word, estimator in estimators.items():
+            estimate, low, high = estimator.interval(len(units), population_bytes, confidence)
+            if estimate:
+                relative = (high - low) / 2 / estimate
+            else:
+                relative = 0.0 if high == 0 else float('inf')
+            results[word] = {
+                'estimativa': estimate,
+                'inferior': low,
+                'superior': high,
+                'erro_relativo': relative,
+                'por_mil_tokens': estimator.sum_y / tokens.sum_y * 1000 if tokens.sum_y else 0.0,
+            }
+        return results
+
+    while read < len(units):
+        batch_end = min(read + sample_size, len(units))
+        while read < batch_end:
+            path, start, end, size = units[order[read]]
+            unit_counts = Counter()
+            unit_tokens = 0
+            for text in _unit_texts(path, start, end, encoding):
+                raw = Counter(TOKEN_PATTERN.findall(text))
+                unit_tokens += sum(raw.values())
+                for token, count in raw.items():
+                    key = resolved.get(token)
+                    if key is None:
+                        key = resolved[token] = analyzer.lookup_key(token, case_sensitive)
+                    unit_counts[key] += count
+                if any(all(unit_counts[part] for part in parts) for parts in phrase_parts.values()):
+                    for word, count in analyzer._phrase_frequencies({'text': text}, plan, case_sensitive).items():
+                        unit_counts[(word,)] += count
+
+            tokens.add(size, unit_tokens)
+            for word, estimator in estimators.items():
+                key = (word,) if plan is not None and word in plan['hashes'] else keys[word]
+                estimator.add(size, unit_counts[key])
+            read += 1
+            # O orçamento de tempo também interrompe uma rodada em andamento
+            if time_budget is not None and read > sample_size and time.perf_counter() - started >= time_budget:
+                break
+
+        results = summary()
+        elapsed = time.perf_counter() - started
+        worst = max(item['erro_relativo'] for item in results.values())
+        if analyzer.verbose:
+            print(f"🔎 Amostra: {read}/{len(units)} unidades | erro relativo máximo ±{worst:.1%} | {elapsed:.1f}s")
+        if precision is None and time_budget is None:
+            break
+        if precision is not None and worst <= precision:
+            break
+        if time_budget is not None and elapsed >= time_budget:
+            break
+
+    estimate, low, high = tokens.interval(len(units), population_bytes, confidence)
+    return {
+        'palavras': summary(),
+        'tokens': {'estimativa': estimate, 'inferior': low, 'superior': high},
+        'unidades_lidas': read,
+        'unidades': len(units),
+        'bytes_lidos': tokens.sum_x,
+        'bytes_total': population_bytes,
+        'confianca': confidence,
+        'exato': read == len(units),
+        'tempo': time.perf_counter() - started,
+    }
@@ -0,0 +1,1410 @@
+"""Núcleo de contagem: TextFrequencyAnalyzer"""
+import re
+import sys
+import gc
+import hashlib
+import tarfile
+import zipfile
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from heapq import merge
+from pathlib import Path
+
+from .tokenizacao import TOKEN_PATTERN, SENTENCE_TOKEN_PATTERN, fold_case_counts
+from .indice import Vocabulary, DocumentCounts, PositionalIndex
+from .estatisticas import RunningStats
+from .snapshot import write_snapshot, read_snapshot
+from .coocorrencia import CooccurrenceMatrix
+from .ngramas import ngram_hash, count_ngrams
+from .memoria import resident_bytes, SpillStore
+from .progresso import ProgressReporter
+from .carregadores import extract_text, archive_format, iter_archive, folder_files, LineCounter
+from .secoes import SectionSegmenter, segment_text, section_text
+from . import amostragem
+from .paralelo import count_files
+from .similaridade import SimilarityIndex, DEFAULT_MAX_DF
+
+
+def _bounded_map(executor, function, items, window):
+    """
+    Como executor.map (resultados na ordem original), mas com no máximo
+    `window` tarefas pendentes: textos já lidos não se acumulam em memória
+    à frente do consumo, e o orçamento de memória continua valendo
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+class TextFrequencyAnalyzer:
+    def __init__(self, normalizer=None, positional_index=False, verbose=1, memory_budget_mb=None,
+                 spill_dir=None, segment_sections=False):
+        """
+        Args:
+            normalizer: TextNormalizer opcional aplicado aos tokens e às
+                palavras-alvo (acentos, radicalização, forma Unicode)
+            positional_index: se True, monta o índice posicional (usado pela
+                concordância KWIC) na mesma passada da contagem
+            verbose: 0 = só resumos, 1 = barra de progresso, 2 = uma linha por arquivo
+            memory_budget_mb: limite de memória para textos e contagens; ao
+                ultrapassá-lo, os textos são indexados e descartados e as
+                contagens vão para runs em disco (None = sem limite)
+            spill_dir: pasta para os runs em disco (padrão: pasta temporária)
+            segment_sections: se True, a contagem de cada texto já separa as
+                seções (resumo, corpo, referências), parágrafos e sentenças
+        """
+        self.texts = []
+        self.word_frequencies = {}
+        # Estatísticas por palavra, atualizadas a cada documento contado
+        self.running_stats = {}
+        # Resultados do último analyze_profiles: {perfil: resultados por arquivo}
+        self.profile_results = {}
+        # (parâmetros e hashes dos documentos, SimilarityIndex) do último similarity_index
+        self._similarity = None
+        self.normalizer = normalizer
+        self.positional_index = positional_index
+        self.segment_sections = segment_sections
+        self.verbose = verbose
+        self.memory_budget = memory_budget_mb * 1024 * 1024 if memory_budget_mb else None
+        self.spill_dir = spill_dir
+        self._spill_store = None
+        self._resident_bytes = 0
+        self._spilling = False
+        # (caminho, tipo) dos arquivos ignorados na última carga de pasta
+        self.skipped_files = []
+        self.vocabulary = Vocabulary()
+        # (case_sensitive, normalizer) -> [chave -> ids do vocabulário, ids já mapeados]
+        self._key_maps = {}
+        
+    def add_text(self, text, source_name="Texto", path=None):
+        """Adiciona um texto à análise"""
+        text_data = {
+            'text': text,
+            'source': source_name
+        }
+        if path is not None:
+            text_data['path'] = str(path)
+        self.texts.append(text_data)
+        self._track_memory(sys.getsizeof(text))
+    
+    def _track_memory(self, nbytes):
+        """Contabiliza memória nova e despeja para disco se o orçamento estourar"""
+        if self.memory_budget is None or self._spilling:
+            return
+        self._resident_bytes += nbytes
+        if self._resident_bytes > self.memory_budget:
+            # A conta incremental pode estar desatualizada (textos removidos): recalcula
+            self._resident_bytes = sum(resident_bytes(text_data) for text_data in self.texts)
+            if self._resident_bytes > self.memory_budget:
+                self.spill_to_disk()
+    
+    def spill_to_disk(self):
+        """
+        Libera memória: indexa e descarta os textos originais e move as contagens
+        residentes para um run ordenado em disco (mapeado com mmap)
+        
+        Análises de frequência, relatórios, gráficos e snapshots continuam
+        funcionando; co-ocorrência, n-gramas e concordância precisam do texto
+        original e passam a ignorar os documentos despejados.
+        """
+        self._spilling = True
+        try:
+            for text_data in self.texts:
+                self.document_counts(text_data)
+                text_data['text'] = None
+                text_data.pop('positions', None)
+            
+            resident = [text_data for text_data in self.texts if isinstance(text_data['counts'].ids, array)]
+            if resident:
+                if self._spill_store is None:
+                    self._spill_store = SpillStore(self.spill_dir)
+                # Contagens do documento seguidas das contagens por seção, se houver
+                documents = []
+                for text_data in resident:
+                    documents.append(text_data['counts'])
+                    documents.extend(text_data.get('sections', {}).values())
+                self._spill_store.spill(documents)
+            
+            self._resident_bytes = sum(resident_bytes(text_data) for text_data in self.texts)
+            if self.verbose >= 1:
+                print(f"\n💽 Orçamento de memória excedido: {len(resident)} documento(s) despejado(s) para disco"
+                      f" ({self._spill_store.runs if self._spill_store else 0} run(s),"
+                      f" {self._spill_store.bytes_written / 1e6 if self._spill_store else 0:,.1f} MB)")
+        finally:
+            self._spilling = False
+    
+    def add_pasted_text(self, text, source_name="Texto Colado"):
+        """
+        Adiciona texto colado diretamente
+        
+        O texto é contado na hora; o total de palavras exibido vem dessa mesma
+        contagem, que a análise reaproveita depois.
+        
+        Args:
+            text: o texto completo colado
+            source_name: nome para identificar este texto
+        """
+        if not text or not text.strip():
+            print("✗ Erro: Texto vazio fornecido!")
+            return False
+            
+        self.add_text(text, source_name)
+        counts = self.document_counts(self.texts[-1])
+        self._print_added(source_name, len(text), counts.total)
+        return True
+    
+    def new_line_counter(self):
+        """LineCounter para alimentar linha a linha e depois passar a add_counted_text"""
+        return LineCounter(SectionSegmenter() if self.segment_sections else None)
+    
+    def add_counted_text(self, counter, source_name="Entrada", path=None, announce=True):
+        """
+        Adiciona um texto já contado por um LineCounter (o texto original não é
+        guardado, como nos documentos de snapshot)
+        
+        Args:
+            announce: se True, exibe caracteres e palavras do texto adicionado
+        """
+        if counter.words == 0:
+            print("✗ Erro: Texto vazio fornecido!")
+            return False
+        
+        text_data = {'text': None, 'source': source_name}
+        if path is not None:
+            text_data['path'] = str(path)
+        if counter.segmenter is not None:
+            section_counts, stats = counter.segmenter.finish()
+            whole = Counter()
+            for raw_counts in section_counts.values():
+                whole.update(raw_counts)
+            text_data['sections'] = {
+                name: DocumentCounts.from_counter(raw_counts, self.vocabulary)
+                for name, raw_counts in section_counts.items()
+            }
+            text_data['section_stats'] = stats
+        else:
+            whole = counter.raw_counts
+        text_data['counts'] = DocumentCounts.from_counter(whole, self.vocabulary)
+        text_data['sha1'] = counter.sha1
+        self.texts.append(text_data)
+        self._track_memory(resident_bytes(text_data))
+        if announce:
+            self._print_added(source_name, counter.characters, counter.words)
+        return True
+    
+    def add_text_stream(self, lines, source_name="Entrada", path=None):
+        """
+        Conta um texto que chega linha a linha (ex.: sys.stdin) em memória
+        constante, sem guardar o texto
+        
+        Args:
+            lines: iterável de linhas (arquivo aberto, sys.stdin, lista...)
+            source_name: nome para identificar este texto
+        """
+        counter = self.new_line_counter()
+        for line in lines:
+            counter.feed(line)
+        return self.add_counted_text(counter, source_name, path)
+    
+    def _print_added(self, source_name, char_count, word_count):
+        print(f"✓ Texto '{source_name}' adicionado com sucesso!")
+        print(f"  - Caracteres: {char_count:,}")
+        print(f"  - Palavras: {word_count:,}")
+    
+    def _compact_spill(self):
+        """Fim de uma carga: junta os runs em disco em um só (agregação externa)"""
+        if self._spill_store is not None:
+            self._spill_store.compact()
+    
+    def load_text_file(self, file_path, encoding='utf-8'):
+        """
+        Carrega texto de um arquivo (retorna True se foi adicionado); arquivos
+        compactados (.zip, .tar.gz, .gz...) são carregados com load_archive
+        """
+        if archive_format(file_path):
+            return self.load_archive(file_path, encoding) > 0
+        try:
+            kind, text = extract_text(file_path, encoding)
+        except FileNotFoundError:
+            print(f"✗ Erro: Arquivo '{file_path}' não encontrado!")
+            return False
+        except Exception as e:
+            print(f"✗ Erro ao carregar arquivo: {e}")
+            return False
+        
+        file_name = Path(file_path).stem
+        if text is None and kind != 'vazio':
+            print(f"✗ Erro: Arquivo '{file_path}' ignorado: não é texto ({kind})")
+            return False
+        if not text or not text.strip():
+            print(f"✗ Erro: Arquivo '{file_path}' está vazio!")
+            return False
+        self.add_text(text, file_name, path=file_path)
+        print(f"✓ Arquivo '{file_name}' carregado com sucesso!")
+        return True
+    
+    def load_folder(self, folder_path, file_extensions=None, encoding='utf-8', workers=1, processes=1,
+                    keep_texts=True):
+        """
+        Carrega todos os arquivos de texto de uma pasta
+        
+        Args:
+            folder_path: caminho para a pasta
+            file_extensions: lista de extensões (ex: ['.txt', '.md']) ou None para todas
+            encoding: codificação dos arquivos
+            workers: número de threads de leitura
+            processes: processos de contagem; com mais de 1, os arquivos são
+                lidos e contados em paralelo (ver paralelo.count_files)
+            keep_texts: se False, só as contagens são guardadas (sem
+                n-gramas/co-ocorrência/KWIC): com processes > 1 os textos não
+                voltam dos processos, e membros de compactados são contados
+                linha a linha
+        
+        Arquivos compactados da pasta (ou um arquivo compactado no lugar da
+        pasta) também são lidos, sem extração, filtrando seus membros pelas
+        mesmas extensões.
+        """
+        if file_extensions is None:
+            file_extensions = ['.txt', '.md', '.doc', '.docx']
+        
+        folder_path = Path(folder_path)
+        
+        if not folder_path.exists():
+            print(f"✗ Erro: Pasta não encontrada: {folder_path}")
+            return 0
+        if folder_path.is_file() and archive_format(folder_path):
+            return self.load_archive(folder_path, encoding, workers, file_extensions, keep_texts)
+        
+        # Procurar por todos os tipos de arquivo
+        files = folder_files(folder_path, file_extensions)
+        
+        files_loaded = self._load_files(files, encoding, workers, member_extensions=file_extensions,
+                                        processes=processes, keep_texts=keep_texts)
+        
+        if files_loaded == 0:
+            print(f"✗ Nenhum arquivo encontrado em: {folder_path}")
+            print(f"Extensões procuradas: {file_extensions}")
+        else:
+            print(f"\n✅ Total de arquivos carregados: {files_loaded}")
+        
+        return files_loaded
+    
+    def load_all_files_from_folder(self, folder_path, encoding='utf-8', workers=1, processes=1, keep_texts=True):
+        """
+        Carrega TODOS os arquivos de uma pasta, independente da extensão
+        (incluindo os membros de arquivos compactados)
+        
+        Args:
+            workers: número de threads de leitura
+            processes, keep_texts: como em load_folder
+        """
+        folder_path = Path(folder_path)
+        
+        if not folder_path.exists():
+            print(f"✗ Erro: Pasta não encontrada: {folder_path}")
+            return 0
+        if folder_path.is_file() and archive_format(folder_path):
+            return self.load_archive(folder_path, encoding, workers, keep_texts=keep_texts)
+        
+        # Pegar todos os arquivos da pasta
+        all_files = folder_files(folder_path)
+        
+        files_loaded = self._load_files(all_files, encoding, workers, processes=processes, keep_texts=keep_texts)
+        
+        if files_loaded == 0:
+            print(f"✗ Nenhum arquivo de texto encontrado em: {folder_path}")
+        else:
+            print(f"\n✅ Total de arquivos carregados: {files_loaded}")
+        
+        return files_loaded
+    
+    def load_files(self, files, file_extensions=None, encoding='utf-8', workers=1, processes=1, keep_texts=True):
+        """
+        Carrega uma lista de arquivos já escolhidos (ex.: um fragmento da
+        pasta, ver particoes.run_shard), sem mensagens de resumo da pasta
+        
+        Args:
+            files: caminhos dos arquivos; compactados têm os membros filtrados
+                por file_extensions (None = todos)
+            encoding, workers, processes, keep_texts: como em load_folder
+        
+        Returns:
+            número de documentos carregados
+        """
+        return self._load_files([Path(file_path) for file_path in files], encoding, workers,
+                                member_extensions=file_extensions, processes=processes, keep_texts=keep_texts)
+    
+    def load_archive(self, archive_path, encoding='utf-8', workers=1, file_extensions=None, keep_texts=True):
+        """
+        Carrega os arquivos de texto de um .zip, .tar (.tar.gz, .tgz, .tar.bz2,
+        .tar.xz) ou .gz/.bz2/.xz sem extraí-los para o disco
+        
+        Cada membro vira um documento com fonte '<compactado>/<membro sem
+        extensão>' (é o nome que aparece nos relatórios e exportações).
+        
+        Args:
+            workers: threads de leitura (membros de zip são lidos em paralelo)
+            file_extensions: extensões aceitas para os membros (None = todas)
+            keep_texts: se False, cada membro é contado linha a linha e o texto
+                não é guardado (n-gramas, co-ocorrência e KWIC ficam indisponíveis)
+        
+        Returns:
+            número de membros carregados
+        """
+        self.skipped_files = []
+        loaded = self._load_archive(Path(archive_path), encoding, workers, file_extensions, keep_texts)
+        self._report_skipped()
+        if loaded:
+            print(f"\n✅ Total de arquivos carregados de {Path(archive_path).name}: {loaded}")
+        else:
+            print(f"✗ Nenhum arquivo de texto encontrado em: {archive_path}")
+        return loaded
+    
+    def _load_archive(self, archive_path, encoding, workers, file_extensions, keep_texts=True):
+        """Adiciona os membros de texto de um arquivo compactado (ver load_archive)"""
+        progress = ProgressReporter(f"Lendo {archive_path.name}", enabled=self.verbose == 1)
+        make_counter = None if keep_texts else self.new_line_counter
+        loaded = 0
+        try:
+            for name, kind, payload in iter_archive(archive_path, encoding, file_extensions, workers, make_counter):
+                source = f"{archive_path.name}/{Path(name).with_suffix('')}"
+                path = f"{archive_path}::{name}"
+                if payload is None:
+                    self.skipped_files.append((path, kind))
+                elif isinstance(payload, str) and payload.strip():
+                    self.add_text(payload, source, path=path)
+                    loaded += 1
+                elif not isinstance(payload, str) and payload.words:
+                    self.add_counted_text(payload, source, path, announce=False)
+                    loaded += 1
+                else:
+                    self.skipped_files.append((path, 'vazio'))
+                progress.update(files=1, nbytes=len(payload) if isinstance(payload, str) else 0)
+                if self.verbose >= 2 and payload:
+                    print(f"✓ Arquivo carregado: {source}")
+        except (OSError, EOFError, ValueError, zipfile.BadZipFile, tarfile.TarError) as e:
+            print(f"✗ Erro ao ler {archive_path.name}: {e}")
+        progress.close()
+        return loaded
+    
+    def _load_files(self, files, encoding='utf-8', workers=1, member_extensions=None, processes=1, keep_texts=True):
+        """
+        Lê uma lista de arquivos (em paralelo se workers > 1) e adiciona os não
+        vazios, na ordem original, reportando o progresso agregado
+        
+        Cada arquivo é classificado pelos primeiros bytes antes da leitura:
+        binários sem leitor registrado (imagens, executáveis, PDFs...) são
+        ignorados sem serem lidos por inteiro e listados em self.skipped_files.
+        Arquivos compactados são lidos depois, membro a membro (load_archive),
+        com os membros filtrados por member_extensions. Com processes > 1, os
+        arquivos já chegam contados dos processos (_load_counted_files).
+        """
+        archives = [file_path for file_path in files if archive_format(file_path)]
+        if archives:
+            files = [file_path for file_path in files if not archive_format(file_path)]
+        total_bytes = 0
+        for file_path in files:
+            try:
+                total_bytes += file_path.stat().st_size
+            except OSError:
+                pass
+        progress = ProgressReporter("Carregando arquivos", len(files), total_bytes,
+                                    enabled=self.verbose == 1)
+        
+        def read(file_path):
+            # Os bytes de arquivos ilegíveis também contam: eles fazem parte
+            # de total_bytes, e sem isso a estimativa nunca fecha
+            try:
+                size = file_path.stat().st_size
+            except OSError:
+                size = 0
+            try:
+                # Classificar pelos primeiros bytes e extrair com o leitor adequado
+                kind, text = extract_text(file_path, encoding)
+                return file_path, kind, text, None
+            except Exception as e:
+                return file_path, None, None, e
+            finally:
+                progress.update(files=1, nbytes=size)
+        
+        files_loaded = 0
+        self.skipped_files = []
+        workers = max(1, workers)
+        if processes > 1 and len(files) > 1:
+            files_loaded = self._load_counted_files(files, encoding, processes, keep_texts, progress)
+            files = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for file_path, kind, text, error in _bounded_map(executor, read, files, 2 * workers):
+                if error is not None:
+                    print(f"✗ Erro ao carregar {file_path.name}: {error}")
+                elif text is None:
+                    self.skipped_files.append((file_path, kind))
+                elif text.strip():  # Só adiciona se não estiver vazio
+                    self.add_text(text, file_path.stem, path=file_path)
+                    files_loaded += 1
+                    if self.verbose >= 2:
+                        print(f"✓ Arquivo carregado: {file_path.stem} ({file_path.suffix})")
+                else:
+                    self.skipped_files.append((file_path, 'vazio'))
+        
+        progress.close()
+        for archive_path in archives:
+            files_loaded += self._load_archive(archive_path, encoding, workers, member_extensions, keep_texts)
+        self._compact_spill()
+        self._report_skipped()
+        return files_loaded
+    
+    def _load_counted_files(self, files, encoding, processes, keep_texts, progress):
+        """Adiciona arquivos contados em paralelo por processos, já indexados"""
+        files_loaded = 0
+        for file_path, kind, digest, counts, text in count_files(files, self.vocabulary, encoding, processes,
+                                                                 keep_texts, progress):
+            if digest is None:
+                print(f"✗ Erro ao carregar {file_path.name}")
+            elif not digest:
+                self.skipped_files.append((file_path, kind))
+            else:
+                text_data = {
+                    'text': text,
+                    'source': file_path.stem,
+                    'path': str(file_path),
+                    'counts': counts,
+                    'sha1': digest,
+                }
+                self.texts.append(text_data)
+                self._track_memory(resident_bytes(text_data))
+                files_loaded += 1
+                if self.verbose >= 2:
+                    print(f"✓ Arquivo carregado: {file_path.stem} ({file_path.suffix})")
+        return files_loaded
+    
+    def _report_skipped(self, limit=10):
+        """Resumo dos arquivos ignorados na última carga, agrupados por tipo"""
+        if not self.skipped_files:
+            return
+        kinds = Counter(kind for _, kind in self.skipped_files)
+        
+        print("\n=== ARQUIVOS IGNORADOS ===")
+        print(f"Total: {len(self.skipped_files)}")
+        for kind, count in kinds.most_common():
+            print(f"  {kind}: {count}")
+        
+        print(f"\nPrimeiros {min(limit, len(self.skipped_files))} arquivos ignorados:")
+        for file_path, kind in self.skipped_files[:limit]:
+            print(f"  - {Path(file_path).name} ({kind})")
+    
+    def build_index(self):
+        """
+        Conta (indexa) todos os textos ainda não indexados, com progresso de
+        arquivos/s e tokens/s
+        """
+        pending = [text_data for text_data in self.texts if text_data.get('counts') is None]
+        if pending:
+            progress = ProgressReporter("Indexando textos", len(pending),
+                                        enabled=self.verbose == 1 and len(pending) > 1)
+            for text_data in pending:
+                counts = self.document_counts(text_data)
+                progress.update(files=1, tokens=counts.total)
+            progress.close()
+        # Textos adicionados um a um (add_text) despejam sem passar por uma carga
+        self._compact_spill()
+    
+    def preprocess_text(self, text):
+        """Preprocessa o texto (remove pontuação, converte para minúsculas)"""
+        # Remove pontuação e caracteres especiais, mantém apenas letras e espaços
+        text = re.sub(r'[^\w\s]', ' ', text)
+        # Converte para minúsculas
+        text = text.lower()
+        # Remove espaços extras
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text
+    
+    def count_tokens(self, text, case_sensitive=False, both_forms=False):
+        """
+        Conta os tokens de um texto em uma única passada
+        
+        A pontuação é descartada pela própria expressão regular nos dois modos.
+        A contagem é sempre feita sobre a forma original; o modo sem distinção de
+        maiúsculas apenas agrupa as chaves do Counter, com custo proporcional ao
+        vocabulário e não ao tamanho do texto. O mesmo vale para o normalizador
+        opcional (self.normalizer), aplicado uma vez por token distinto.
+        
+        Args:
+            text: texto a ser contado
+            case_sensitive: se True, considera maiúsculas/minúsculas
+            both_forms: se True, retorna também a contagem na forma original
+        
+        Returns:
+            (contagem, total_palavras) ou, com both_forms,
+            (contagem, contagem_original, total_palavras)
+        """
+        raw_counts = Counter(TOKEN_PATTERN.findall(text))
+        total_words = sum(raw_counts.values())
+        if self.normalizer is not None:
+            word_count = self.normalizer.normalize_counts(raw_counts, fold_case=not case_sensitive)
+        elif case_sensitive:
+            word_count = raw_counts
+        else:
+            word_count = fold_case_counts(raw_counts)
+        
+        if both_forms:
+            return word_count, raw_counts, total_words
+        return word_count, total_words
+    
+    def lookup_key(self, word, case_sensitive=False):
+        """Forma sob a qual uma palavra-alvo aparece nas contagens de count_tokens"""
+        if self.normalizer is not None:
+            return self.normalizer.normalize(word, not case_sensitive)
+        return word if case_sensitive else word.lower()
+    
+    def document_counts(self, text_data):
+        """
+        Contagens compactas (DocumentCounts) de um texto carregado
+        
+        São calculadas na primeira consulta e guardadas no próprio registro do
+        texto, sempre na forma original dos tokens; maiúsculas e normalização
+        são resolvidas na consulta, sobre o vocabulário.
+        """
+        counts = text_data.get('counts')
+        if counts is None:
+            text = text_data['text']
+            if self.segment_sections:
+                # Seções e documento inteiro saem da mesma passada; o índice
+                # posicional, se pedido, é montado sob demanda (document_positions)
+                counts = self._segment(text_data)
+            elif self.positional_index:
+                sequence = array('I', map(self.vocabulary.add, TOKEN_PATTERN.findall(text)))
+                counts = DocumentCounts.from_sequence(sequence)
+                text_data['positions'] = PositionalIndex.build(sequence, counts)
+            else:
+                counts = DocumentCounts.from_tokens(TOKEN_PATTERN.findall(text), self.vocabulary)
+            text_data['counts'] = counts
+            # Hash do texto extraído, para detectar mudanças sem recontar
+            text_data['sha1'] = hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+            self._track_memory(resident_bytes(text_data) - sys.getsizeof(text))
+        return counts
+    
+    def _segment(self, text_data):
+        """Segmenta o texto em seções e devolve as contagens do documento inteiro"""
+        section_counts, stats = segment_text(text_data['text'])
+        whole = Counter()
+        for raw_counts in section_counts.values():
+            whole.update(raw_counts)
+        counts = DocumentCounts.from_counter(whole, self.vocabulary)
+        text_data['sections'] = {
+            name: DocumentCounts.from_counter(raw_counts, self.vocabulary)
+            for name, raw_counts in section_counts.items()
+        }
+        text_data['section_stats'] = stats
+        return counts
+    
+    def document_sections(self, text_data):
+        """
+        Contagens por seção ({'resumo', 'corpo', 'referencias'} -> DocumentCounts)
+        de um texto carregado
+        
+        Sem segment_sections=True, a segmentação é feita na primeira consulta.
+        Retorna None para documentos sem texto original (snapshot/compactados).
+        """
+        sections = text_data.get('sections')
+        if sections is None and text_data.get('text') is not None:
+            self.document_counts(text_data)
+            if 'sections' not in text_data:
+                self._segment(text_data)
+            sections = text_data['sections']
+        return sections
+    
+    def _included_counts(self, text_data, exclude_sections):
+        """
+        Contagens do documento sem as seções excluídas (somadas em um único
+        DocumentCounts); sem exclusões, as contagens do documento inteiro
+        """
+        counts = self.document_counts(text_data)
+        if not exclude_sections:
+            return counts
+        sections = self.document_sections(text_data)
+        if sections is None:
+            return counts
+        kept = Counter()
+        for name, section_counts in sections.items():
+            if name not in exclude_sections:
+                for term_id, count in section_counts.items():
+                    kept[term_id] += count
+        return DocumentCounts.from_id_counts(kept)
+    
+    def corpus_counts(self):
+        """
+        Contagem total de cada termo no corpus, somando as contagens de todos os
+        documentos (residentes ou em runs no disco) em um único array denso
+        indexado pelo id do vocabulário
+        
+        Returns:
+            DocumentCounts com os totais do corpus
+        """
+        self.build_index()
+        totals = array('Q', bytes(8 * len(self.vocabulary)))
+        grand_total = 0
+        for text_data in self.texts:
+            counts = text_data['counts']
+            for term_id, count in counts.items():
+                totals[term_id] += count
+            grand_total += counts.total
+        
+        ids = array('I', [term_id for term_id, count in enumerate(totals) if count])
+        counts = array('Q', [totals[term_id] for term_id in ids])
+        return DocumentCounts(ids, counts, grand_total)
+    
+    def document_positions(self, text_data):
+        """
+        Índice posicional (PositionalIndex) de um texto carregado
+        
+        Se o analisador não foi criado com positional_index=True, o índice é
+        montado na primeira consulta e reaproveitado nas seguintes. Retorna None
+        para documentos sem texto original (snapshot ou compactados sem índice).
+        """
+        positions = text_data.get('positions')
+        if positions is None and text_data.get('text') is not None:
+            counts = self.document_counts(text_data)
+            sequence = array('I', map(self.vocabulary.add, TOKEN_PATTERN.findall(text_data['text'])))
+            positions = text_data['positions'] = PositionalIndex.build(sequence, counts)
+        return positions
+    
+    def compact(self):
+        """
+        Indexa todos os textos e descarta o texto original, mantendo apenas as
+        contagens por id (reduz bastante a memória de corpora grandes). Índices
+        posicionais já montados são mantidos, então a concordância continua
+        funcionando.
+        """
+        self.build_index()
+        for text_data in self.texts:
+            text_data['text'] = None
+    
+    def save_snapshot(self, path):
+        """
+        Salva o corpus indexado (vocabulário, contagens, fontes e hashes) em um
+        snapshot binário que pode ser reaberto instantaneamente com load_snapshot
+        """
+        try:
+            self.build_index()
+            write_snapshot(path, self.vocabulary, self.texts)
+            print(f"✓ Snapshot salvo em: {path} ({len(self.texts)} documentos, {len(self.vocabulary):,} termos)")
+            return True
+        except Exception as e:
+            print(f"✗ Erro ao salvar snapshot: {e}")
+            return False
+    
+    def load_snapshot(self, path):
+        """
+        Abre um snapshot salvo por save_snapshot, substituindo os textos atuais
+        
+        As contagens ficam mapeadas em memória (mmap) e servem diretamente a
+        todos os métodos de análise, gráficos e exportação.
+        """
+        try:
+            vocabulary, texts, _ = read_snapshot(path)
+        except Exception as e:
+            print(f"✗ Erro ao abrir snapshot: {e}")
+            return 0
+        
+        self.vocabulary = vocabulary
+        self.texts = texts
+        self.word_frequencies = {}
+        self.running_stats = {}
+        self._key_maps = {}
+        print(f"✓ Snapshot carregado: {len(texts)} documentos")
+        return len(texts)
+    
+    @classmethod
+    def from_snapshot(cls, path, normalizer=None):
+        """Cria um analisador já servindo o corpus de um snapshot"""
+        analyzer = cls(normalizer)
+        analyzer.load_snapshot(path)
+        return analyzer
+    
+    def _key_map(self, case_sensitive):
+        """Agrupa os ids do vocabulário pela chave de consulta (lookup_key)"""
+        cache_key = (case_sensitive, self.normalizer)
+        entry = self._key_maps.get(cache_key)
+        if entry is None:
+            entry = self._key_maps[cache_key] = [{}, 0]
+        
+        mapping, mapped = entry
+        tokens = self.vocabulary.tokens
+        # Só os ids novos desde a última consulta precisam ser mapeados
+        for term_id in range(mapped, len(tokens)):
+            key = self.lookup_key(tokens[term_id], case_sensitive)
+            mapping.setdefault(key, []).append(term_id)
+        entry[1] = len(tokens)
+        return mapping
+    
+    def term_ids(self, word, case_sensitive=False):
+        """Ids do vocabulário cujas formas equivalem à palavra no modo escolhido"""
+        if case_sensitive and self.normalizer is None:
+            term_id = self.vocabulary.get(word)
+            return () if term_id is None else (term_id,)
+        return self._key_map(case_sensitive).get(self.lookup_key(word, case_sensitive), ())
+    
+    def _target_ids(self, target_words, case_sensitive):
+        """Indexa todos os textos e resolve os ids de cada palavra-alvo uma única vez"""
+        self.build_index()
+        return {word: self.term_ids(word, case_sensitive) for word in target_words}
+    
+    def _key_id_stream(self, text, case_sensitive, key_ids, resolved):
+        """Gera o id de chave (lookup_key) de cada token do texto, sem criar listas"""
+        for match in TOKEN_PATTERN.finditer(text):
+            token = match.group()
+            key_id = resolved.get(token)
+            if key_id is None:
+                key = self.lookup_key(token, case_sensitive)
+                key_id = resolved[token] = key_ids.setdefault(key, len(key_ids))
+            yield key_id
+    
+    def _ngram_plan(self, target_words, case_sensitive, ngram_range):
+        """
+        Prepara a contagem das expressões (palavras-alvo com mais de um token)
+        
+        Returns:
+            None se não houver expressões, ou um dicionário com a faixa de
+            ordens, o hash de cada expressão e as tabelas de ids compartilhadas
+        """
+        phrases = {}
+        for word in target_words:
+            parts = TOKEN_PATTERN.findall(word)
+            if len(parts) > 1:
+                phrases[word] = [self.lookup_key(part, case_sensitive) for part in parts]
+        if not phrases:
+            return None
+        
+        if ngram_range is None:
+            ngram_range = (2, max(len(parts) for parts in phrases.values()))
+        
+        key_ids = {}
+        hashes = {}
+        for word, keys in phrases.items():
+            if ngram_range[0] <= len(keys) <= ngram_range[1]:
+                hashes[word] = ngram_hash([key_ids.setdefault(key, len(key_ids)) for key in keys])
+            else:
+                print(f"⚠️  '{word}' tem {len(keys)} palavras, fora de ngram_range={ngram_range}")
+        
+        # Ids do vocabulário de cada parte: o pré-filtro de _phrase_frequencies
+        key_map = self._key_map(case_sensitive)
+        part_ids = {word: [key_map.get(key, ()) for key in phrases[word]] for word in hashes}
+        
+        return {
+            'range': ngram_range,
+            'hashes': hashes,
+            'wanted': set(hashes.values()),
+            'key_ids': key_ids,
+            'resolved': {},
+            'part_ids': part_ids,
+        }
+    
+    def _phrase_frequencies(self, text_data, plan, case_sensitive, min_count=1, exclude_sections=None):
+        """
+        Frequência de cada expressão do plano em um documento (uma passada)
+        
+        Documentos já indexados em que nenhuma expressão tem todas as partes
+        presentes (contagens ou filtro de presença) não são tokenizados.
+        """
+        if plan is None:
+            return {}
+        text = text_data['text']
+        if text is None or not self._may_contain_phrase(text_data, plan):
+            return {word: 0 for word in plan['hashes']}
+        if exclude_sections:
+            text = section_text(text, exclude_sections)
+        
+        stream = self._key_id_stream(text, case_sensitive, plan['key_ids'], plan['resolved'])
+        counts = count_ngrams(stream, plan['range'], wanted=plan['wanted'], min_count=min_count)
+        return {word: counts.get(value, 0) for word, value in plan['hashes'].items()}
+    
+    def _may_contain_phrase(self, text_data, plan):
+        """False se nenhuma expressão do plano pode ocorrer no documento"""
+        counts = text_data.get('counts')
+        if counts is None:
+            return True
+        return any(all(counts.frequency(ids) for ids in parts) for parts in plan['part_ids'].values())
+    
+    def _warn_phrases_without_text(self, plan):
+        """Avisa quando expressões não podem ser contadas em documentos sem texto original"""
+        if plan is None:
+            return
+        missing = sum(1 for text_data in self.texts if text_data['text'] is None)
+        if missing:
+            print(f"⚠️  Expressões contam 0 em {missing} documento(s) sem texto original (snapshot/entrada contada)")
+    
+    def _word_frequency(self, target_word, counts, target_ids, phrase_counts):
+        """Frequência de uma palavra-alvo: expressão (n-grama) ou palavra simples"""
+        if target_word in phrase_counts:
+            return phrase_counts[target_word]
+        return counts.frequency(target_ids[target_word])
+    
+    def top_ngrams(self, n=2, top=20, case_sensitive=False, min_count=2, max_entries=None):
+        """
+        Lista os n-gramas mais frequentes do corpus (ex.: "machine learning")
+        
+        Args:
+            n: ordem do n-grama (2 = bigramas, 3 = trigramas...)
+            top: quantos n-gramas retornar
+            min_count: frequência mínima no corpus
+            max_entries: limite de n-gramas distintos por documento (poda os raros)
+        """
+        key_ids = {}
+        resolved = {}
+        labels = {}
+        totals = Counter()
+        
+        for text_data in self.texts:
+            if text_data['text'] is None:
+                continue
+            stream = self._key_id_stream(text_data['text'], case_sensitive, key_ids, resolved)
+            totals.update(count_ngrams(stream, (n, n), max_entries=max_entries, labels=labels))
+        
+        keys = [None] * len(key_ids)
+        for key, key_id in key_ids.items():
+            keys[key_id] = key
+        
+        import pandas as pd
+        rows = [
+            {'ngrama': ' '.join(keys[key_id] for key_id in labels[value]), 'frequencia': count}
+            for value, count in totals.most_common(top) if count >= min_count
+        ]
+        return pd.DataFrame(rows, columns=['ngrama', 'frequencia'])
+    
+    def analyze_frequency(self, target_words, case_sensitive=False, ngram_range=None, min_ngram_count=1,
+                          exclude_sections=None):
+        """
+        Analisa a frequência das palavras especificadas
+        
+        Args:
+            target_words: lista de palavras para analisar; expressões como
+                "big data" são contadas como n-gramas
+            case_sensitive: se True, considera maiúsculas/minúsculas
+            ngram_range: (n_min, n_max) das ordens de n-grama contadas; se None,
+                é deduzida das expressões em target_words
+            min_ngram_count: n-gramas abaixo desta frequência em um documento
+                são descartados (contam como 0)
+            exclude_sections: seções ignoradas na contagem, ex.: ['referencias']
+        """
+        if not self.texts:
+            print("✗ Erro: Nenhum texto foi adicionado para análise!")
+            return {}
+        
+        target_words = [word for word in target_words if word.strip()]
+        if not target_words:
+            print("✗ Erro: Nenhuma palavra especificada para análise!")
+            return {}
+        
+        if not case_sensitive:
+            target_words = [word.lower() for word in target_words]
+        
+        self.word_frequencies = {word: [] for word in target_words}
+        self.running_stats = {word: RunningStats() for word in target_words}
+        
+        try:
+            target_ids = self._target_ids(target_words, case_sensitive)
+            plan = self._ngram_plan(target_words, case_sensitive, ngram_range)
+            self._warn_phrases_without_text(plan)
+            
+            for text_data in self.texts:
+                source = text_data['source']
+                counts = self._included_counts(text_data, exclude_sections)
+                phrase_counts = self._phrase_frequencies(text_data, plan, case_sensitive, min_ngram_count,
+                                                         exclude_sections)
+                
+                # Conta a frequência de cada palavra alvo
+                for target_word in target_words:
+                    frequency = self._word_frequency(target_word, counts, target_ids, phrase_counts)
+                    self.word_frequencies[target_word].append({
+                        'source': source,
+                        'frequency': frequency
+                    })
+                    self.running_stats[target_word].add(frequency)
+        except Exception as e:
+            print(f"✗ Erro na análise de frequência: {e}")
+            self.word_frequencies = {}
+            self.running_stats = {}
+            return {}
+        
+        return self.word_frequencies
+    
+    def estimate_frequency(self, source, target_words, case_sensitive=False, sample_size=30, chunk_mb=1,
+                           confidence=0.95, precision=None, time_budget=None, encoding='utf-8', seed=None):
+        """
+        Prévia rápida da análise de frequência: lê só uma amostra aleatória
+        dos documentos (ou trechos de arquivos grandes) de `source`, sem
+        carregá-los, e extrapola os totais do corpus com intervalos de
+        confiança, refinando até `precision` ou `time_budget` se informados
+        (ver amostragem.estimate_frequency)
+        """
+        return amostragem.estimate_frequency(self, source, target_words, case_sensitive, sample_size, chunk_mb,
+                                             confidence, precision, time_budget, encoding, seed)
+    
+    def analyze_individual_files(self, target_words, case_sensitive=False, both_forms=False,
+                                 ngram_range=None, min_ngram_count=1, exclude_sections=None):
+        """
+        Analisa cada arquivo individualmente e retorna resultados detalhados
+        
+        Args:
+            target_words: lista de palavras (ou expressões) para analisar
+            case_sensitive: se True, considera maiúsculas/minúsculas
+            both_forms: se True (e case_sensitive=False), inclui em
+                'palavras_exatas' a contagem da palavra exatamente como digitada,
+                obtida na mesma passada da contagem sem distinção de maiúsculas
+            ngram_range, min_ngram_count, exclude_sections: como em analyze_frequency
+        """
+        original_words = list(target_words)
+        if not case_sensitive:
+            target_words = [word.lower() for word in target_words]
+        both_forms = both_forms and not case_sensitive
+        
+        individual_results = {}
+        target_ids = self._target_ids(target_words, case_sensitive)
+        plan = self._ngram_plan(target_words, case_sensitive, ngram_range)
+        self._warn_phrases_without_text(plan)
+        if both_forms:
+            # Forma exata, sem normalização: -1 nunca corresponde a um id real
+            exact_ids = {word: self.vocabulary.get(word, -1) for word in original_words}
+        
+        for text_data in self.texts:
+            source = text_data['source']
+            counts = self._included_counts(text_data, exclude_sections)
+            total_words = counts.total
+            phrase_counts = self._phrase_frequencies(text_data, plan, case_sensitive, min_ngram_count,
+                                                     exclude_sections)
+            
+            # Resultados para este arquivo
+            file_results = {
+                'total_palavras': total_words,
+                'palavras_encontradas': {},
+                'percentuais': {}
+            }
+            
+            for target_word in target_words:
+                frequency = self._word_frequency(target_word, counts, target_ids, phrase_counts)
+                percentage = (frequency / total_words * 100) if total_words > 0 else 0
+                
+                file_results['palavras_encontradas'][target_word] = frequency
+                file_results['percentuais'][target_word] = round(percentage, 2)
+            
+            if both_forms:
+                file_results['palavras_exatas'] = {
+                    word: counts.get(exact_ids[word]) for word in original_words
+                }
+            
+            individual_results[source] = file_results
+        
+        return individual_results
+    
+    def analyze_profiles(self, profiles, case_sensitive=False, both_forms=False,
+                         ngram_range=None, min_ngram_count=1, exclude_sections=None):
+        """
+        Analisa vários perfis de palavras-alvo em uma única passada pelo corpus
+        
+        A união das palavras de todos os perfis é contada uma vez (com
+        analyze_individual_files, inclusive as expressões) e os resultados são
+        separados por perfil, então N perfis custam quase o mesmo que um.
+        
+        Args:
+            profiles: {nome do perfil: lista de palavras}, ex.:
+                {'seguranca': ['security', 'attack'], 'privacidade': ['privacy']}
+            demais: como em analyze_individual_files
+        
+        Returns:
+            {perfil: {fonte: resultados no formato de analyze_individual_files}}
+        """
+        profiles = {name: [word for word in words if word.strip()] for name, words in profiles.items()}
+        union = list(dict.fromkeys(word for words in profiles.values() for word in words))
+        if not self.texts or not union:
+            print("✗ Erro: É preciso ter textos carregados e ao menos um perfil com palavras!")
+            return {}
+        
+        shared = self.analyze_individual_files(union, case_sensitive, both_forms, ngram_range,
+                                               min_ngram_count, exclude_sections)
+        
+        self.profile_results = {}
+        for name, words in profiles.items():
+            keys = words if case_sensitive else [word.lower() for word in words]
+            profile = self.profile_results[name] = {}
+            for source, data in shared.items():
+                file_results = {
+                    'total_palavras': data['total_palavras'],
+                    'palavras_encontradas': {key: data['palavras_encontradas'][key] for key in keys},
+                    'percentuais': {key: data['percentuais'][key] for key in keys},
+                }
+                if 'palavras_exatas' in data:
+                    file_results['palavras_exatas'] = {word: data['palavras_exatas'][word] for word in words}
+                profile[source] = file_results
+        
+        return self.profile_results
+    
+    def analyze_sections(self, target_words, case_sensitive=False):
+        """
+        Frequência das palavras-alvo em cada seção (resumo, corpo, referências)
+        de cada arquivo, a partir das contagens por seção já calculadas
+        (expressões com mais de uma palavra são contadas como n-gramas no
+        texto de cada seção)
+        
+        Returns:
+            {fonte: {seção: {'total_palavras', 'sentencas', 'paragrafos',
+            'palavras_encontradas'}}}; documentos sem texto original (snapshot)
+            ficam de fora
+        """
+        if not case_sensitive:
+            target_words = [word.lower() for word in target_words]
+        target_ids = self._target_ids(target_words, case_sensitive)
+        plan = self._ngram_plan(target_words, case_sensitive, None)
+        
+        results = {}
+        skipped = 0
+        for text_data in self.texts:
+            sections = self.document_sections(text_data)
+            if sections is None:
+                skipped += 1
+                continue
+            stats = text_data['section_stats']
+            file_results = results[text_data['source']] = {}
+            for name, counts in sections.items():
+                others = [other for other in sections if other != name]
+                phrase_counts = self._phrase_frequencies(text_data, plan, case_sensitive, exclude_sections=others)
+                file_results[name] = {
+                    'total_palavras': counts.total,
+                    'sentencas': stats[name]['sentencas'],
+                    'paragrafos': stats[name]['paragrafos'],
+                    'palavras_encontradas': {
+                        word: self._word_frequency(word, counts, target_ids, phrase_counts)
+                        for word in target_words
+                    },
+                }
+        
+        if skipped:
+            print(f"⚠️  {skipped} documento(s) sem texto original (snapshot/compactado) ignorado(s) na análise por seção")
+        
+        return results
+    
+    def analyze_cooccurrence(self, target_words, window=10, case_sensitive=False):
+        """
+        Conta co-ocorrências entre as palavras-alvo em uma passada por documento
+        
+        Dois termos co-ocorrem na janela quando estão a no máximo `window` tokens
+        de distância, e na sentença quando aparecem na mesma sentença (cada
+        sentença conta uma vez por par).
+        
+        Args:
+            target_words: lista de palavras para analisar
+            window: tamanho da janela deslizante, em tokens
+            case_sensitive: se True, considera maiúsculas/minúsculas
+        
+        Returns:
+            dicionário com as matrizes 'janela' e 'sentenca' do corpus e
+            'por_arquivo' com as mesmas matrizes para cada fonte
+        """
+        if not case_sensitive:
+            target_words = [word.lower() for word in target_words]
+        target_index = {}
+        for index, word in enumerate(target_words):
+            target_index.setdefault(self.lookup_key(word, case_sensitive), index)
+        # Pré-filtro: documentos sem nenhuma palavra-alvo não são tokenizados
+        target_ids = [ids for ids in self._target_ids(target_words, case_sensitive).values() if ids]
+        
+        results = {
+            'janela': CooccurrenceMatrix(target_words),
+            'sentenca': CooccurrenceMatrix(target_words),
+            'por_arquivo': {}
+        }
+        # Token -> índice da palavra-alvo (ou None); cada token distinto é resolvido uma vez
+        resolved = {}
+        skipped = 0
+        
+        for text_data in self.texts:
+            text = text_data['text']
+            if text is None:
+                skipped += 1
+                continue
+            
+            window_matrix = CooccurrenceMatrix(target_words)
+            sentence_matrix = CooccurrenceMatrix(target_words)
+            results['por_arquivo'][text_data['source']] = {
+                'janela': window_matrix,
+                'sentenca': sentence_matrix
+            }
+            counts = self.document_counts(text_data)
+            if not any(counts.frequency(ids) for ids in target_ids):
+                continue
+            
+            recent_hits = deque()
+            sentence_hits = set()
+            position = 0
+            
+            for match in SENTENCE_TOKEN_PATTERN.finditer(text):
+                token = match.group(1)
+                if token is None:
+                    # Fim de sentença: cada par presente conta uma vez
+                    self._add_sentence_pairs(sentence_matrix, sentence_hits)
+                    sentence_hits = set()
+                    continue
+                
+                position += 1
+                if token in resolved:
+                    index = resolved[token]
+                else:
+                    index = resolved[token] = target_index.get(self.lookup_key(token, case_sensitive))
+                if index is None:
+                    continue
+                
+                while recent_hits and position - recent_hits[0][0] > window:
+                    recent_hits.popleft()
+                for _, previous in recent_hits:
+                    window_matrix.add(previous, index)
+                recent_hits.append((position, index))
+                sentence_hits.add(index)
+            
+            self._add_sentence_pairs(sentence_matrix, sentence_hits)
+            
+            results['janela'].update(window_matrix)
+            results['sentenca'].update(sentence_matrix)
+        
+        if skipped:
+            print(f"⚠️  {skipped} documento(s) sem texto original (snapshot/compactado) ignorado(s) na co-ocorrência")
+        
+        return results
+    
+    @staticmethod
+    def _add_sentence_pairs(matrix, hits):
+        hits = sorted(hits)
+        for a in range(len(hits)):
+            for b in range(a + 1, len(hits)):
+                matrix.add(hits[a], hits[b])
+    
+    def similarity_index(self, case_sensitive=False, min_df=1, max_df=DEFAULT_MAX_DF, lsh_tables=0, lsh_bits=8):
+        """
+        Índice de similaridade TF-IDF/cosseno do corpus (ver SimilarityIndex)
+        
+        É montado a partir das contagens já indexadas e reaproveitado enquanto
+        os documentos e os parâmetros não mudarem.
+        
+        Args:
+            min_df, max_df: termos em menos de min_df documentos ou em mais de
+                max_df (fração; padrão 0.9) dos documentos ficam de fora dos vetores
+            lsh_tables, lsh_bits: tabelas e bits do índice LSH (0 = só busca exata)
+        """
+        self.build_index()
+        key = (case_sensitive, min_df, max_df, lsh_tables, lsh_bits, len(self.vocabulary),
+               tuple(text_data.get('sha1') or id(text_data) for text_data in self.texts))
+        if self._similarity is None or self._similarity[0] != key:
+            index = SimilarityIndex.from_analyzer(self, case_sensitive, min_df, max_df,
+                                                  lsh_tables=lsh_tables, lsh_bits=lsh_bits)
+            self._similarity = (key, index)
+        return self._similarity[1]
+    
+    def most_similar(self, source, k=10, case_sensitive=False, approximate=False, **options):
+        """
+        Documentos mais parecidos com um documento carregado
+        
+        Args:
+            source: nome do documento (como nos relatórios)
+            approximate: se True, busca só nos buckets LSH (monta o índice com
+                16 tabelas se options não definir lsh_tables)
+            options: parâmetros de similarity_index
+        
+        Returns:
+            lista de (fonte, similaridade de cosseno), da maior para a menor
+        """
+        if approximate:
+            options.setdefault('lsh_tables', 16)
+        index = self.similarity_index(case_sensitive, **options)
+        if index.position(source) is None:
+            print(f"✗ Documento não encontrado: {source}")
+            return []
+        return index.most_similar(source, k, approximate)
+    
+    def similar_to_text(self, text, k=10, case_sensitive=False, approximate=False, **options):
+        """Documentos do corpus mais parecidos com um texto avulso (ver most_similar)"""
+        if approximate:
+            options.setdefault('lsh_tables', 16)
+        index = self.similarity_index(case_sensitive, **options)
+        key_counts = Counter(self.lookup_key(token, case_sensitive) for token in TOKEN_PATTERN.findall(text))
+        return index.search(index.text_vector(key_counts), k, approximate)
+    
+    def concordance(self, target_word, width=5, case_sensitive=False, page=1, page_size=20):
+        """
+        Concordância KWIC (palavra-chave em contexto) de uma palavra no corpus
+        
+        Usa o índice posicional: o total de ocorrências vem das contagens e só as
+        linhas da página pedida são montadas, então termos muito frequentes não
+        exigem varrer nem materializar todas as ocorrências.
+        
+        Args:
+            target_word: palavra a procurar
+            width: quantidade de tokens de contexto de cada lado
+            case_sensitive: se True, considera maiúsculas/minúsculas
+            page: página desejada (começando em 1)
+            page_size: linhas por página
+        
+        Returns:
+            dicionário com 'total', 'pagina', 'paginas' e 'linhas' (cada linha com
+            fonte, posição, contexto à esquerda, palavra e contexto à direita)
+        
+        Raises:
+            ValueError: se page_size < 1 ou width < 0
+        """
+        if page_size < 1:
+            raise ValueError(f"Linhas por página devem ser pelo menos 1 (recebido: {page_size})")
+        if width < 0:
+            raise ValueError(f"Largura do contexto não pode ser negativa (recebido: {width})")
+        self.build_index()
+        term_ids = self.term_ids(target_word, case_sensitive)
+        
+        total = sum(self.document_counts(text_data).frequency(term_ids) for text_data in self.texts)
+        pages = max(1, -(-total // page_size))
+        page = min(max(1, page), pages)
+        first = (page - 1) * page_size
+        
+        lines = []
+        seen = 0
+        tokens = self.vocabulary.tokens
+        for text_data in self.texts:
+            if len(lines) >= page_size:
+                break
+            counts = self.document_counts(text_data)
+            frequency = counts.frequency(term_ids)
+            if seen + frequency <= first:
+                # Página ainda não chegou neste documento: pula sem tocar nas posições
+                seen += frequency
+                continue
+            
+            index = self.document_positions(text_data)
+            if index is None:
+                seen += frequency
+                continue
+            
+            slots = [slot for slot in map(counts.slot, term_ids) if slot >= 0]
+            sequence = index.sequence
+            for position in merge(*(index.term_positions(slot) for slot in slots)):
+                seen += 1
+                if seen <= first:
+                    continue
+                lines.append({
+                    'fonte': text_data['source'],
+                    'posicao': position,
+                    'esquerda': ' '.join(tokens[t] for t in sequence[max(0, position - width):position]),
+                    'palavra': tokens[sequence[position]],
+                    'direita': ' '.join(tokens[t] for t in sequence[position + 1:position + 1 + width]),
+                })
+                if len(lines) >= page_size:
+                    break
+        
+        return {'total': total, 'pagina': page, 'paginas': pages, 'linhas': lines}
+    
+    def clear_data(self):
+        """Limpa todos os dados carregados (textos, índice, runs em disco e figuras abertas)"""
+        self.texts = []
+        self.word_frequencies = {}
+        self.running_stats = {}
+        self.profile_results = {}
+        self._similarity = None
+        self.vocabulary = Vocabulary()
+        self._key_maps = {}
+        self._resident_bytes = 0
+        if self._spill_store is not None:
+            self._spill_store.cleanup()
+            self._spill_store = None
+        # Só fecha figuras se a camada de gráficos já carregou o matplotlib
+        pyplot = sys.modules.get('matplotlib.pyplot')
+        if pyplot is not None:
+            pyplot.close('all')
+        gc.collect()
+        print("✓ Dados limpos com sucesso!")
+    
+    # Camadas de apresentação (relatórios, gráficos e menus) ficam em módulos
+    # próprios, importados só quando usados: o núcleo não depende de
+    # pandas/matplotlib/seaborn.
+    
+    def print_concordance(self, target_word, width=5, case_sensitive=False, page=1, page_size=20):
+        """Exibe uma página da concordância KWIC alinhada pela palavra-chave"""
+        from . import relatorios
+        return relatorios.print_concordance(self, target_word, width, case_sensitive, page, page_size)
+    
+    def show_text_info(self):
+        """Mostra informações sobre os textos carregados"""
+        from . import relatorios
+        return relatorios.show_text_info(self)
+    
+    def create_frequency_dataframe(self):
+        """Cria um DataFrame com os resultados da análise"""
+        from . import relatorios
+        return relatorios.create_frequency_dataframe(self)
+    
+    def create_detailed_report(self, target_words, case_sensitive=False, individual_results=None):
+        """Cria relatório detalhado da análise individual"""
+        from . import relatorios
+        return relatorios.create_detailed_report(self, target_words, case_sensitive, individual_results)
+    
+    def export_results_to_csv(self, target_words, filename="resultados_mineracao.csv", case_sensitive=False,
+                              individual_results=None):
+        """Exporta resultados para CSV"""
+        from . import relatorios
+        return relatorios.export_results_to_csv(self, target_words, filename, case_sensitive, individual_results)
+    
+    def export_results(self, target_words, filename, case_sensitive=False, individual_results=None):
+        """Exporta resultados para CSV ou Parquet, conforme a extensão do arquivo"""
+        from . import relatorios
+        return relatorios.export_results(self, target_words, filename, case_sensitive, individual_results)
+    
+    def results_dataframe(self, target_words, case_sensitive=False, individual_results=None):
+        """Tabela exportada: uma linha por arquivo com frequência e percentual de cada palavra"""
+        from . import relatorios
+        return relatorios.results_dataframe(self, target_words, case_sensitive, individual_results)
+    
+    def report_profiles(self, profiles, case_sensitive=False, export_pattern=None, plot=False):
+        """Relatório, exportação e gráfico de cada perfil a partir de uma única contagem"""
+        from . import relatorios
+        return relatorios.report_profiles(self, profiles, case_sensitive, export_pattern, plot)
+    
+    def sections_dataframe(self, target_words, case_sensitive=False):
+        """Tabela por arquivo e seção (resumo, corpo, referências) com a frequência de cada palavra"""
+        from . import relatorios
+        return relatorios.sections_dataframe(self, target_words, case_sensitive)
+    
+    def get_summary_stats(self, quantiles=False):
+        """Retorna estatísticas resumidas da análise (ver relatorios.get_summary_stats)"""
+        from . import relatorios
+        return relatorios.get_summary_stats(self, quantiles)
+    
+    def plot_frequency_bar(self, figsize=(12, 6), title="Frequência de Palavras", horizontal=True):
+        """Cria gráfico de barras da frequência das palavras com valores exibidos"""
+        from . import graficos
+        return graficos.plot_frequency_bar(self, figsize, title, horizontal)
+    
+    def plot_individual_comparison(self, target_words, case_sensitive=False, figsize=(15, 8), with_heatmap=False,
+                                   individual_results=None, title='Frequência de Palavras por Arquivo', scalable=None):
+        """Cria gráfico comparando palavras entre diferentes arquivos"""
+        from . import graficos
+        return graficos.plot_individual_comparison(self, target_words, case_sensitive, figsize, with_heatmap,
+                                                   individual_results, title, scalable)
+    
+    def plot_frequency_heatmap(self, figsize=(10, 6), scalable=None):
+        """Cria um heatmap da frequência das palavras (útil para múltiplos textos)"""
+        from . import graficos
+        return graficos.plot_frequency_heatmap(self, figsize, scalable)
+    
+    def plot_cooccurrence_heatmap(self, target_words, window=10, mode='janela', case_sensitive=False, figsize=(10, 8)):
+        """Cria um heatmap de co-ocorrência entre as palavras-alvo"""
+        from . import graficos
+        return graficos.plot_cooccurrence_heatmap(self, target_words, window, mode, case_sensitive, figsize)
+    
+    def interactive_text_input(self):
+        """Método interativo para colar texto"""
+        from . import cli
+        return cli.interactive_text_input(self)
+    
+    def interactive_menu(self):
+        """Menu interativo para escolher o tipo de análise"""
+        from . import cli
+        return cli.interactive_menu(self)
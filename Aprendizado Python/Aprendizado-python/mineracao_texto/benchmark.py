@@ -0,0 +1,79 @@
+"""
+Benchmark do núcleo contra a implementação original dos scripts
+
+Uso: python -m mineracao_texto.benchmark [documentos] [palavras_por_documento]
+
+Gera um corpus sintético, confere que o núcleo produz exatamente as mesmas
+frequências da contagem original (preprocess_text + split + Counter) e mostra
+os tempos de cada um.
+"""
+import re
+import sys
+import time
+import random
+from collections import Counter
+
+from .analisador import TextFrequencyAnalyzer
+
+WORDS = ["architecture", "security", "privacy", "data", "model", "learning", "system",
+         "network", "Security", "Data", "análise", "ciência", "dados", "rede", "modelo"]
+PUNCTUATION = ["", "", "", ",", ".", "!", "?", ";"]
+
+
+def synthetic_corpus(n_docs=200, words_per_doc=5000, seed=42):
+    """Lista de textos aleatórios com vocabulário misto (maiúsculas, acentos, pontuação)"""
+    rng = random.Random(seed)
+    vocabulary = WORDS + [f"termo{i}" for i in range(2000)]
+    return [
+        ' '.join(rng.choice(vocabulary) + rng.choice(PUNCTUATION) for _ in range(words_per_doc))
+        for _ in range(n_docs)
+    ]
+
+
+def legacy_frequencies(texts, target_words):
+    """Contagem como nos scripts originais: texto pré-processado, split e Counter"""
+    target_words = [word.lower() for word in target_words]
+    frequencies = {word: [] for word in target_words}
+    for text in texts:
+        processed = re.sub(r'[^\w\s]', ' ', text).lower()
+        processed = re.sub(r'\s+', ' ', processed).strip()
+        word_count = Counter(processed.split())
+        for word in target_words:
+            frequencies[word].append(word_count.get(word, 0))
+    return frequencies
+
+
+def run(n_docs=200, words_per_doc=5000):
+    """Executa o benchmark e retorna (tempo original, tempo do núcleo) em segundos"""
+    texts = synthetic_corpus(n_docs, words_per_doc)
+    target_words = ["architecture", "security", "privacy", "dados", "Ciência", "inexistente"]
+    print(f"📚 Corpus sintético: {n_docs} documentos x {words_per_doc:,} palavras")
+
+    start = time.perf_counter()
+    expected = legacy_frequencies(texts, target_words)
+    legacy_time = time.perf_counter() - start
+
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    for i, text in enumerate(texts):
+        analyzer.add_text(text, f"doc{i}")
+    start = time.perf_counter()
+    frequencies = analyzer.analyze_frequency(target_words)
+    core_time = time.perf_counter() - start
+
+    obtained = {word: [item['frequency'] for item in items] for word, items in frequencies.items()}
+    assert obtained == expected, "Resultados do núcleo diferem da implementação original"
+
+    # Segunda consulta: o corpus já está indexado
+    start = time.perf_counter()
+    analyzer.analyze_frequency(["model", "network"])
+    warm_time = time.perf_counter() - start
+
+    print("✓ Frequências idênticas à implementação original")
+    print(f"   Original (preprocess + split + Counter): {legacy_time:.3f}s")
+    print(f"   Núcleo (primeira análise, com indexação): {core_time:.3f}s ({legacy_time / core_time:.1f}x)")
+    print(f"   Núcleo (consulta com índice pronto):      {warm_time:.4f}s")
+    return legacy_time, core_time
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
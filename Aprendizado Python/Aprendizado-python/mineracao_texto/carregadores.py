@@ -0,0 +1,369 @@
+"""Leitura de arquivos: classificação pelos primeiros bytes e registro de leitores"""
+import io
+import re
+import glob
+import bz2
+import gzip
+import html
+import lzma
+import hashlib
+import tarfile
+import zipfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .tokenizacao import TOKEN_PATTERN
+
+
+def read_plain_text(path, encoding='utf-8'):
+    """Lê um arquivo de texto simples, ignorando bytes inválidos na codificação"""
+    with open(path, 'r', encoding=encoding, errors='ignore') as file:
+        return file.read()
+
+
+def read_chunk(path, start, end, encoding='utf-8'):
+    """
+    Lê as linhas de um arquivo de texto simples que começam no intervalo de
+    bytes [start, end)
+
+    Intervalos consecutivos cobrem o arquivo sem repetir nem cortar linhas: a
+    linha que atravessa `start` fica com o intervalo anterior e a que
+    atravessa `end` é lida até o fim.
+    """
+    with open(path, 'rb') as file:
+        if start:
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        if position >= end:
+            return ''
+        data = file.read(end - position)
+        if data and not data.endswith(b'\n'):
+            data += file.readline()
+    return data.decode(encoding, errors='ignore')
+
+
+def read_utf16(path, encoding='utf-8'):
+    """Lê um arquivo de texto UTF-16 (com BOM); a codificação pedida é ignorada"""
+    with open(path, 'r', encoding='utf-16', errors='ignore') as file:
+        return file.read()
+
+
+_DOCX_PARAGRAPH = re.compile(r'</w:p>|<w:br/>|<w:tab/>')
+_XML_TAG = re.compile(r'<[^>]+>')
+
+
+def read_docx(path, encoding='utf-8'):
+    """Extrai o texto de um .docx (XML dentro de um zip), só com a biblioteca padrão"""
+    with zipfile.ZipFile(path) as archive:
+        xml = archive.read('word/document.xml').decode('utf-8', errors='ignore')
+    return html.unescape(_XML_TAG.sub('', _DOCX_PARAGRAPH.sub('\n', xml)))
+
+
+# Chave -> função(caminho, encoding) que devolve o texto. A chave é uma extensão
+# ('.docx', minúscula e com ponto), que tem prioridade, ou um tipo detectado por
+# sniff_bytes ('pdf', 'utf16'...). Arquivos de tipo 'texto' sem leitor
+# registrado são lidos como texto simples; os demais tipos são ignorados.
+LOADERS = {
+    '.docx': read_docx,
+    'utf16': read_utf16,
+}
+
+# Quantidade de bytes inspecionados para classificar um arquivo
+SNIFF_BYTES = 4096
+
+# Assinaturas (magic numbers) de formatos binários comuns
+MAGIC_NUMBERS = [
+    (b'%PDF', 'pdf'),
+    (b'PK\x03\x04', 'zip'), (b'PK\x05\x06', 'zip'),
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bzip2'), (b'\xfd7zXZ\x00', 'xz'),
+    (b'Rar!\x1a\x07', 'rar'), (b"7z\xbc\xaf\x27\x1c", '7z'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'office'),
+    (b'\x89PNG\r\n\x1a\n', 'imagem'), (b'\xff\xd8\xff', 'imagem'),
+    (b'GIF87a', 'imagem'), (b'GIF89a', 'imagem'),
+    (b'ID3', 'audio'), (b'OggS', 'audio'), (b'fLaC', 'audio'), (b'RIFF', 'midia'),
+    (b'\x7fELF', 'executavel'), (b'MZ', 'executavel'),
+    (b'\xca\xfe\xba\xbe', 'executavel'), (b'\xcf\xfa\xed\xfe', 'executavel'),
+    (b'SQLite format 3\x00', 'banco_de_dados'),
+]
+
+# Assinaturas curtas e imprimíveis, que um texto comum pode ter no início
+# ("MZ...", "ID3 ..."): só valem se o início também parecer binário
+WEAK_MAGIC_NUMBERS = frozenset([b'MZ', b'BZh', b'ID3', b'OggS', b'RIFF', b'fLaC'])
+
+# Bytes esperados em texto: imprimíveis, UTF-8 (>= 0x80) e \a \b \t \n \f \r ESC
+_TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f}))
+# Acima desta fração de caracteres de controle, o arquivo é considerado binário
+CONTROL_RATIO = 0.1
+
+
+def sniff_bytes(head):
+    """
+    Classifica o início de um arquivo
+
+    Returns:
+        'texto', 'utf16', 'vazio', um tipo de MAGIC_NUMBERS ou 'binario'
+        (bytes NUL ou excesso de caracteres de controle)
+    """
+    if not head:
+        return 'vazio'
+    if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf16'
+    binary = b'\x00' in head or len(head.translate(None, _TEXT_BYTES)) > len(head) * CONTROL_RATIO
+    for magic, kind in MAGIC_NUMBERS:
+        if head.startswith(magic) and (binary or magic not in WEAK_MAGIC_NUMBERS):
+            return kind
+    return 'binario' if binary else 'texto'
+
+
+def sniff_file(path, size=SNIFF_BYTES):
+    """Classifica um arquivo lendo apenas os primeiros `size` bytes"""
+    with open(path, 'rb') as file:
+        return sniff_bytes(file.read(size))
+
+
+def register_loader(keys, loader):
+    """
+    Registra um leitor para extensões ou tipos detectados (ex.: extrator de PDF)
+
+    Args:
+        keys: extensão ('.pdf'), tipo detectado ('pdf') ou lista deles
+        loader: função(caminho, encoding) que devolve o texto extraído
+    """
+    if isinstance(keys, str):
+        keys = [keys]
+    for key in keys:
+        LOADERS[key.lower()] = loader
+
+
+def loader_for(path, kind='texto'):
+    """
+    Leitor de um arquivo: o da extensão, senão o do tipo detectado, senão
+    texto simples para o tipo 'texto'; None se o arquivo deve ser ignorado
+    """
+    loader = LOADERS.get(Path(path).suffix.lower()) or LOADERS.get(kind)
+    if loader is None and kind == 'texto':
+        return read_plain_text
+    return loader
+
+
+def read_text(path, encoding='utf-8'):
+    """Lê o texto de um arquivo com o leitor da sua extensão (sem classificar os bytes)"""
+    return loader_for(path)(path, encoding)
+
+
+def extract_text(path, encoding='utf-8'):
+    """
+    Classifica o arquivo pelos primeiros bytes e extrai o texto com o leitor
+    adequado, sem ler por inteiro arquivos que serão ignorados
+
+    Returns:
+        (tipo, texto); texto é None se não há leitor para o tipo detectado
+    """
+    kind = sniff_file(path)
+    loader = loader_for(path, kind)
+    if loader is None:
+        return kind, None
+    return kind, loader(path, encoding)
+
+
+class LineCounter:
+    """
+    Conta um texto recebido linha a linha (stdin, texto colado) sem guardá-lo
+
+    Tokens, caracteres, linhas e o hash SHA-1 saem da mesma passada; a memória
+    é proporcional ao vocabulário, não ao tamanho do texto. Com um segmentador
+    (secoes.SectionSegmenter), as contagens são feitas por seção.
+    """
+
+    def __init__(self, segmenter=None):
+        self.segmenter = segmenter
+        self.raw_counts = Counter()
+        self.characters = 0
+        self.lines = 0
+        self._words = 0
+        self._sha1 = hashlib.sha1()
+
+    def feed(self, line):
+        """Conta uma linha (com ou sem a quebra de linha final)"""
+        self.characters += len(line)
+        self.lines += 1
+        self._sha1.update(line.encode('utf-8', 'surrogatepass'))
+        if self.segmenter is not None:
+            self.segmenter.feed(line)
+        else:
+            tokens = TOKEN_PATTERN.findall(line)
+            self.raw_counts.update(tokens)
+            self._words += len(tokens)
+
+    @property
+    def words(self):
+        """Total de tokens contados até agora"""
+        if self.segmenter is not None:
+            return sum(stats['tokens'] for stats in self.segmenter.stats.values())
+        return self._words
+
+    @property
+    def sha1(self):
+        return self._sha1.hexdigest()
+
+
+# Arquivos compactados lidos diretamente, sem extrair para o disco
+_SINGLE_FILE_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+_TAR_SUFFIXES = ('.tar', '.tgz', '.tbz2', '.txz')
+
+
+def archive_format(path):
+    """'zip', 'tar', 'comprimido' (um único arquivo .gz/.bz2/.xz) ou None"""
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes[-2:]]
+    if not suffixes:
+        return None
+    if suffixes[-1] == '.zip':
+        return 'zip'
+    if suffixes[-1] in _TAR_SUFFIXES or (len(suffixes) == 2 and suffixes[0] == '.tar'):
+        return 'tar'
+    if suffixes[-1] in _SINGLE_FILE_OPENERS:
+        return 'comprimido'
+    return None
+
+
+def folder_files(folder, file_extensions=None):
+    """
+    Arquivos de uma pasta (sem subpastas) que load_folder carrega
+
+    Para cada extensão, os caminhos que casam com '*<ext>' (glob, que
+    diferencia maiúsculas conforme o sistema de arquivos), seguidos dos
+    arquivos compactados, cujos membros são filtrados depois pelas mesmas
+    extensões. Sem extensões, todos os arquivos da pasta (como em
+    load_all_files_from_folder).
+    """
+    folder = Path(folder)
+    if not file_extensions:
+        return [path for path in folder.iterdir() if path.is_file()]
+    files = []
+    for extension in file_extensions:
+        files.extend(Path(path) for path in glob.glob(str(folder / f"*{extension}")))
+    seen = set(files)
+    files.extend(path for path in sorted(folder.iterdir())
+                 if path.is_file() and archive_format(path) and path not in seen)
+    return files
+
+
+class _PrefixedStream(io.RawIOBase):
+    """Fluxo binário que devolve primeiro os bytes já lidos na classificação e depois o restante"""
+
+    def __init__(self, head, stream):
+        self._head = head
+        self._stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._head:
+            size = min(len(buffer), len(self._head))
+            buffer[:size] = self._head[:size]
+            self._head = self._head[size:]
+            return size
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def open_member_text(stream, encoding='utf-8'):
+    """
+    Classifica um fluxo descomprimido pelos primeiros bytes e o abre como texto
+
+    Returns:
+        (tipo, fluxo de texto iterável por linhas ou None se não for texto)
+    """
+    head = stream.read(SNIFF_BYTES)
+    kind = sniff_bytes(head)
+    if kind not in ('texto', 'utf16'):
+        return kind, None
+    raw = io.BufferedReader(_PrefixedStream(head, stream))
+    return kind, io.TextIOWrapper(raw, encoding='utf-16' if kind == 'utf16' else encoding, errors='ignore')
+
+
+def _wanted_member(name, extensions):
+    """Ignora metadados de compactadores e, se pedido, extensões fora da lista"""
+    base = name.rsplit('/', 1)[-1]
+    if not base or base.startswith('.') or name.startswith('__MACOSX/'):
+        return False
+    return extensions is None or Path(base).suffix.lower() in extensions
+
+
+def _read_member(name, stream, encoding, make_counter):
+    """Lê um membro: texto completo, ou LineCounter alimentado linha a linha"""
+    kind, text_stream = open_member_text(stream, encoding)
+    if text_stream is None:
+        return name, kind, None
+    if make_counter is None:
+        return name, kind, text_stream.read()
+    counter = make_counter()
+    for line in text_stream:
+        counter.feed(line)
+    return name, kind, counter
+
+
+def iter_archive(path, encoding='utf-8', extensions=None, workers=1, make_counter=None):
+    """
+    Percorre os arquivos de um .zip, .tar(.gz/.bz2/.xz) ou .gz/.bz2/.xz sem
+    extraí-los: cada membro passa do descompressor direto para a leitura
+
+    Membros de zip são lidos em paralelo (cada thread com seu próprio
+    ZipFile); tar e arquivos únicos são um fluxo só e são lidos em sequência.
+
+    Args:
+        extensions: extensões aceitas para os membros (None = todas)
+        workers: threads de leitura (zip)
+        make_counter: se informado, função que cria um LineCounter; os
+            membros são contados linha a linha e o texto não é guardado
+
+    Gera:
+        (nome do membro, tipo, texto | LineCounter | None); None para membros
+        ignorados por não serem texto
+    """
+    if extensions is not None:
+        extensions = {extension.lower() for extension in extensions}
+    archive_kind = archive_format(path)
+
+    if archive_kind == 'zip':
+        with zipfile.ZipFile(path) as archive:
+            names = [info.filename for info in archive.infolist()
+                     if not info.is_dir() and _wanted_member(info.filename, extensions)]
+        local = threading.local()
+        handles = []
+
+        def read(name):
+            if not hasattr(local, 'archive'):
+                local.archive = zipfile.ZipFile(path)
+                handles.append(local.archive)
+            with local.archive.open(name) as stream:
+                return _read_member(name, stream, encoding, make_counter)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                yield from executor.map(read, names)
+        finally:
+            for handle in handles:
+                handle.close()
+
+    elif archive_kind == 'tar':
+        with tarfile.open(path, 'r|*') as archive:
+            for member in archive:
+                if member.isfile() and _wanted_member(member.name, extensions):
+                    yield _read_member(member.name, archive.extractfile(member), encoding, make_counter)
+
+    elif archive_kind == 'comprimido':
+        name = Path(path).stem
+        if _wanted_member(name, extensions):
+            opener = _SINGLE_FILE_OPENERS[Path(path).suffix.lower()]
+            with opener(path, 'rb') as stream:
+                yield _read_member(name, stream, encoding, make_counter)
+
+    else:
+        raise ValueError(f"Formato de arquivo compactado não suportado: {path}")
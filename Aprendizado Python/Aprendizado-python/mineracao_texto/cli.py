@@ -0,0 +1,825 @@
+"""Interfaces de linha de comando: menus interativos, exemplos e subcomandos"""
+import io
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+from .analisador import TextFrequencyAnalyzer
+from .carregadores import sniff_file, loader_for
+from .monitor import FolderWatcher
+from .particoes import run_shard, claim_shards, merge_shards
+from .contraste import compare_corpora
+from .servidor import CorpusQueryService, serve_corpus
+
+
+def interactive_menu(analyzer):
+    """Menu interativo para escolher o tipo de análise"""
+    print("\n" + "="*60)
+    print("🔍 ANALISADOR DE FREQUÊNCIA DE PALAVRAS")
+    print("="*60)
+
+    while True:
+        print("\nEscolha o tipo de análise:")
+        print("1. 📄 Analisar um arquivo único")
+        print("2. 📁 Analisar pasta com múltiplos arquivos") 
+        print("3. 💾 Abrir snapshot salvo")
+        print("4. 👀 Monitorar pasta (atualização contínua)")
+        print("5. ❌ Sair")
+
+        choice = input("\nDigite sua escolha (1-5): ").strip()
+
+        if choice == '1':
+            _analyze_single_file(analyzer)
+        elif choice == '2':
+            _analyze_multiple_files(analyzer)
+        elif choice == '3':
+            _analyze_snapshot(analyzer)
+        elif choice == '4':
+            _watch_folder(analyzer)
+        elif choice == '5':
+            print("👋 Encerrando programa...")
+            break
+        else:
+            print("❌ Opção inválida! Tente novamente.")
+
+
+def _analyze_single_file(analyzer):
+    """Análise de arquivo único"""
+    print("\n📄 ANÁLISE DE ARQUIVO ÚNICO")
+    print("-" * 40)
+
+    file_path = input("Digite o caminho completo do arquivo: ").strip()
+    if not file_path:
+        file_path = os.path.expanduser("~/Downloads/corpus.txt")
+        print(f"Usando caminho padrão: {file_path}")
+
+    analyzer.texts = []  # Reset
+    analyzer.load_text_file(file_path)
+
+    if not analyzer.texts:
+        print("❌ Nenhum arquivo foi carregado!")
+        return
+
+    _run_analysis(analyzer)
+
+
+def _analyze_multiple_files(analyzer):
+    """Análise de múltiplos arquivos"""
+    print("\n📁 ANÁLISE DE MÚLTIPLOS ARQUIVOS")
+    print("-" * 40)
+
+    folder_path = input("Digite o caminho da pasta: ").strip()
+    if not folder_path:
+        folder_path = r"C:\Users\PICHAU\Downloads\artigos_selecionados\artigos\ciencia_de_dados"
+        print(f"Usando caminho padrão: {folder_path}")
+
+    print("\nEscolha o método de carregamento:")
+    print("1. Todos os arquivos da pasta")
+    print("2. Apenas arquivos específicos (.txt, .md, .docx)")
+
+    load_choice = input("Digite sua escolha (1-2): ").strip()
+
+    analyzer.texts = []  # Reset
+
+    if load_choice == '2':
+        files_loaded = analyzer.load_folder(folder_path)
+    else:
+        files_loaded = analyzer.load_all_files_from_folder(folder_path)
+
+    if files_loaded == 0:
+        print("❌ Nenhum arquivo foi carregado!")
+        return
+
+    _run_analysis(analyzer)
+
+
+def _analyze_snapshot(analyzer):
+    """Análise a partir de um snapshot salvo anteriormente"""
+    print("\n💾 ANÁLISE DE SNAPSHOT")
+    print("-" * 40)
+
+    snapshot_path = input("Digite o caminho do snapshot: ").strip()
+    if not snapshot_path:
+        snapshot_path = "corpus.tfasnap"
+        print(f"Usando caminho padrão: {snapshot_path}")
+
+    if analyzer.load_snapshot(snapshot_path) == 0:
+        print("❌ Nenhum documento foi carregado!")
+        return
+
+    _run_analysis(analyzer)
+
+
+def _watch_folder(analyzer):
+    """Modo monitorado: recontagem automática conforme arquivos chegam"""
+    print("\n👀 MONITORAMENTO DE PASTA")
+    print("-" * 40)
+
+    folder_path = input("Digite o caminho da pasta: ").strip()
+    if not folder_path:
+        folder_path = r"C:\Users\PICHAU\Downloads\artigos_selecionados\artigos\ciencia_de_dados"
+        print(f"Usando caminho padrão: {folder_path}")
+    if not Path(folder_path).is_dir():
+        print(f"✗ Erro: Pasta não encontrada: {folder_path}")
+        return
+
+    words_input = input("Digite as palavras separadas por vírgula: ").strip()
+    if not words_input:
+        palavras_alvo = ["architecture", "security", "privacy"]
+        print(f"Usando palavras padrão: {palavras_alvo}")
+    else:
+        palavras_alvo = [word.strip() for word in words_input.split(',')]
+
+    export_path = input("Arquivo de saída .csv ou .parquet (ou Enter para padrão): ").strip()
+
+    analyzer.texts = []  # Reset
+    watcher = FolderWatcher(analyzer, folder_path, palavras_alvo,
+                            export_path=export_path or "resultados_monitorados.csv")
+    watcher.run()
+
+
+def _run_analysis(analyzer):
+    """Executa a análise com as palavras especificadas"""
+    print(f"\n✅ {len(analyzer.texts)} arquivo(s) carregado(s)")
+
+    # Definir palavras-alvo
+    print("\nDefina as palavras para análise:")
+    words_input = input("Digite as palavras separadas por vírgula: ").strip()
+
+    if not words_input:
+        palavras_alvo = ["architecture", "security", "privacy"]  # Padrão do seu exemplo
+        print(f"Usando palavras padrão: {palavras_alvo}")
+    else:
+        palavras_alvo = [word.strip() for word in words_input.split(',')]
+
+    print(f"🔍 Analisando palavras: {palavras_alvo}")
+
+    # Realizar análise
+    analyzer.analyze_frequency(palavras_alvo)
+
+    # Mostrar resultados básicos
+    print("\n" + "="*50)
+    print("📊 RESULTADOS DA ANÁLISE")
+    print("="*50)
+
+    df_results = analyzer.create_frequency_dataframe()
+    print("\n📋 Resumo dos dados:")
+    print(df_results)
+
+    print("\n📈 Estatísticas:")
+    print(analyzer.get_summary_stats())
+
+    # Menu de visualizações
+    _visualization_menu(analyzer, palavras_alvo)
+
+
+def _visualization_menu(analyzer, palavras_alvo):
+    """Menu para escolher visualizações"""
+    while True:
+        print("\n" + "="*50)
+        print("📊 OPÇÕES DE VISUALIZAÇÃO")
+        print("="*50)
+        print("1. 📊 Gráfico de barras horizontais")
+        print("2. 📈 Gráfico de barras verticais")
+        print("3. 🔥 Mapa de calor (múltiplos arquivos)")
+        print("4. 🔄 Comparação individual (múltiplos arquivos)")
+        print("5. 📋 Relatório detalhado (múltiplos arquivos)")
+        print("6. 💾 Exportar para CSV")
+        print("7. 🔗 Mapa de co-ocorrência das palavras")
+        print("8. 🔎 Concordância (palavra em contexto)")
+        print("9. 🗄️  Salvar snapshot do corpus")
+        print("10. 🌐 Servir corpus via HTTP (consultas JSON)")
+        print("11. 📑 Frequência por seção (resumo/corpo/referências)")
+        print("12. 🗂️  Perfis de palavras (vários relatórios em uma passada)")
+        print("13. ↩️  Voltar ao menu principal")
+
+        viz_choice = input("\nEscolha a visualização (1-13): ").strip()
+
+        if viz_choice == '1':
+            analyzer.plot_frequency_bar(horizontal=True, title="Frequência das Palavras-Chave (Horizontal)")
+        elif viz_choice == '2':
+            analyzer.plot_frequency_bar(horizontal=False, title="Frequência das Palavras-Chave (Vertical)")
+        elif viz_choice == '3':
+            analyzer.plot_frequency_heatmap()
+        elif viz_choice == '4':
+            analyzer.plot_individual_comparison(palavras_alvo)
+        elif viz_choice == '5':
+            if len(analyzer.texts) > 1:
+                analyzer.create_detailed_report(palavras_alvo)
+            else:
+                print("📋 Relatório detalhado disponível apenas para múltiplos arquivos.")
+        elif viz_choice == '6':
+            filename = input("Nome do arquivo CSV (ou Enter para padrão): ").strip()
+            if not filename:
+                filename = "resultados_mineracao.csv"
+            if not filename.endswith('.csv'):
+                filename += '.csv'
+            analyzer.export_results_to_csv(palavras_alvo, filename)
+        elif viz_choice == '7':
+            window_input = input("Tamanho da janela em tokens (ou Enter para 10): ").strip()
+            window = int(window_input) if window_input.isdigit() else 10
+            mode_input = input("Contar por (1) janela ou (2) sentença? ").strip()
+            mode = 'sentenca' if mode_input == '2' else 'janela'
+            analyzer.plot_cooccurrence_heatmap(palavras_alvo, window=window, mode=mode)
+        elif viz_choice == '8':
+            _concordance_menu(analyzer, palavras_alvo)
+        elif viz_choice == '9':
+            snapshot_path = input("Nome do snapshot (ou Enter para 'corpus.tfasnap'): ").strip()
+            analyzer.save_snapshot(snapshot_path or "corpus.tfasnap")
+        elif viz_choice == '10':
+            port_input = input("Porta (ou Enter para 8000): ").strip()
+            serve_corpus(analyzer, port=int(port_input) if port_input.isdigit() else 8000)
+        elif viz_choice == '11':
+            _sections_menu(analyzer, palavras_alvo)
+        elif viz_choice == '12':
+            _profiles_menu(analyzer, palavras_alvo)
+        elif viz_choice == '13':
+            break
+        else:
+            print("❌ Opção inválida!")
+
+
+def _sections_menu(analyzer, palavras_alvo):
+    """Frequência por seção e reanálise opcional sem as referências"""
+    print("\n📑 FREQUÊNCIA POR SEÇÃO")
+    print(analyzer.sections_dataframe(palavras_alvo).to_string(index=False))
+
+    exclude = input("\nRefazer a análise geral sem as referências? (s/n): ").strip().lower()
+    if exclude in ['s', 'sim', 'yes', 'y']:
+        analyzer.analyze_frequency(palavras_alvo, exclude_sections=['referencias'])
+        print("\n📋 Resumo dos dados (sem referências):")
+        print(analyzer.create_frequency_dataframe())
+        print("\n📈 Estatísticas:")
+        print(analyzer.get_summary_stats())
+
+
+def parse_profiles(lines):
+    """
+    Lê perfis no formato 'nome: palavra1, palavra2' (um por linha)
+
+    Returns:
+        {nome: [palavras]}; linhas sem ':' ou sem palavras são ignoradas
+    """
+    profiles = {}
+    for line in lines:
+        name, separator, words = line.partition(':')
+        words = [word.strip() for word in words.split(',') if word.strip()]
+        if separator and name.strip() and words:
+            profiles.setdefault(name.strip(), []).extend(words)
+    return profiles
+
+
+def _profiles_menu(analyzer, palavras_alvo):
+    """Relatórios de vários perfis de palavras a partir de uma única contagem"""
+    print("\n🗂️  PERFIS DE PALAVRAS")
+    print("Digite um perfil por linha no formato 'nome: palavra1, palavra2'")
+    print("(linha vazia para terminar)")
+    lines = []
+    while True:
+        line = input("> ").strip()
+        if not line:
+            break
+        lines.append(line)
+
+    profiles = parse_profiles(lines)
+    if not profiles:
+        profiles = {'analise': palavras_alvo}
+        print(f"Usando as palavras da análise atual: {palavras_alvo}")
+
+    export = input("Exportar cada perfil para CSV? (s/n): ").strip().lower()
+    plot = input("Gerar o gráfico de cada perfil? (s/n): ").strip().lower()
+    analyzer.report_profiles(
+        profiles,
+        export_pattern="resultados_{perfil}.csv" if export in ['s', 'sim', 'yes', 'y'] else None,
+        plot=plot in ['s', 'sim', 'yes', 'y'],
+    )
+
+
+def _concordance_menu(analyzer, palavras_alvo):
+    """Navegação paginada pela concordância KWIC"""
+    word = input(f"Palavra (ou Enter para '{palavras_alvo[0]}'): ").strip() or palavras_alvo[0]
+    page = 1
+    while True:
+        result = analyzer.print_concordance(word, page=page)
+        if result['pagina'] >= result['paginas']:
+            break
+        action = input("\nEnter = próxima página, número = ir para página, 'q' = sair: ").strip().lower()
+        if action == 'q':
+            break
+        page = int(action) if action.isdigit() else page + 1
+
+
+# Exemplo de uso direto (sem menu interativo)
+def exemplo_uso_direto():
+    """Função de exemplo para uso direto do código"""
+    analyzer = TextFrequencyAnalyzer()
+    
+    # Exemplo 1: Arquivo único
+    caminho_corpus = os.path.expanduser("~/Downloads/corpus.txt")
+    analyzer.load_text_file(caminho_corpus)
+    
+    # Exemplo 2: Múltiplos arquivos (descomente para usar)
+    # pasta_artigos = r"C:\Users\PICHAU\Downloads\artigos_selecionados\artigos\ciencia_de_dados"
+    # analyzer.load_all_files_from_folder(pasta_artigos)
+    
+    # Palavras para analisar
+    palavras_alvo = ["architecture", "security", "privacy"]
+    
+    if analyzer.texts:
+        # Análise
+        analyzer.analyze_frequency(palavras_alvo)
+        
+        # Resultados
+        print("=== ANÁLISE DE FREQUÊNCIA DE PALAVRAS ===")
+        print(analyzer.create_frequency_dataframe())
+        print("\nEstatísticas:")
+        print(analyzer.get_summary_stats())
+        
+        # Visualizações
+        analyzer.plot_frequency_bar(horizontal=True)
+        analyzer.plot_frequency_heatmap()
+        
+        # Exportar
+        analyzer.export_results_to_csv(palavras_alvo)
+
+
+def example_usage():
+    """Exemplo de uso direto com texto colado"""
+    print("=== EXEMPLO DE USO DIRETO ===\n")
+    
+    analyzer = TextFrequencyAnalyzer()
+    
+    # Exemplo com texto de exemplo
+    exemplo_texto = """
+    This is a sample text about computer architecture and security.
+    Security is important in computer architecture design.
+    Privacy and security go hand in hand in modern architecture.
+    """
+    
+    # Adicionar texto
+    if analyzer.add_pasted_text(exemplo_texto, "Texto de Exemplo"):
+        # Analisar palavras
+        palavras = ["architecture", "security", "privacy"]
+        frequencies = analyzer.analyze_frequency(palavras)
+        
+        if frequencies:
+            # Mostrar resultados
+            print("\n=== RESULTADOS ===")
+            print(analyzer.create_frequency_dataframe())
+            
+            print("\n=== ESTATÍSTICAS ===")
+            print(analyzer.get_summary_stats())
+            
+            # Criar gráfico
+            analyzer.plot_frequency_bar()
+    
+    # Limpar dados
+    analyzer.clear_data()
+
+
+def interactive_text_input(analyzer):
+    """
+    Lê um texto colado no terminal e o adiciona ao analisador
+    
+    Cada linha é contada assim que chega (LineCounter), sem acumular o texto.
+    """
+    print("\n=== ADICIONAR TEXTO COLADO ===")
+    print("Cole seu texto abaixo (pressione Enter DUAS vezes para finalizar):")
+    print("Ou digite 'quit' para cancelar\n")
+    
+    counter = analyzer.new_line_counter()
+    empty_line_count = 0
+    
+    while True:
+        try:
+            line = input("")
+            if line.lower().strip() == 'quit':
+                print("Operação cancelada.")
+                return False
+                
+            if line.strip() == '':
+                empty_line_count += 1
+                if empty_line_count >= 2:
+                    break
+                continue
+            
+            # Linhas vazias só contam se vierem antes de mais texto
+            for _ in range(empty_line_count):
+                counter.feed('\n')
+            empty_line_count = 0
+            counter.feed(line + '\n')
+        except KeyboardInterrupt:
+            print("\nOperação cancelada.")
+            return False
+        except EOFError:
+            print("\nEntrada finalizada.")
+            break
+    
+    if counter.lines == 0:
+        print("Nenhum texto foi fornecido.")
+        return False
+    
+    # Pedir nome para o texto
+    try:
+        source_name = input("\nDigite um nome para este texto (ou Enter para 'Texto Colado'): ").strip()
+        if not source_name:
+            source_name = "Texto Colado"
+    except (KeyboardInterrupt, EOFError):
+        source_name = "Texto Colado"
+        
+    return analyzer.add_counted_text(counter, source_name)
+
+
+def menu_texto_colado():
+    """Menu interativo para colar textos e analisar a frequência de palavras"""
+    print("=== ANALISADOR DE FREQUÊNCIA DE PALAVRAS ===\n")
+    
+    analyzer = TextFrequencyAnalyzer()
+    
+    while True:
+        try:
+            print("\nEscolha uma opção:")
+            print("1. Colar texto diretamente")
+            print("2. Carregar arquivo de texto")
+            print("3. Ver textos carregados")
+            print("4. Analisar frequência de palavras")
+            print("5. Limpar dados")
+            print("6. Sair")
+            
+            choice = input("\nDigite sua escolha (1-6): ").strip()
+            
+            if choice == '1':
+                interactive_text_input(analyzer)
+                        
+            elif choice == '2':
+                file_path = input("Digite o caminho do arquivo: ").strip()
+                if file_path:
+                    analyzer.load_text_file(file_path)
+                    
+            elif choice == '3':
+                analyzer.show_text_info()
+                
+            elif choice == '4':
+                if not analyzer.texts:
+                    print("Erro: Adicione pelo menos um texto primeiro!")
+                    continue
+                    
+                words_input = input("Digite as palavras para analisar (separadas por vírgula): ").strip()
+                target_words = [word.strip() for word in words_input.split(',') if word.strip()]
+                
+                if not target_words:
+                    print("Nenhuma palavra válida fornecida!")
+                    continue
+                
+                print(f"\nAnalisando palavras: {target_words}")
+                frequencies = analyzer.analyze_frequency(target_words)
+                
+                if frequencies:
+                    print("\n=== RESULTADOS ===")
+                    print(analyzer.create_frequency_dataframe())
+                    
+                    print("\n=== ESTATÍSTICAS ===")
+                    print(analyzer.get_summary_stats())
+                    
+                    # Perguntar se quer visualizar
+                    show_plot = input("\nDeseja ver os gráficos? (s/n): ").strip().lower()
+                    if show_plot in ['s', 'sim', 'yes', 'y']:
+                        analyzer.plot_frequency_bar()
+                        if len(analyzer.texts) > 1:
+                            analyzer.plot_frequency_heatmap()
+                                
+            elif choice == '5':
+                analyzer.clear_data()
+                
+            elif choice == '6':
+                print("Saindo...")
+                analyzer.clear_data()  # Limpa dados antes de sair
+                break
+                
+            else:
+                print("Opção inválida! Tente novamente.")
+                
+        except KeyboardInterrupt:
+            print("\n\nPrograma interrompido pelo usuário.")
+            analyzer.clear_data()
+            break
+        except EOFError:
+            print("\n\nEntrada finalizada.")
+            analyzer.clear_data()
+            break
+        except Exception as e:
+            print(f"Erro inesperado: {e}")
+            print("Continuando...")
+
+
+def diagnosticar_pasta(caminho):
+    """Função para diagnosticar problemas na pasta"""
+    print("\n=== DIAGNÓSTICO DA PASTA ===")
+    print(f"Caminho: {caminho}")
+    
+    if not os.path.exists(caminho):
+        print("❌ Pasta não existe!")
+        return
+    
+    pasta = Path(caminho)
+    arquivos = list(pasta.iterdir())
+    
+    print(f"Total de itens: {len(arquivos)}")
+    print(f"Arquivos: {len([f for f in arquivos if f.is_file()])}")
+    print(f"Pastas: {len([f for f in arquivos if f.is_dir()])}")
+    
+    # Tipo detectado pelos primeiros bytes (o mesmo critério da carga de pastas)
+    tipos = {}
+    for arquivo in arquivos:
+        if arquivo.is_file():
+            try:
+                tipos[arquivo] = sniff_file(arquivo)
+            except OSError:
+                tipos[arquivo] = 'ilegivel'
+    contagem = Counter(tipo if loader_for(arquivo, tipo) else f"{tipo} (ignorado)"
+                       for arquivo, tipo in tipos.items())
+    print("Tipos detectados:")
+    for tipo, total in contagem.most_common():
+        print(f"  {tipo}: {total}")
+    
+    print("\nPrimeiros 10 arquivos encontrados:")
+    arquivos_apenas = [f for f in arquivos if f.is_file()][:10]
+    for arquivo in arquivos_apenas:
+        print(f"  - {arquivo.name} ({arquivo.suffix}, {tipos[arquivo]})")
+
+
+def analise_pasta_artigos(pasta_artigos, palavras_alvo, export_filename="analise_artigos_ciencia_dados.csv",
+                          caminhos_alternativos=()):
+    """
+    Pipeline completo sobre uma pasta de artigos: relatório por arquivo,
+    análise geral, estatísticas, gráficos, exportação e ranking dos arquivos
+    
+    Args:
+        pasta_artigos: pasta com os arquivos
+        palavras_alvo: palavras-chave para analisar
+        export_filename: CSV de saída
+        caminhos_alternativos: pastas sugeridas se nada for carregado
+    """
+    analyzer = TextFrequencyAnalyzer()
+    
+    print("=== CARREGANDO ARQUIVOS DA PASTA ===")
+    analyzer.load_all_files_from_folder(pasta_artigos)
+    
+    # Verificar se arquivos foram carregados
+    if not analyzer.texts:
+        print("❌ Nenhum arquivo foi carregado!")
+        print("Verifique se:")
+        print("1. O caminho está correto")
+        print("2. Existem arquivos na pasta")
+        print("3. Os arquivos contêm texto")
+        
+        if caminhos_alternativos:
+            print("\nTentando caminhos alternativos...")
+        for caminho in caminhos_alternativos:
+            if os.path.exists(caminho):
+                print(f"✓ Pasta encontrada: {caminho}")
+                arquivos = list(Path(caminho).iterdir())
+                print(f"  Arquivos na pasta: {len([f for f in arquivos if f.is_file()])}")
+                break
+            else:
+                print(f"✗ Pasta não encontrada: {caminho}")
+        return analyzer
+    
+    print(f"✅ {len(analyzer.texts)} arquivos carregados com sucesso!")
+    print(f"\n=== ANALISANDO PALAVRAS: {palavras_alvo} ===")
+    
+    # ANÁLISE COMPLETA
+    print("\n1. RELATÓRIO DETALHADO POR ARQUIVO:")
+    resultados_individuais = analyzer.create_detailed_report(palavras_alvo)
+    
+    print("\n2. ANÁLISE GERAL:")
+    analyzer.analyze_frequency(palavras_alvo)
+    df_results = analyzer.create_frequency_dataframe()
+    print(df_results.head(10))
+    
+    print("\n3. ESTATÍSTICAS RESUMIDAS:")
+    print(analyzer.get_summary_stats())
+    
+    # VISUALIZAÇÕES
+    print("\n4. GERANDO GRÁFICOS...")
+    
+    # Gráfico comparativo entre arquivos (com mapa de calor)
+    analyzer.plot_individual_comparison(palavras_alvo, with_heatmap=True)
+    
+    # Gráfico geral
+    analyzer.plot_frequency_bar(title="Frequência Total das Palavras-Chave")
+    
+    # EXPORTAR RESULTADOS
+    print("\n5. EXPORTANDO RESULTADOS...")
+    analyzer.export_results_to_csv(palavras_alvo, filename=export_filename)
+    
+    print("\n=== RESUMO FINAL ===")
+    print(f"📁 Arquivos analisados: {len(analyzer.texts)}")
+    print(f"🔍 Palavras pesquisadas: {len(palavras_alvo)}")
+    print(f"📊 Resultados exportados para: {export_filename}")
+    
+    # Mostrar os 5 arquivos com mais ocorrências
+    print("\n🏆 TOP 5 ARQUIVOS COM MAIS PALAVRAS-CHAVE:")
+    totais_por_arquivo = {}
+    for arquivo, dados in resultados_individuais.items():
+        totais_por_arquivo[arquivo] = sum(dados['palavras_encontradas'].values())
+    
+    top_5 = sorted(totais_por_arquivo.items(), key=lambda x: x[1], reverse=True)[:5]
+    for i, (arquivo, total) in enumerate(top_5, 1):
+        print(f"{i}. {arquivo}: {total} ocorrências")
+    
+    return analyzer
+
+
+def previa_amostragem(source, target_words, precision=None, time_budget=None, sample_size=30):
+    """
+    Prévia de uma pasta (ou arquivo) grande por amostragem, antes da análise
+    completa: frequência estimada de cada palavra com intervalo de 95%
+    """
+    analyzer = TextFrequencyAnalyzer()
+    estimate = analyzer.estimate_frequency(source, target_words, sample_size=sample_size,
+                                           precision=precision, time_budget=time_budget)
+    if not estimate:
+        return estimate
+
+    fraction = estimate['bytes_lidos'] / estimate['bytes_total'] if estimate['bytes_total'] else 1
+    print("\n" + "=" * 70)
+    print("🔎 PRÉVIA POR AMOSTRAGEM" + (" (exata: corpus inteiro lido)" if estimate['exato'] else ""))
+    print("=" * 70)
+    print(f"Unidades lidas: {estimate['unidades_lidas']}/{estimate['unidades']} "
+          f"({fraction:.1%} dos bytes) em {estimate['tempo']:.1f}s")
+    tokens = estimate['tokens']
+    print(f"Tokens estimados: {tokens['estimativa']:,.0f} "
+          f"[{tokens['inferior']:,.0f} – {tokens['superior']:,.0f}]")
+    print(f"\n{'Palavra':<20} {'Estimativa':>12} {'Intervalo ' + format(estimate['confianca'], '.0%'):>27} "
+          f"{'Erro':>8} {'‰ tokens':>9}")
+    for word, item in estimate['palavras'].items():
+        interval = f"[{item['inferior']:,.0f} – {item['superior']:,.0f}]"
+        print(f"{word:<20} {item['estimativa']:>12,.0f} {interval:>27} "
+              f"{'±' + format(item['erro_relativo'], '.1%'):>8} {item['por_mil_tokens']:>9.3f}")
+    return estimate
+
+
+def processar_fragmentos(folder, output_dir, shards, shard=None, processes=1):
+    """
+    Conta fragmentos de uma pasta grande em uma pasta de saída compartilhada
+    (pode rodar ao mesmo tempo em várias máquinas, com os mesmos argumentos)
+    
+    Args:
+        shard: fragmento específico a contar; se None, reivindica os livres
+    """
+    if shard is not None:
+        return [run_shard(folder, output_dir, shard, shards, processes=processes)]
+    written = claim_shards(folder, output_dir, shards, processes=processes)
+    print(f"\n✅ Fragmentos contados por este processo: {len(written)}")
+    return written
+
+
+def juntar_fragmentos(output_dir, target_words, filename="resultados_fragmentos.csv"):
+    """Junta os fragmentos de uma pasta de saída e gera o relatório e o CSV finais"""
+    analyzer = merge_shards(output_dir)
+    if analyzer is None or not analyzer.texts:
+        return analyzer
+    individual_results = analyzer.analyze_individual_files(target_words)
+    analyzer.create_detailed_report(target_words, individual_results=individual_results)
+    analyzer.export_results(target_words, filename, individual_results=individual_results)
+    return analyzer
+
+
+def documentos_similares(folder, source, k=10, approximate=False):
+    """Lista os k documentos da pasta mais parecidos com um deles (TF-IDF + cosseno)"""
+    analyzer = TextFrequencyAnalyzer()
+    if not analyzer.load_all_files_from_folder(folder):
+        return []
+    source = Path(source).stem
+    similar = analyzer.most_similar(source, k, approximate=approximate)
+    if similar:
+        print(f"\n🔗 Documentos mais parecidos com '{source}'" + (" (LSH)" if approximate else "") + ":")
+        for position, (other, score) in enumerate(similar, 1):
+            print(f"{position:>3}. {other:<40} {score:.3f}")
+    elif analyzer.similarity_index().position(source) is not None:
+        print(f"⚠️ Nenhum documento compartilha termos (fora os muito comuns) com '{source}'")
+    return similar
+
+
+def comparar_corpora(folder_a, folder_b, filename="comparacao_corpora.csv", top=20, processes=1,
+                     cache_dir=".cache_mineracao"):
+    """
+    Compara duas pastas de artigos em uma execução: termos característicos de
+    cada uma (log-verossimilhança e log-ratio), tabela ordenada, CSV e gráfico
+    
+    As contagens de cada pasta ficam em snapshots em cache_dir e são
+    reaproveitadas enquanto a pasta não mudar.
+    """
+    comparison = compare_corpora(folder_a, folder_b, cache_dir=cache_dir, processes=processes)
+    if not comparison['termos']:
+        return comparison
+    from . import relatorios
+    relatorios.report_keyness(comparison, top, filename, plot=True)
+    return comparison
+
+
+def analisar_entrada(target_words=None, stream=None, encoding='utf-8', top=20):
+    """
+    Conta um texto recebido pela entrada padrão em memória constante
+    (ex.: cat livro.txt | python -m mineracao_texto - privacy,security)
+    
+    Args:
+        target_words: palavras a analisar; se vazio, lista os termos mais frequentes
+        stream: iterável de linhas (padrão: sys.stdin, lido como bytes e
+            decodificado ignorando bytes inválidos)
+        top: quantidade de termos listados sem palavras-alvo
+    """
+    if stream is None:
+        stream = sys.stdin
+        if hasattr(stream, 'buffer'):
+            stream = io.TextIOWrapper(stream.buffer, encoding=encoding, errors='ignore')
+    
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    if not analyzer.add_text_stream(stream, "stdin"):
+        return analyzer
+    
+    if target_words:
+        analyzer.analyze_frequency(target_words)
+        print("\n=== RESULTADOS ===")
+        print(analyzer.create_frequency_dataframe().to_string(index=False))
+    else:
+        print(f"\n=== {top} TERMOS MAIS FREQUENTES ===")
+        for item in CorpusQueryService(analyzer).top_terms({'n': top})['termos']:
+            print(f"{item['termo']:<30} {item['frequencia']:>10,}")
+    return analyzer
+
+
+def main(argv=None):
+    """
+    Ponto de entrada: sem argumentos abre o menu interativo
+    
+    Subcomandos:
+        servir <snapshot ou pasta> [porta]   servidor de consultas JSON
+        colar                                menu de texto colado
+        pasta <pasta> <palavra,palavra...>   pipeline completo sobre uma pasta
+        diagnosticar <pasta>                 lista o conteúdo de uma pasta
+        perfis <pasta> <arquivo de perfis>   um relatório/CSV por perfil
+                                             ('nome: palavra1, palavra2' por linha)
+        amostra <pasta ou arquivo> <palavras> [precisao] [segundos]
+                                             prévia por amostragem com intervalos
+        fragmento <pasta> <saida> <n> [indice] [processos]
+                                             conta fragmentos (de n) em <saida>;
+                                             sem índice, reivindica os livres
+        juntar <saida> <palavras> [arquivo.csv]
+                                             junta os fragmentos: relatório e CSV
+        similares <pasta> <documento> [k] [lsh]
+                                             documentos mais parecidos (cosseno TF-IDF)
+        comparar <pasta A> <pasta B> [arquivo.csv] [top] [processos]
+                                             termos característicos de cada pasta
+        - [palavra,palavra...]               conta o texto da entrada padrão
+    
+    A entrada padrão só é lida como texto com '-' explícito: sem argumentos o
+    menu continua lendo as opções dela (ex.: printf '5\n' | python mineracao2.py).
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    
+    if argv and argv[0] == '-':
+        words = argv[1] if len(argv) > 1 else ''
+        analisar_entrada([word.strip() for word in words.split(',') if word.strip()])
+    elif len(argv) >= 2 and argv[0] == 'servir':
+        analyzer = TextFrequencyAnalyzer()
+        if Path(argv[1]).is_dir():
+            analyzer.load_all_files_from_folder(argv[1])
+        else:
+            analyzer.load_snapshot(argv[1])
+        serve_corpus(analyzer, port=int(argv[2]) if len(argv) > 2 else 8000)
+    elif argv and argv[0] == 'colar':
+        menu_texto_colado()
+    elif len(argv) >= 3 and argv[0] == 'pasta':
+        analise_pasta_artigos(argv[1], [word.strip() for word in argv[2].split(',') if word.strip()])
+    elif len(argv) >= 2 and argv[0] == 'diagnosticar':
+        diagnosticar_pasta(argv[1])
+    elif len(argv) >= 3 and argv[0] == 'amostra':
+        previa_amostragem(argv[1], [word.strip() for word in argv[2].split(',') if word.strip()],
+                          precision=float(argv[3]) if len(argv) > 3 else None,
+                          time_budget=float(argv[4]) if len(argv) > 4 else None)
+    elif len(argv) >= 4 and argv[0] == 'fragmento':
+        processar_fragmentos(argv[1], argv[2], int(argv[3]),
+                             shard=int(argv[4]) if len(argv) > 4 and argv[4] != '-' else None,
+                             processes=int(argv[5]) if len(argv) > 5 else 1)
+    elif len(argv) >= 3 and argv[0] == 'juntar':
+        juntar_fragmentos(argv[1], [word.strip() for word in argv[2].split(',') if word.strip()],
+                          *argv[3:4])
+    elif len(argv) >= 3 and argv[0] == 'similares':
+        documentos_similares(argv[1], argv[2], int(argv[3]) if len(argv) > 3 else 10,
+                             approximate=len(argv) > 4 and argv[4] == 'lsh')
+    elif len(argv) >= 3 and argv[0] == 'comparar':
+        comparar_corpora(argv[1], argv[2], argv[3] if len(argv) > 3 else "comparacao_corpora.csv",
+                         top=int(argv[4]) if len(argv) > 4 else 20,
+                         processes=int(argv[5]) if len(argv) > 5 else 1)
+    elif len(argv) >= 3 and argv[0] == 'perfis':
+        with open(argv[2], encoding='utf-8') as profiles_file:
+            profiles = parse_profiles(profiles_file)
+        analyzer = TextFrequencyAnalyzer()
+        if analyzer.load_all_files_from_folder(argv[1]):
+            analyzer.report_profiles(profiles, export_pattern="resultados_{perfil}.csv")
+    else:
+        TextFrequencyAnalyzer().interactive_menu()
+    return 0
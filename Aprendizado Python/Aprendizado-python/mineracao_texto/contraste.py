@@ -0,0 +1,145 @@
+"""
+Modo comparativo: termos característicos (keyness) de um corpus em relação a
+outro, por log-verossimilhança e log-ratio
+"""
+import os
+import hashlib
+from pathlib import Path
+
+from .estatisticas import log_likelihood, log_ratio, chi2_p_value
+from .carregadores import archive_format
+from .analisador import TextFrequencyAnalyzer
+
+SNAPSHOT_SUFFIX = '.tfasnap'
+
+
+def _newest_mtime(folder):
+    """Data de modificação mais recente entre a pasta e seus arquivos"""
+    newest = folder.stat().st_mtime
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_file():
+                newest = max(newest, entry.stat().st_mtime)
+    return newest
+
+
+def load_corpus(source, cache_dir=None, file_extensions=None, encoding='utf-8', processes=1):
+    """
+    Analisador com as contagens de um corpus (pasta, arquivo compactado ou
+    snapshot .tfasnap)
+
+    Args:
+        cache_dir: se definido, a contagem de uma pasta é salva em snapshot
+            nesta pasta e reaproveitada enquanto nenhum arquivo for mais
+            recente que ela (um snapshot por pasta, extensões e codificação)
+        file_extensions: extensões aceitas (None = todos os arquivos)
+        processes: processos de contagem (ver paralelo.count_files)
+    """
+    source = Path(source)
+    analyzer = TextFrequencyAnalyzer()
+    if source.is_file() and source.suffix == SNAPSHOT_SUFFIX:
+        analyzer.load_snapshot(source)
+        return analyzer
+
+    cache = None
+    if cache_dir is not None and source.is_dir():
+        # A chave inclui tudo que muda a contagem, não só a pasta
+        identity = '\n'.join([str(source.resolve()), ','.join(sorted(file_extensions or [])), encoding])
+        key = hashlib.sha1(identity.encode('utf-8')).hexdigest()[:10]
+        cache = Path(cache_dir) / f"{source.name}-{key}{SNAPSHOT_SUFFIX}"
+        if cache.exists() and _newest_mtime(source) <= cache.stat().st_mtime:
+            print(f"✓ Contagens de {source.name} reaproveitadas de {cache}")
+            analyzer.load_snapshot(cache)
+            return analyzer
+
+    if file_extensions or (source.is_file() and archive_format(source)):
+        analyzer.load_folder(source, file_extensions, encoding, processes=processes, keep_texts=False)
+    else:
+        analyzer.load_all_files_from_folder(source, encoding, processes=processes, keep_texts=False)
+    if cache is not None and analyzer.texts:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        analyzer.save_snapshot(cache)
+    return analyzer
+
+
+def key_counts(analyzer, case_sensitive=False):
+    """
+    Total de cada chave de consulta (lookup_key) no corpus do analisador
+
+    Returns:
+        (dicionário chave -> ocorrências, total de tokens)
+    """
+    totals = analyzer.corpus_counts()
+    tokens = analyzer.vocabulary.tokens
+    counts = {}
+    for term_id, count in totals.items():
+        key = analyzer.lookup_key(tokens[term_id], case_sensitive)
+        counts[key] = counts.get(key, 0) + count
+    return counts, totals.total
+
+
+def keyness(analyzer_a, analyzer_b, case_sensitive=False, min_count=5, name_a='A', name_b='B'):
+    """
+    Keyness de todos os termos dos dois corpora, em uma passada sobre as
+    contagens já indexadas (nenhum texto é relido)
+
+    Args:
+        min_count: ocorrências mínimas do termo somando os dois corpora
+        name_a, name_b: nomes dos corpora nos relatórios e gráficos
+
+    Returns:
+        dicionário com os nomes e totais de tokens dos corpora e 'termos':
+        lista ordenada pela log-verossimilhança (maior primeiro), cada item
+        com termo, freq_a, freq_b, por_milhao_a, por_milhao_b,
+        log_likelihood, log_ratio, p_valor e favorece (nome do corpus em que
+        o termo é relativamente mais frequente; None se a frequência
+        relativa for igual nos dois)
+    """
+    counts_a, total_a = key_counts(analyzer_a, case_sensitive)
+    counts_b, total_b = key_counts(analyzer_b, case_sensitive)
+    comparison = {'corpus_a': name_a, 'corpus_b': name_b, 'tokens_a': total_a, 'tokens_b': total_b,
+                  'termos': []}
+    if not total_a or not total_b:
+        print("✗ Erro: os dois corpora precisam ter textos carregados!")
+        return comparison
+
+    terms = []
+    for term in counts_a.keys() | counts_b.keys():
+        count_a = counts_a.get(term, 0)
+        count_b = counts_b.get(term, 0)
+        if count_a + count_b < min_count:
+            continue
+        g2 = log_likelihood(count_a, count_b, total_a, total_b)
+        ratio = log_ratio(count_a, count_b, total_a, total_b)
+        if abs(ratio) < 1e-12:
+            # Mesma frequência relativa (a menos de arredondamento): neutro
+            ratio = 0.0
+        terms.append({
+            'termo': term,
+            'freq_a': count_a,
+            'freq_b': count_b,
+            'por_milhao_a': count_a * 1e6 / total_a,
+            'por_milhao_b': count_b * 1e6 / total_b,
+            'log_likelihood': g2,
+            'log_ratio': ratio,
+            'p_valor': chi2_p_value(g2),
+            'favorece': name_a if ratio > 0 else name_b if ratio < 0 else None,
+        })
+    terms.sort(key=lambda item: (-item['log_likelihood'], item['termo']))
+    comparison['termos'] = terms
+    return comparison
+
+
+def compare_corpora(source_a, source_b, case_sensitive=False, min_count=5, cache_dir=None,
+                    file_extensions=None, encoding='utf-8', processes=1):
+    """
+    Conta dois corpora (pastas, compactados ou snapshots) e calcula a keyness
+    de A em relação a B (ver keyness e load_corpus)
+    """
+    analyzer_a = load_corpus(source_a, cache_dir, file_extensions, encoding, processes)
+    analyzer_b = load_corpus(source_b, cache_dir, file_extensions, encoding, processes)
+    name_a = Path(source_a).stem or str(source_a)
+    name_b = Path(source_b).stem or str(source_b)
+    if name_a == name_b:
+        name_a, name_b = f"{name_a} (A)", f"{name_b} (B)"
+    return keyness(analyzer_a, analyzer_b, case_sensitive, min_count, name_a, name_b)
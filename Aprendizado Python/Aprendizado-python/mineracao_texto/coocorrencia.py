@@ -0,0 +1,36 @@
+"""Matriz esparsa de co-ocorrência"""
+from collections import Counter
+
+
+class CooccurrenceMatrix:
+    """
+    Matriz esparsa e simétrica de co-ocorrência entre palavras-alvo
+    
+    Guarda apenas os pares observados, como {(i, j): contagem} com i < j.
+    """
+    
+    def __init__(self, terms):
+        self.terms = list(terms)
+        self.pairs = Counter()
+    
+    def add(self, i, j, count=1):
+        if i != j:
+            self.pairs[(i, j) if i < j else (j, i)] += count
+    
+    def update(self, other):
+        """Soma as contagens de outra matriz com os mesmos termos"""
+        self.pairs.update(other.pairs)
+    
+    def get(self, word_a, word_b):
+        """Contagem de co-ocorrência entre duas palavras-alvo"""
+        i, j = self.terms.index(word_a), self.terms.index(word_b)
+        return self.pairs.get((i, j) if i < j else (j, i), 0)
+    
+    def to_dataframe(self):
+        """Matriz densa (termos x termos) para exibição e gráficos"""
+        import pandas as pd
+        size = len(self.terms)
+        dense = [[0] * size for _ in range(size)]
+        for (i, j), count in self.pairs.items():
+            dense[i][j] = dense[j][i] = count
+        return pd.DataFrame(dense, index=self.terms, columns=self.terms)
@@ -0,0 +1,197 @@
+"""Estatísticas incrementais (Welford, quantis P² e estimador de razão) e medidas de keyness"""
+import math
+from statistics import NormalDist
+
+
+class P2Quantile:
+    """
+    Estimador P² (Jain & Chlamtac) de um quantil em fluxo: memória constante
+    (5 marcadores), exato até a quinta observação
+    """
+    
+    def __init__(self, q):
+        self.q = q
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self.increments = [0, q / 2, q, (1 + q) / 2, 1]
+    
+    def add(self, x):
+        heights = self.heights
+        if len(heights) < 5:
+            heights.append(x)
+            heights.sort()
+            return
+        
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if heights[i] <= x < heights[i + 1])
+        
+        for i in range(k + 1, 5):
+            self.positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+        
+        for i in range(1, 4):
+            d = self.desired[i] - self.positions[i]
+            if (d >= 1 and self.positions[i + 1] - self.positions[i] > 1) or \
+               (d <= -1 and self.positions[i - 1] - self.positions[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = self._parabolic(i, d)
+                if not heights[i - 1] < candidate < heights[i + 1]:
+                    candidate = heights[i] + d * (heights[i + d] - heights[i]) / (self.positions[i + d] - self.positions[i])
+                heights[i] = candidate
+                self.positions[i] += d
+    
+    def _parabolic(self, i, d):
+        n, h = self.positions, self.heights
+        return h[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+    
+    def value(self):
+        heights = self.heights
+        if not heights:
+            return float('nan')
+        if len(heights) < 5:
+            # Poucas observações: quantil exato com interpolação linear (como o pandas)
+            rank = self.q * (len(heights) - 1)
+            low = int(rank)
+            high = min(low + 1, len(heights) - 1)
+            return heights[low] + (heights[high] - heights[low]) * (rank - low)
+        return heights[2]
+
+
+class RunningStats:
+    """
+    Estatísticas incrementais de uma série: soma, média, variância (Welford),
+    mínimo, máximo e quantis aproximados (P²), em O(1) por observação
+    """
+    
+    __slots__ = ('count', 'total', 'mean', 'm2', 'minimum', 'maximum', 'quantiles')
+    
+    def __init__(self, quantiles=(0.25, 0.5, 0.75)):
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.quantiles = {q: P2Quantile(q) for q in quantiles}
+    
+    def add(self, x):
+        self.count += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.minimum is None or x < self.minimum:
+            self.minimum = x
+        if self.maximum is None or x > self.maximum:
+            self.maximum = x
+        for estimator in self.quantiles.values():
+            estimator.add(x)
+    
+    def std(self):
+        """Desvio padrão amostral (ddof=1, como o pandas); NaN com menos de 2 valores"""
+        if self.count < 2:
+            return float('nan')
+        return math.sqrt(self.m2 / (self.count - 1))
+    
+    def quantile(self, q):
+        return self.quantiles[q].value()
+
+
+class RatioEstimator:
+    """
+    Estimador de razão para amostragem aleatória simples sem reposição
+    
+    Estima o total de y na população (ex.: ocorrências de uma palavra) a partir
+    de uma variável auxiliar x de total conhecido (ex.: bytes de cada unidade),
+    com intervalo de confiança pela aproximação normal e correção de população
+    finita. As somas são acumuladas em O(1) por unidade amostrada.
+    """
+    
+    __slots__ = ('count', 'sum_x', 'sum_y', 'sum_xx', 'sum_xy', 'sum_yy')
+    
+    def __init__(self):
+        self.count = 0
+        self.sum_x = 0
+        self.sum_y = 0
+        self.sum_xx = 0
+        self.sum_xy = 0
+        self.sum_yy = 0
+    
+    def add(self, x, y):
+        self.count += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xx += x * x
+        self.sum_xy += x * y
+        self.sum_yy += y * y
+    
+    def interval(self, population_count, population_x, confidence=0.95):
+        """
+        (estimativa, limite inferior, limite superior) do total de y
+        
+        Com toda a população amostrada o resultado é exato. Se y ainda não foi
+        observado, o limite superior usa a regra de três (menos de 3 ocorrências
+        no volume já lido).
+        """
+        n = self.count
+        if n >= population_count:
+            return self.sum_y, self.sum_y, self.sum_y
+        if n == 0 or self.sum_x == 0:
+            return 0.0, 0.0, float('inf')
+        
+        scale = population_x / self.sum_x
+        estimate = self.sum_y * scale
+        if self.sum_y == 0:
+            return 0.0, 0.0, 3 * scale
+        if n < 2:
+            return estimate, self.sum_y, float('inf')
+        
+        ratio = self.sum_y / self.sum_x
+        residual = (self.sum_yy - 2 * ratio * self.sum_xy + ratio * ratio * self.sum_xx) / (n - 1)
+        error = population_count * math.sqrt((1 - n / population_count) * max(residual, 0.0) / n)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        # O total nunca é menor do que o já observado na amostra
+        return estimate, max(estimate - z * error, self.sum_y), estimate + z * error
+
+
+def log_likelihood(count_a, count_b, total_a, total_b):
+    """
+    Log-verossimilhança G² (Rayson & Garside) da diferença de frequência de um
+    termo entre dois corpora de total_a e total_b tokens
+    
+    Com 1 grau de liberdade: 3,84 ~ p < 0,05; 10,83 ~ p < 0,001.
+    """
+    expected_a = total_a * (count_a + count_b) / (total_a + total_b)
+    expected_b = total_b * (count_a + count_b) / (total_a + total_b)
+    g2 = 0.0
+    if count_a:
+        g2 += count_a * math.log(count_a / expected_a)
+    if count_b:
+        g2 += count_b * math.log(count_b / expected_b)
+    return 2 * g2
+
+
+def log_ratio(count_a, count_b, total_a, total_b, smoothing=0.5):
+    """
+    Log-ratio (Hardie): log2 da razão entre as frequências relativas do termo
+    em A e em B; cada unidade dobra a diferença. Contagens zero recebem
+    smoothing para o valor ficar finito.
+    """
+    return math.log2(((count_a or smoothing) / total_a) / ((count_b or smoothing) / total_b))
+
+
+def chi2_p_value(statistic):
+    """Valor-p de uma estatística qui-quadrado com 1 grau de liberdade"""
+    return math.erfc(math.sqrt(max(statistic, 0.0) / 2))
+
@@ -0,0 +1,343 @@
+"""Gráficos (matplotlib/seaborn) sobre os resultados do analisador"""
+import gc
+import math
+
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+# Acima de SCALABLE_FILES arquivos, os gráficos por arquivo entram no modo
+# escalável: arquivos ordenados por semelhança, agrupados em faixas quando não
+# cabem na largura da figura, sem rótulos por célula/barra e malha rasterizada
+SCALABLE_FILES = 40
+# Pixels mínimos por coluna de arquivo no mapa de calor
+HEATMAP_PIXELS_PER_FILE = 4
+# Máximo de células com valor escrito e de barras com rótulo
+ANNOTATION_LIMIT = 300
+# Arquivos no gráfico de barras do modo escalável (os de maior frequência)
+MAX_BAR_FILES = 40
+
+
+def order_files_by_similarity(matrix_df):
+    """
+    Ordena as colunas (arquivos) de uma matriz palavras x arquivos pela
+    semelhança dos perfis de frequência
+
+    Cada perfil é normalizado (proporção entre as palavras, não o volume) e
+    projetado nas duas componentes principais; a ordem pelo ângulo na
+    projeção deixa perfis parecidos lado a lado. Arquivos sem nenhuma
+    ocorrência ficam no fim.
+    """
+    values = matrix_df.to_numpy(dtype=float).T
+    if values.shape[0] < 3 or values.shape[1] == 0:
+        return matrix_df
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    profiles = np.divide(values, norms, out=np.zeros_like(values), where=norms > 0)
+    centered = profiles - profiles.mean(axis=0)
+    u, s, _ = np.linalg.svd(centered, full_matrices=False)
+    # Arredondar evita que ruído numérico separe perfis idênticos
+    coords = np.round(u * s, 9)
+    if len(s) >= 2 and coords[:, 1].any():
+        angle = np.arctan2(coords[:, 1], coords[:, 0])
+    else:
+        angle = coords[:, 0]
+    order = np.lexsort((angle, norms.ravel() == 0))
+    return matrix_df.iloc[:, order]
+
+
+def bin_files(matrix_df, max_files):
+    """
+    Agrupa colunas consecutivas (arquivos) em faixas de tamanho igual, pela
+    média, quando há mais colunas que max_files
+
+    Returns:
+        (matriz com no máximo max_files colunas, arquivos por faixa)
+    """
+    n_files = matrix_df.shape[1]
+    if n_files <= max_files:
+        return matrix_df, 1
+    size = math.ceil(n_files / max_files)
+    groups = np.arange(n_files) // size
+    binned = matrix_df.T.groupby(groups).mean().T
+    names = list(matrix_df.columns)
+    binned.columns = [f"{names[start]} (+{min(size, n_files - start) - 1})" for start in range(0, n_files, size)]
+    return binned, size
+
+
+def _draw_file_heatmap(matrix_df, title, xlabel, ylabel, figsize, scalable=None):
+    """
+    Desenha um mapa de calor palavras x arquivos
+
+    Args:
+        scalable: True/False força o modo escalável; None liga acima de
+            SCALABLE_FILES arquivos. O custo de desenho fica limitado pela
+            largura da figura, não pelo número de arquivos.
+    """
+    n_files = matrix_df.shape[1]
+    if scalable is None:
+        scalable = n_files > SCALABLE_FILES
+    options = {'annot': True, 'fmt': 'g'}
+    if scalable:
+        max_files = max(1, int(figsize[0] * plt.rcParams['figure.dpi'] / HEATMAP_PIXELS_PER_FILE))
+        matrix_df, size = bin_files(order_files_by_similarity(matrix_df), max_files)
+        if size > 1:
+            title = f"{title}\n({n_files} arquivos em faixas de {size}, média por faixa)"
+        options = {'annot': matrix_df.size <= ANNOTATION_LIMIT, 'fmt': '.3g', 'rasterized': True,
+                   'xticklabels': 'auto'}
+
+    plt.figure(figsize=figsize)
+    sns.heatmap(matrix_df, cmap='YlOrRd', cbar_kws={'label': 'Frequência'}, **options)
+    plt.title(title, fontsize=14, fontweight='bold')
+    plt.xlabel(xlabel, fontsize=12)
+    plt.ylabel(ylabel, fontsize=12)
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_frequency_bar(analyzer, figsize=(12, 6), title="Frequência de Palavras", horizontal=True):
+    """Cria gráfico de barras da frequência das palavras com valores exibidos"""
+    df = analyzer.create_frequency_dataframe()
+    if df.empty:
+        print("✗ Erro: Nenhum dado para plotar!")
+        return
+
+    try:
+        # Fechar figuras anteriores para evitar vazamento de memória
+        plt.close('all')
+        plt.figure(figsize=figsize)
+
+        if len(analyzer.texts) == 1:
+            # Se há apenas um texto, mostra frequência simples
+            word_totals = df.groupby('palavra')['frequencia'].sum().sort_values(ascending=False)
+
+            if horizontal:
+                bars = plt.barh(word_totals.index, word_totals.values)
+                # Adicionar valores nas barras
+                for bar, value in zip(bars, word_totals.values):
+                    plt.text(value + 0.1, bar.get_y() + bar.get_height()/2,
+                            str(value), ha='left', va='center', fontweight='bold')
+                plt.xlabel('Frequência')
+                plt.ylabel('Palavras')
+            else:
+                bars = plt.bar(word_totals.index, word_totals.values)
+                # Adicionar valores nas barras
+                for bar, value in zip(bars, word_totals.values):
+                    plt.text(bar.get_x() + bar.get_width()/2, value + 0.1,
+                            str(value), ha='center', va='bottom', fontweight='bold')
+                plt.xlabel('Palavras')
+                plt.ylabel('Frequência')
+                plt.xticks(rotation=45)
+
+            plt.title(title, fontsize=14, fontweight='bold')
+        else:
+            # Se há múltiplos textos, mostra comparação
+            pivot_df = df.pivot(index='palavra', columns='fonte', values='frequencia').fillna(0)
+
+            if horizontal:
+                ax = pivot_df.plot(kind='barh', figsize=figsize)
+                # Adicionar valores nas barras
+                for container in ax.containers:
+                    ax.bar_label(container, fmt='%g', padding=3)
+                plt.xlabel('Frequência')
+                plt.ylabel('Palavras')
+            else:
+                ax = pivot_df.plot(kind='bar', figsize=figsize)
+                # Adicionar valores nas barras
+                for container in ax.containers:
+                    ax.bar_label(container, fmt='%g', padding=3)
+                plt.xlabel('Palavras')
+                plt.ylabel('Frequência')
+                plt.xticks(rotation=45)
+
+            plt.title(title, fontsize=14, fontweight='bold')
+            plt.legend(title='Fonte', bbox_to_anchor=(1.05, 1), loc='upper left')
+
+        plt.tight_layout()
+        plt.show()
+
+        # Força garbage collection para liberar memória
+        gc.collect()
+
+    except Exception as e:
+        print(f"✗ Erro ao criar gráfico: {e}")
+        plt.close('all')
+
+
+def plot_individual_comparison(analyzer, target_words, case_sensitive=False, figsize=(15, 8), with_heatmap=False,
+                               individual_results=None, title='Frequência de Palavras por Arquivo', scalable=None):
+    """
+    Cria gráfico comparando palavras entre diferentes arquivos
+
+    Args:
+        with_heatmap: se True, desenha também o mapa de calor palavras x arquivos
+        individual_results: resultados já calculados (ex.: um perfil de
+            analyze_profiles); se None, executa analyze_individual_files
+        scalable: modo escalável (None = automático acima de SCALABLE_FILES
+            arquivos): as barras mostram só os MAX_BAR_FILES arquivos de maior
+            frequência e o mapa de calor cobre todos (ver _draw_file_heatmap)
+    """
+    import pandas as pd
+
+    if len(analyzer.texts) <= 1:
+        print("Comparação individual requer múltiplos textos.")
+        return
+
+    if individual_results is None:
+        individual_results = analyzer.analyze_individual_files(target_words, case_sensitive)
+
+    # Preparar dados para o gráfico
+    data_for_plot = []
+    for arquivo, dados in individual_results.items():
+        for palavra in target_words:
+            freq = dados['palavras_encontradas'].get(palavra, 0)
+            data_for_plot.append({
+                'Arquivo': arquivo,
+                'Palavra': palavra,
+                'Frequência': freq
+            })
+
+    df_plot = pd.DataFrame(data_for_plot)
+
+    try:
+        plt.close('all')
+
+        # Criar gráfico
+        plt.figure(figsize=figsize)
+
+        # Gráfico de barras agrupadas
+        pivot_df = df_plot.pivot(index='Arquivo', columns='Palavra', values='Frequência').fillna(0)
+        if scalable is None:
+            scalable = len(pivot_df) > SCALABLE_FILES
+        bar_df = pivot_df
+        bar_title = title
+        if scalable and len(pivot_df) > MAX_BAR_FILES:
+            bar_df = pivot_df.loc[pivot_df.sum(axis=1).nlargest(MAX_BAR_FILES).index]
+            bar_title = f"{title}\n({MAX_BAR_FILES} de {len(pivot_df)} arquivos, maior frequência)"
+        ax = bar_df.plot(kind='bar', figsize=figsize, width=0.8)
+
+        # Adicionar valores nas barras
+        if bar_df.size <= ANNOTATION_LIMIT:
+            for container in ax.containers:
+                ax.bar_label(container, fmt='%g', padding=3)
+
+        plt.title(bar_title, fontsize=16, fontweight='bold')
+        plt.xlabel('Arquivos', fontsize=12)
+        plt.ylabel('Frequência', fontsize=12)
+        plt.xticks(rotation=45, ha='right')
+        plt.legend(title='Palavras', bbox_to_anchor=(1.05, 1), loc='upper left')
+        plt.tight_layout()
+        plt.show()
+
+        # Gráfico de heatmap
+        if with_heatmap:
+            _draw_file_heatmap(pivot_df.T, 'Mapa de Calor - Distribuição de Palavras por Arquivo',
+                               'Arquivos', 'Palavras', (12, 8), scalable)
+
+        gc.collect()
+
+    except Exception as e:
+        print(f"✗ Erro ao criar gráfico: {e}")
+        plt.close('all')
+
+
+def plot_frequency_heatmap(analyzer, figsize=(10, 6), scalable=None):
+    """
+    Cria um heatmap da frequência das palavras (útil para múltiplos textos)
+
+    Args:
+        scalable: modo escalável para muitos arquivos (ver _draw_file_heatmap)
+    """
+    if len(analyzer.texts) <= 1:
+        print("Heatmap requer múltiplos textos para comparação.")
+        return
+
+    df = analyzer.create_frequency_dataframe()
+    if df.empty:
+        print("✗ Erro: Nenhum dado para plotar!")
+        return
+
+    try:
+        plt.close('all')
+        pivot_df = df.pivot(index='palavra', columns='fonte', values='frequencia').fillna(0)
+        _draw_file_heatmap(pivot_df, 'Mapa de Calor - Frequência de Palavras por Fonte', 'Fonte', 'Palavras',
+                           figsize, scalable)
+
+        gc.collect()
+
+    except Exception as e:
+        print(f"✗ Erro ao criar heatmap: {e}")
+        plt.close('all')
+
+
+def plot_keyness(comparison, top=15, figsize=(10, 8)):
+    """
+    Gráfico de barras divergentes com o log-ratio dos termos mais
+    característicos de cada corpus (contraste.keyness), ordenados pela
+    log-verossimilhança
+    """
+    name_a, name_b = comparison['corpus_a'], comparison['corpus_b']
+    terms_a = [item for item in comparison['termos'] if item['favorece'] == name_a][:top]
+    terms_b = [item for item in comparison['termos'] if item['favorece'] == name_b][:top]
+    terms = terms_a + terms_b
+    if not terms:
+        print("✗ Erro: Nenhum dado para plotar!")
+        return
+
+    try:
+        plt.close('all')
+        # Mais característico de A no topo, de B embaixo
+        terms = sorted(terms, key=lambda item: item['log_ratio'])
+        colors = ['#c0392b' if item['favorece'] == name_a else '#2471a3' for item in terms]
+        plt.figure(figsize=figsize)
+        plt.barh([item['termo'] for item in terms], [item['log_ratio'] for item in terms], color=colors)
+        plt.axvline(0, color='black', linewidth=0.8)
+        plt.title(f'Termos Característicos - {name_a} x {name_b}', fontsize=14, fontweight='bold')
+        plt.xlabel(f'Log-ratio (> 0: mais frequente em {name_a}; < 0: em {name_b})', fontsize=12)
+        plt.ylabel('Termos', fontsize=12)
+        plt.tight_layout()
+        plt.show()
+
+        gc.collect()
+
+    except Exception as e:
+        print(f"✗ Erro ao criar gráfico: {e}")
+        plt.close('all')
+
+
+def plot_cooccurrence_heatmap(analyzer, target_words, window=10, mode='janela', case_sensitive=False, figsize=(10, 8)):
+    """
+    Cria um heatmap de co-ocorrência entre as palavras-alvo
+
+    Args:
+        mode: 'janela' (distância em tokens) ou 'sentenca' (mesma sentença)
+    """
+    if len(target_words) < 2:
+        print("Co-ocorrência requer pelo menos duas palavras.")
+        return
+
+    results = analyzer.analyze_cooccurrence(target_words, window, case_sensitive)
+    matrix_df = results[mode].to_dataframe()
+
+    if mode == 'janela':
+        title = f'Mapa de Calor - Co-ocorrência (janela de {window} tokens)'
+    else:
+        title = 'Mapa de Calor - Co-ocorrência na mesma Sentença'
+
+    try:
+        plt.close('all')
+        plt.figure(figsize=figsize)
+        sns.heatmap(matrix_df, annot=True, cmap='YlOrRd', fmt='g', square=True,
+                    cbar_kws={'label': 'Co-ocorrências'})
+        plt.title(title, fontsize=14, fontweight='bold')
+        plt.xlabel('Palavras', fontsize=12)
+        plt.ylabel('Palavras', fontsize=12)
+        plt.tight_layout()
+        plt.show()
+
+        gc.collect()
+
+    except Exception as e:
+        print(f"✗ Erro ao criar heatmap: {e}")
+        plt.close('all')
+
+    return results
@@ -0,0 +1,286 @@
+"""Estruturas compactas do índice: vocabulário, contagens por documento e posições"""
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+
+class Vocabulary:
+    """
+    Vocabulário compartilhado que mapeia cada token distinto para um id inteiro
+    
+    Cada string é guardada uma única vez para todo o corpus; as contagens por
+    documento referenciam apenas os ids.
+    """
+    
+    def __init__(self, tokens=None):
+        self._tokens = list(tokens) if tokens is not None else []
+        self._ids = {token: term_id for term_id, token in enumerate(self._tokens)}
+        self._blob = None
+    
+    @classmethod
+    def from_blob(cls, blob):
+        """
+        Vocabulário a partir de um blob UTF-8 com um token por linha (formato do
+        snapshot). A decodificação só acontece no primeiro acesso.
+        """
+        vocabulary = cls()
+        vocabulary._blob = blob
+        return vocabulary
+    
+    def _materialize(self):
+        blob, self._blob = self._blob, None
+        if len(blob):
+            self._tokens = bytes(blob).decode('utf-8').split('\n')
+            self._ids = {token: term_id for term_id, token in enumerate(self._tokens)}
+    
+    @property
+    def tokens(self):
+        if self._blob is not None:
+            self._materialize()
+        return self._tokens
+    
+    @property
+    def ids(self):
+        if self._blob is not None:
+            self._materialize()
+        return self._ids
+    
+    def add(self, token):
+        """Retorna o id do token, cadastrando-o se ainda não existir"""
+        term_id = self.ids.get(token)
+        if term_id is None:
+            term_id = len(self.tokens)
+            self.ids[token] = term_id
+            self.tokens.append(token)
+        return term_id
+    
+    def add_all(self, tokens):
+        """
+        Ids de uma sequência de tokens (array na mesma ordem), cadastrando os
+        novos em lote, na ordem em que aparecem
+        """
+        ids = self.ids
+        table = self.tokens
+        new = [token for token in dict.fromkeys(tokens) if token not in ids]
+        ids.update(zip(new, range(len(table), len(table) + len(new))))
+        table.extend(new)
+        return array('I', map(ids.__getitem__, tokens))
+    
+    def get(self, token, default=None):
+        """Retorna o id do token ou default se ele nunca apareceu"""
+        return self.ids.get(token, default)
+    
+    def __getitem__(self, term_id):
+        return self.tokens[term_id]
+    
+    def __len__(self):
+        return len(self.tokens)
+
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _mix64(x):
+    """Finalizador do splitmix64: espalha os bits de um inteiro de 64 bits"""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class PresenceFilter:
+    """
+    Filtro de Bloom com os ids presentes em um documento
+    
+    Responde "talvez contém" ou "certamente não contém" sem tocar nas
+    contagens, que podem estar em runs no disco ou mapeadas de um snapshot.
+    Com 8 bits por termo e 3 hashes, cerca de 3% dos documentos sem o termo
+    ainda passam pelo filtro (e são conferidos nas contagens exatas). O
+    tamanho é uma potência de 2, então as posições de um id (probes) são
+    calculadas uma vez e servem para filtros de qualquer tamanho.
+    """
+    
+    __slots__ = ('bits', 'mask')
+    
+    HASHES = 3
+    BITS_PER_TERM = 8
+    
+    def __init__(self, bits):
+        self.bits = bits
+        self.mask = len(bits) * 8 - 1
+    
+    @classmethod
+    def probes(cls, term_id):
+        """Hashes de 64 bits das posições de um id (double hashing)"""
+        h1 = _mix64(term_id + 1)
+        h2 = _mix64(h1) | 1
+        return tuple((h1 + i * h2) & _MASK64 for i in range(cls.HASHES))
+    
+    @classmethod
+    def from_ids(cls, ids, probe_cache=None):
+        """
+        Monta o filtro dos ids de um documento
+        
+        Args:
+            probe_cache: dicionário id -> probes reaproveitado entre documentos
+        """
+        size = 64
+        while size < len(ids) * cls.BITS_PER_TERM:
+            size *= 2
+        bits = bytearray(size // 8)
+        mask = size - 1
+        if probe_cache is None:
+            probe_cache = {}
+        probes = cls.probes
+        for term_id in ids:
+            term_probes = probe_cache.get(term_id)
+            if term_probes is None:
+                term_probes = probe_cache[term_id] = probes(term_id)
+            for probe in term_probes:
+                position = probe & mask
+                bits[position >> 3] |= 1 << (position & 7)
+        return cls(bits)
+    
+    def may_contain(self, term_probes):
+        """False se o id (dado pelas suas probes) certamente não está no documento"""
+        bits, mask = self.bits, self.mask
+        for probe in term_probes:
+            position = probe & mask
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+        return True
+    
+    def __len__(self):
+        return len(self.bits)
+
+
+class DocumentCounts:
+    """
+    Contagens compactas de um documento: dois arrays('I') paralelos (ids
+    ordenados e contagens), em vez de um Counter com chaves string
+    
+    Contagens despejadas em disco ou lidas de um snapshot podem trazer um
+    PresenceFilter (presence): ids que ele descarta contam 0 sem que os
+    arrays mapeados sejam lidos.
+    """
+    
+    __slots__ = ('ids', 'counts', 'total', 'presence', '__weakref__')
+    
+    def __init__(self, ids, counts, total, presence=None):
+        self.ids = ids
+        self.counts = counts
+        self.total = total
+        self.presence = presence
+    
+    @classmethod
+    def from_tokens(cls, tokens, vocabulary):
+        """Conta uma sequência de tokens e converte o resultado para ids do vocabulário"""
+        return cls.from_counter(Counter(tokens), vocabulary)
+    
+    @classmethod
+    def from_counter(cls, raw_counts, vocabulary):
+        """Converte um Counter de tokens (ex.: vindo de um worker) para ids do vocabulário"""
+        pairs = sorted((vocabulary.add(token), count) for token, count in raw_counts.items())
+        ids = array('I', [term_id for term_id, _ in pairs])
+        counts = array('I', [count for _, count in pairs])
+        return cls(ids, counts, sum(counts))
+    
+    @classmethod
+    def from_sequence(cls, sequence):
+        """Conta uma sequência de ids já convertidos (ex.: PositionalIndex.sequence)"""
+        pairs = sorted(Counter(sequence).items())
+        ids = array('I', [term_id for term_id, _ in pairs])
+        counts = array('I', [count for _, count in pairs])
+        return cls(ids, counts, len(sequence))
+    
+    @classmethod
+    def from_id_counts(cls, id_counts):
+        """Converte um Counter de ids (ex.: soma de várias contagens) para arrays ordenados"""
+        pairs = sorted(id_counts.items())
+        ids = array('I', [term_id for term_id, _ in pairs])
+        counts = array('I', [count for _, count in pairs])
+        return cls(ids, counts, sum(counts))
+    
+    def slot(self, term_id):
+        """Posição do id nos arrays ordenados, ou -1 se ele não ocorre no documento"""
+        pos = bisect_left(self.ids, term_id)
+        if pos < len(self.ids) and self.ids[pos] == term_id:
+            return pos
+        return -1
+    
+    def get(self, term_id):
+        """Contagem de um id (busca binária sobre os ids ordenados)"""
+        presence = self.presence
+        if presence is not None and not presence.may_contain(_probes(term_id)):
+            return 0
+        pos = self.slot(term_id)
+        return self.counts[pos] if pos >= 0 else 0
+    
+    def frequency(self, term_ids):
+        """Soma das contagens de um grupo de ids (ex.: variantes de uma palavra)"""
+        return sum(self.get(term_id) for term_id in term_ids)
+    
+    def remap(self, table):
+        """
+        Contagens com os ids traduzidos por uma tabela (ex.: vocabulário de um
+        worker ou fragmento -> vocabulário global), reordenadas pelo novo id
+        """
+        by_id = dict(zip(map(table.__getitem__, self.ids), self.counts))
+        ids = array('I', sorted(by_id))
+        return DocumentCounts(ids, array('I', map(by_id.__getitem__, ids)), self.total)
+    
+    def items(self):
+        """Pares (id, contagem) em ordem crescente de id"""
+        return zip(self.ids, self.counts)
+    
+    def __len__(self):
+        return len(self.ids)
+
+
+# Probes dos ids consultados: as mesmas palavras-alvo são testadas em todos os documentos
+_PROBE_CACHE = {}
+
+
+def _probes(term_id):
+    term_probes = _PROBE_CACHE.get(term_id)
+    if term_probes is None:
+        if len(_PROBE_CACHE) > 100000:
+            _PROBE_CACHE.clear()
+        term_probes = _PROBE_CACHE[term_id] = PresenceFilter.probes(term_id)
+    return term_probes
+
+
+class PositionalIndex:
+    """
+    Índice posicional de um documento
+    
+    Guarda a sequência de ids dos tokens e, para cada termo, suas posições em
+    ordem crescente (layout CSR: as posições de todos os termos ficam em um único
+    array, agrupadas na mesma ordem dos ids de DocumentCounts).
+    """
+    
+    __slots__ = ('sequence', 'positions', 'starts')
+    
+    def __init__(self, sequence, positions, starts):
+        self.sequence = sequence
+        self.positions = positions
+        self.starts = starts
+    
+    @classmethod
+    def build(cls, sequence, counts):
+        """Monta as listas de posições a partir da sequência e das contagens do documento"""
+        starts = array('I', [0])
+        for count in counts.counts:
+            starts.append(starts[-1] + count)
+        
+        slots = {term_id: slot for slot, term_id in enumerate(counts.ids)}
+        cursor = array('I', starts[:-1])
+        positions = array('I', bytes(4 * len(sequence)))
+        for position, term_id in enumerate(sequence):
+            slot = slots[term_id]
+            positions[cursor[slot]] = position
+            cursor[slot] += 1
+        return cls(sequence, positions, starts)
+    
+    def term_positions(self, slot):
+        """Posições (crescentes) do termo guardado no slot de DocumentCounts"""
+        return self.positions[self.starts[slot]:self.starts[slot + 1]]
@@ -0,0 +1,165 @@
+"""Orçamento de memória: estimativa por documento e runs despejados em disco"""
+import os
+import sys
+import mmap
+import tempfile
+import weakref
+from array import array
+from pathlib import Path
+
+from .indice import DocumentCounts, PresenceFilter
+from .snapshot import _little_endian
+
+
+def resident_bytes(text_data):
+    """
+    Estimativa da memória própria de um registro de texto: texto original,
+    contagens (do documento e por seção), filtros de presença e índice
+    posicional (arrays mapeados de disco não contam)
+    """
+    size = 0
+    if text_data.get('text') is not None:
+        size += sys.getsizeof(text_data['text'])
+    counts = text_data.get('counts')
+    all_counts = [counts] if counts is not None else []
+    all_counts.extend(text_data.get('sections', {}).values())
+    for document_counts in all_counts:
+        if isinstance(document_counts.ids, array):
+            size += (len(document_counts.ids) + len(document_counts.counts)) * document_counts.ids.itemsize
+        if document_counts.presence is not None and isinstance(document_counts.presence.bits, bytearray):
+            size += len(document_counts.presence)
+    positions = text_data.get('positions')
+    if positions is not None:
+        size += (len(positions.sequence) + len(positions.positions) + len(positions.starts)) * 4
+    return size
+
+
+class SpillStore:
+    """
+    Runs em disco com as contagens de documentos despejados da memória
+    
+    Cada run é um arquivo com os arrays (ids ordenados, contagens) de vários
+    documentos; depois de gravado ele é mapeado com mmap, então as contagens
+    continuam consultáveis sem ocupar memória do processo. Junto dos arrays
+    vai o PresenceFilter do documento, também mapeado: consultas por termos
+    ausentes não leem as contagens, e os filtros não ocupam o orçamento.
+    
+    Cada mmap mantém um descritor de arquivo aberto, então os runs não se
+    acumulam: como em uma árvore LSM, um run novo do tamanho do anterior é
+    juntado a ele (ficam O(log n) runs abertos) e compact() junta todos em um
+    único run no fim da carga. Os documentos são reapontados no lugar para o
+    run novo; os que já saíram do corpus são descartados na junção.
+    """
+    
+    # Dois runs são juntados quando o mais antigo tem até MERGE_RATIO vezes o tamanho do novo
+    MERGE_RATIO = 2
+    
+    def __init__(self, directory=None):
+        self._tempdir = tempfile.TemporaryDirectory(prefix='tfa_spill_', dir=directory)
+        self.directory = Path(self._tempdir.name)
+        self.bytes_written = 0
+        # Runs abertos, do mais antigo ao mais novo: {'path', 'map', 'size', 'documents'}
+        self._runs = []
+        self._next_run = 0
+    
+    @property
+    def runs(self):
+        """Número de runs em disco (cada um com um mmap aberto)"""
+        return len(self._runs)
+    
+    def spill(self, documents):
+        """
+        Grava as contagens de uma lista de DocumentCounts em um novo run
+        
+        Os documentos passam a apontar para o arquivo mapeado (no lugar, sem
+        criar objetos novos), e o run pode ser juntado aos anteriores.
+        
+        Returns:
+            a mesma lista de documentos
+        """
+        run = self._write_run(documents)
+        if run is not None:
+            self.bytes_written += run['size']
+            self._runs.append(run)
+            while (len(self._runs) >= 2
+                   and self._runs[-2]['size'] <= self.MERGE_RATIO * self._runs[-1]['size']):
+                self._merge(self._runs[-2:])
+        return documents
+    
+    def compact(self):
+        """Junta todos os runs em um único arquivo (agregação final)"""
+        if len(self._runs) > 1:
+            self._merge(list(self._runs))
+    
+    def _write_run(self, documents):
+        """
+        Grava os arrays e o filtro de presença dos documentos em um arquivo
+        novo, mapeia e reaponta os documentos
+        """
+        path = self.directory / f"run_{self._next_run:05d}.bin"
+        self._next_run += 1
+        layout = []
+        probe_cache = {}
+        with open(path, 'wb') as file:
+            for counts in documents:
+                offset = file.tell()
+                file.write(_little_endian(array('I', counts.ids)))
+                file.write(_little_endian(array('I', counts.counts)))
+                presence = counts.presence
+                if presence is None:
+                    presence = PresenceFilter.from_ids(counts.ids, probe_cache)
+                file.write(presence.bits)
+                layout.append((counts, offset, len(counts), len(presence)))
+            size = file.tell()
+        
+        if size == 0:
+            path.unlink()
+            return None
+        
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(buffer)
+        for counts, offset, length, filter_size in layout:
+            ids = view[offset:offset + 4 * length]
+            values = view[offset + 4 * length:offset + 8 * length]
+            if sys.byteorder == 'little':
+                ids, values = ids.cast('I'), values.cast('I')
+            else:
+                ids, values = array('I', ids), array('I', values)
+                ids.byteswap()
+                values.byteswap()
+            counts.ids, counts.counts = ids, values
+            counts.presence = PresenceFilter(view[offset + 8 * length:offset + 8 * length + filter_size])
+        return {'path': path, 'map': buffer, 'size': size,
+                'documents': [weakref.ref(layout_entry[0]) for layout_entry in layout]}
+    
+    def _merge(self, runs):
+        """Substitui runs consecutivos por um único run com os documentos ainda vivos"""
+        documents = [counts for run in runs for ref in run['documents'] for counts in [ref()]
+                     if counts is not None]
+        merged = self._write_run(documents)
+        position = self._runs.index(runs[0])
+        self._runs[position:position + len(runs)] = [merged] if merged is not None else []
+        for run in runs:
+            self._release(run)
+    
+    @staticmethod
+    def _release(run):
+        """Fecha o mapeamento de um run substituído e apaga o arquivo"""
+        run['documents'] = []
+        try:
+            run['map'].close()
+        except BufferError:
+            # Ainda há fatias em uso fora do analisador: o mmap fecha quando forem liberadas
+            pass
+        try:
+            os.remove(run['path'])
+        except OSError:
+            pass
+    
+    def cleanup(self):
+        """Remove os runs do disco"""
+        for run in self._runs:
+            self._release(run)
+        self._runs = []
+        self._tempdir.cleanup()
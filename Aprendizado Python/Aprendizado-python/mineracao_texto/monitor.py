@@ -0,0 +1,159 @@
+"""Modo monitorado: varredura periódica de uma pasta com lotes em paralelo"""
+import os
+import time
+from pathlib import Path
+
+from .paralelo import count_files
+
+
+class FolderWatcher:
+    """
+    Monitora uma pasta e mantém as contagens e a exportação atualizadas
+    
+    Usa varredura periódica (os.scandir com mtime/tamanho), que funciona em
+    qualquer sistema sem serviços externos. Mudanças são agrupadas com debounce:
+    uma rajada de arquivos copiados vira um único lote, contado em paralelo por
+    um pool de processos que devolve as contagens em memória compartilhada.
+    """
+    
+    def __init__(self, analyzer, folder_path, target_words, export_path="resultados_monitorados.csv",
+                 interval=2.0, debounce=1.0, workers=4, file_extensions=None, encoding='utf-8',
+                 keep_texts=False):
+        """
+        Args:
+            analyzer: TextFrequencyAnalyzer que recebe os documentos
+            folder_path: pasta monitorada
+            target_words: palavras analisadas a cada lote
+            export_path: arquivo .csv ou .parquet reescrito após cada lote
+            interval: segundos entre varreduras
+            debounce: segundos sem novas mudanças antes de processar o lote
+            workers: processos de contagem (1 = na própria thread)
+            file_extensions: extensões aceitas (None = todas)
+            keep_texts: se True, guarda o texto original (co-ocorrência, n-gramas)
+        """
+        self.analyzer = analyzer
+        self.folder_path = Path(folder_path)
+        self.target_words = target_words
+        self.export_path = export_path
+        self.interval = interval
+        self.debounce = debounce
+        self.workers = workers
+        self.file_extensions = file_extensions
+        self.encoding = encoding
+        self.keep_texts = keep_texts
+        self.signatures = {}
+        self.batches = 0
+    
+    def scan(self):
+        """Assinatura (mtime, tamanho) de cada arquivo da pasta"""
+        signatures = {}
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if self.file_extensions and Path(entry.name).suffix not in self.file_extensions:
+                    continue
+                stat = entry.stat()
+                signatures[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+    
+    def poll(self):
+        """Arquivos novos/modificados e removidos desde a última varredura"""
+        current = self.scan()
+        changed = [path for path, signature in current.items() if self.signatures.get(path) != signature]
+        removed = [path for path in self.signatures if path not in current]
+        return current, changed, removed
+    
+    def wait_for_batch(self):
+        """
+        Espera até haver mudanças e a pasta ficar estável por `debounce` segundos
+        
+        Returns:
+            (assinaturas, alterados, removidos) do lote
+        """
+        current, changed, removed = self.poll()
+        while not changed and not removed:
+            time.sleep(self.interval)
+            current, changed, removed = self.poll()
+        
+        # Debounce: enquanto a pasta continuar mudando, o lote cresce
+        while True:
+            time.sleep(self.debounce)
+            latest = self.scan()
+            if latest == current:
+                break
+            current = latest
+        
+        changed = [path for path, signature in current.items() if self.signatures.get(path) != signature]
+        removed = [path for path in self.signatures if path not in current]
+        return current, changed, removed
+    
+    def process_batch(self, signatures, changed, removed):
+        """Conta os arquivos alterados, atualiza o analisador e reexporta"""
+        analyzer = self.analyzer
+        by_path = {text_data.get('path'): text_data for text_data in analyzer.texts}
+        
+        results = count_files(changed, analyzer.vocabulary, self.encoding, self.workers, self.keep_texts)
+        
+        added = updated = unchanged = 0
+        removed_set = set(removed)
+        for path, _, digest, counts, text in results:
+            if digest is None:
+                print(f"✗ Erro ao ler {Path(path).name}; será tentado no próximo lote")
+                signatures.pop(path, None)
+                continue
+            existing = by_path.get(path)
+            if existing is not None and existing.get('sha1') == digest:
+                unchanged += 1
+                continue
+            if counts is None or not counts.total:
+                # Esvaziado ou trocado por conteúdo que não é texto: sai do corpus
+                if existing is not None:
+                    removed_set.add(path)
+                continue
+            text_data = existing if existing is not None else {'source': Path(path).stem, 'path': path}
+            for stale in ('positions', 'sections', 'section_stats'):
+                text_data.pop(stale, None)
+            text_data['text'] = text
+            text_data['counts'] = counts
+            text_data['sha1'] = digest
+            if existing is None:
+                analyzer.texts.append(text_data)
+                added += 1
+            else:
+                updated += 1
+        
+        if removed_set:
+            analyzer.texts = [text_data for text_data in analyzer.texts if text_data.get('path') not in removed_set]
+        
+        self.signatures = signatures
+        self.batches += 1
+        print(f"\n🔄 Lote {self.batches}: {added} novo(s), {updated} alterado(s), "
+              f"{len(removed_set)} removido(s), {unchanged} sem mudança no conteúdo"
+              f" | {len(analyzer.texts)} documento(s) no total")
+        
+        if analyzer.texts:
+            analyzer.analyze_frequency(self.target_words)
+            print(analyzer.get_summary_stats()[['Total', 'Média', 'Máximo']])
+            if self.export_path:
+                analyzer.export_results(self.target_words, self.export_path)
+        else:
+            analyzer.word_frequencies = {}
+            analyzer.running_stats = {}
+    
+    def run(self, max_batches=None):
+        """
+        Loop principal: processa o conteúdo atual e depois cada novo lote, até
+        Ctrl+C (ou até max_batches lotes)
+        """
+        print(f"👀 Monitorando: {self.folder_path} (Ctrl+C para parar)")
+        try:
+            current, changed, removed = self.poll()
+            if changed or removed:
+                self.process_batch(current, changed, removed)
+            else:
+                self.signatures = current
+            while max_batches is None or self.batches < max_batches:
+                self.process_batch(*self.wait_for_batch())
+        except KeyboardInterrupt:
+            print("\n⏹️  Monitoramento encerrado.")
@@ -0,0 +1,73 @@
+"""Contagem de n-gramas por hash rolante"""
+from collections import Counter, deque
+
+
+# Hash polinomial rolante para n-gramas (módulo primo de Mersenne 2^61 - 1).
+# A ordem n vai nos bits acima de 61, então n-gramas de ordens diferentes nunca colidem.
+NGRAM_MODULUS = (1 << 61) - 1
+NGRAM_BASE = 1000003
+
+
+def ngram_hash(key_ids):
+    """Hash de uma sequência de ids de chave, igual ao calculado por count_ngrams"""
+    value = 0
+    for key_id in key_ids:
+        value = (value * NGRAM_BASE + key_id + 1) % NGRAM_MODULUS
+    return (len(key_ids) << 61) | value
+
+
+def _prune_counter(counts, max_entries):
+    """Descarta os n-gramas mais raros até o Counter caber no limite"""
+    threshold = 1
+    while len(counts) > max_entries:
+        for key in [key for key, count in counts.items() if count <= threshold]:
+            del counts[key]
+        threshold += 1
+
+
+def count_ngrams(key_ids, ngram_range=(2, 2), wanted=None, min_count=1, max_entries=None, labels=None):
+    """
+    Conta n-gramas de todas as ordens pedidas em uma única passada
+    
+    Usa hashes de prefixo rolantes: o hash de cada n-grama terminando na posição
+    atual sai de duas multiplicações, sem montar strings intermediárias.
+    
+    Args:
+        key_ids: sequência (ou iterador) de ids inteiros dos tokens
+        ngram_range: (n_min, n_max) das ordens contadas
+        wanted: conjunto opcional de hashes; se dado, só eles são contados
+        min_count: descarta no final n-gramas com contagem menor
+        max_entries: limite de memória; ao ultrapassá-lo, os n-gramas mais raros
+            são descartados durante a contagem (resultado aproximado)
+        labels: dicionário opcional hash -> tupla de ids, preenchido com a
+            sequência de cada n-grama novo (para exibir os mais frequentes)
+    
+    Returns:
+        Counter hash -> contagem
+    """
+    min_n, max_n = ngram_range
+    powers = [pow(NGRAM_BASE, n, NGRAM_MODULUS) for n in range(max_n + 1)]
+    prefixes = deque([0], maxlen=max_n + 1)
+    recent = deque(maxlen=max_n)
+    counts = Counter()
+    
+    for key_id in key_ids:
+        current = (prefixes[-1] * NGRAM_BASE + key_id + 1) % NGRAM_MODULUS
+        prefixes.append(current)
+        if labels is not None:
+            recent.append(key_id)
+        
+        for n in range(min_n, min(max_n, len(prefixes) - 1) + 1):
+            value = (n << 61) | ((current - prefixes[-1 - n] * powers[n]) % NGRAM_MODULUS)
+            if wanted is not None and value not in wanted:
+                continue
+            counts[value] += 1
+            if labels is not None and value not in labels:
+                labels[value] = tuple(recent)[-n:]
+        
+        if max_entries is not None and len(counts) > max_entries:
+            _prune_counter(counts, max_entries)
+    
+    if min_count > 1:
+        counts = Counter({key: count for key, count in counts.items() if count >= min_count})
+    return counts
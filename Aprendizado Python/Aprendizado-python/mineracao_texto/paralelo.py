@@ -0,0 +1,193 @@
+"""Contagem em paralelo por processos, com as contagens devolvidas em memória compartilhada"""
+import hashlib
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
+
+from .tokenizacao import TOKEN_PATTERN
+from .indice import DocumentCounts
+from .carregadores import extract_text
+
+
+def _count_documents(paths, encoding='utf-8', keep_texts=False):
+    """
+    Lê e conta uma partição de arquivos com ids locais à partição
+
+    Returns:
+        (tokens locais na ordem dos ids, offsets, ids, contagens, documentos);
+        ids e contagens de todos os documentos ficam em dois arrays uint32
+        (sem ordem dentro do documento: a ordem final depende dos ids
+        globais, e _merge ordena). Cada documento é
+        (caminho, tipo, sha1, texto ou None): sha1 é None se o arquivo não pôde
+        ser lido e '' se ele foi ignorado (não é texto, falha na extração ou
+        vazio, com tipo 'vazio').
+    """
+    local_ids = {}
+    offsets = array('Q', [0])
+    ids = array('I')
+    counts = array('I')
+    documents = []
+
+    for path in paths:
+        try:
+            kind, text = extract_text(path, encoding)
+        except OSError:
+            kind, text, digest = None, None, None
+        except Exception:
+            kind, text, digest = 'erro', None, ''
+        else:
+            digest = ''
+            if text is not None and not text.strip():
+                kind, text = 'vazio', None
+
+        if text is not None:
+            digest = hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+            raw_counts = Counter(TOKEN_PATTERN.findall(text))
+            # Ids locais na ordem da primeira ocorrência (determinística)
+            new = [token for token in raw_counts if token not in local_ids]
+            local_ids.update(zip(new, range(len(local_ids), len(local_ids) + len(new))))
+            ids.extend(map(local_ids.__getitem__, raw_counts))
+            counts.extend(raw_counts.values())
+        offsets.append(len(ids))
+        documents.append((path, kind, digest, text if keep_texts else None))
+
+    return list(local_ids), offsets, ids, counts, documents
+
+
+def _count_partition(paths, encoding='utf-8', keep_texts=False):
+    """
+    Worker: conta uma partição e grava as contagens em um bloco de memória
+    compartilhada (offsets, ids, contagens e o vocabulário local em UTF-8, um
+    token por linha); só o nome do bloco e os metadados pequenos voltam por
+    pickle
+
+    Returns:
+        (nome do bloco, tamanho de cada seção, documentos)
+    """
+    tokens, offsets, ids, counts, documents = _count_documents(paths, encoding, keep_texts)
+    sections = [offsets.tobytes(), ids.tobytes(), counts.tobytes(), '\n'.join(tokens).encode('utf-8')]
+    sizes = [len(section) for section in sections]
+
+    block = shared_memory.SharedMemory(create=True, size=max(1, sum(sizes)))
+    try:
+        position = 0
+        for section in sections:
+            block.buf[position:position + len(section)] = section
+            position += len(section)
+    except BaseException:
+        # O nome não chega ao processo principal: o bloco é removido aqui
+        block.unlink()
+        raise
+    finally:
+        block.close()
+    # O processo principal copia as contagens e remove o bloco (unlink); se
+    # ele morrer antes, o resource_tracker compartilhado (ver count_files)
+    # remove o bloco ao encerrar
+    return block.name, sizes, documents
+
+
+def _read_block(name, sizes):
+    """Copia as seções de um bloco gravado por _count_partition e o remove"""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        arrays = []
+        position = 0
+        for typecode, size in zip('QII', sizes):
+            values = array(typecode)
+            values.frombytes(block.buf[position:position + size])
+            arrays.append(values)
+            position += size
+        blob = bytes(block.buf[position:position + sizes[3]])
+    finally:
+        block.close()
+        block.unlink()
+    tokens = blob.decode('utf-8').split('\n') if blob else []
+    return (tokens, *arrays)
+
+
+def _discard_block(name):
+    """Remove um bloco devolvido por um worker que não chegou a ser lido"""
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def _merge(vocabulary, tokens, offsets, ids, counts, documents):
+    """
+    Traduz as contagens de uma partição para os ids do vocabulário global
+
+    Cada token distinto da partição é cadastrado uma única vez; as contagens
+    por documento só passam por uma tabela de tradução de ids.
+    """
+    translate = vocabulary.add_all(tokens)
+    results = []
+    for index, (path, kind, digest, text) in enumerate(documents):
+        document_counts = None
+        if digest:
+            start, end = offsets[index], offsets[index + 1]
+            document_counts = DocumentCounts(ids[start:end], counts[start:end],
+                                             sum(counts[start:end])).remap(translate)
+        results.append((path, kind, digest, document_counts, text))
+    return results
+
+
+def count_files(paths, vocabulary, encoding='utf-8', workers=1, keep_texts=False, progress=None):
+    """
+    Conta uma lista de arquivos, em paralelo por processos se workers > 1
+
+    Os arquivos são divididos em partições contíguas (uma por worker). Cada
+    worker conta a sua com um vocabulário local e devolve as contagens em
+    memória compartilhada (ids uint32, sem strings por documento); o
+    processo principal junta as partições na ordem original, enquanto as
+    seguintes ainda são contadas. O resultado é idêntico ao da contagem serial.
+
+    Args:
+        vocabulary: Vocabulary global que recebe os tokens
+        keep_texts: se True, o texto de cada arquivo também volta (por pickle)
+        progress: ProgressReporter opcional, atualizado a cada partição
+
+    Returns:
+        lista, na ordem de paths, de (caminho, tipo, sha1, DocumentCounts ou
+        None, texto ou None); sha1 None = erro de leitura, '' = ignorado
+    """
+    paths = list(paths)
+    if workers <= 1 or len(paths) < 2:
+        results = _merge(vocabulary, *_count_documents(paths, encoding, keep_texts))
+        if progress is not None:
+            progress.update(files=len(paths), tokens=sum(item[3].total for item in results if item[3]))
+        return results
+
+    workers = min(workers, len(paths))
+    partitions = [paths[index * len(paths) // workers:(index + 1) * len(paths) // workers]
+                  for index in range(workers)]
+    results = []
+    futures = []
+    read = set()
+    # Um único resource_tracker para todos os processos: os blocos criados
+    # pelos workers ficam registrados nele até o unlink do processo principal
+    resource_tracker.ensure_running()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partition in partitions:
+                futures.append(executor.submit(_count_partition, partition, encoding, keep_texts))
+            for future in futures:
+                name, sizes, documents = future.result()
+                read.add(name)
+                tokens, offsets, ids, counts = _read_block(name, sizes)
+                merged = _merge(vocabulary, tokens, offsets, ids, counts, documents)
+                results.extend(merged)
+                if progress is not None:
+                    progress.update(files=len(documents), tokens=sum(item[3].total for item in merged if item[3]))
+    finally:
+        # Se algo falhou no meio, o with já esperou os workers: os blocos que
+        # eles devolveram e não foram lidos são removidos aqui
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                name = future.result()[0]
+                if name not in read:
+                    _discard_block(name)
+    return results
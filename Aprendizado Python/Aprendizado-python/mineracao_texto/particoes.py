@@ -0,0 +1,188 @@
+"""
+Processamento de corpora em fragmentos (shards) por vários processos ou
+máquinas que compartilham um sistema de arquivos
+
+Cada arquivo da pasta pertence a um fragmento fixo, calculado pelo hash do seu
+caminho relativo; cada processo conta os fragmentos que reivindicar e grava um
+snapshot parcial em uma pasta de saída comum. Depois, merge_shards junta os
+snapshots parciais em um único analisador (relatórios, exportações e
+consultas como se o corpus tivesse sido carregado de uma vez). Não há serviço
+coordenador: a reivindicação é a criação exclusiva de um arquivo .claim.
+"""
+import os
+import socket
+import hashlib
+from pathlib import Path
+
+from .indice import Vocabulary
+from .snapshot import write_snapshot, read_snapshot
+from .carregadores import folder_files
+from .analisador import TextFrequencyAnalyzer
+
+SHARD_PREFIX = 'fragmento_'
+SHARD_SUFFIX = '.tfasnap'
+
+
+def shard_of(relative_path, shards):
+    """
+    Fragmento de um arquivo: SHA-1 do caminho relativo à pasta (com '/'), que
+    é igual em qualquer máquina, mesmo com a pasta montada em lugares diferentes
+    """
+    digest = hashlib.sha1(relative_path.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % shards
+
+
+def shard_path(output_dir, shard, shards):
+    """Caminho do snapshot parcial de um fragmento"""
+    return Path(output_dir) / f"{SHARD_PREFIX}{shard:04d}_de_{shards:04d}{SHARD_SUFFIX}"
+
+
+def shard_files(folder, shard, shards, file_extensions=None):
+    """
+    Arquivos da pasta que pertencem ao fragmento, em ordem alfabética; a
+    escolha é a mesma de load_folder (carregadores.folder_files)
+
+    Args:
+        file_extensions: extensões aceitas (ex: ['.txt', '.md']) ou None para
+            todas; arquivos compactados sempre entram e têm os membros filtrados
+    """
+    folder = Path(folder)
+    return sorted(path for path in folder_files(folder, file_extensions)
+                  if shard_of(path.relative_to(folder).as_posix(), shards) == shard)
+
+
+def _relative(path, folder):
+    """Caminho relativo à pasta (membros de compactados mantêm o '::membro')"""
+    path = str(path)
+    base, separator, member = path.partition('::')
+    try:
+        base = Path(base).relative_to(folder).as_posix()
+    except ValueError:
+        pass
+    return base + separator + member
+
+
+def run_shard(folder, output_dir, shard, shards, file_extensions=None, encoding='utf-8', processes=1, verbose=1):
+    """
+    Conta um fragmento da pasta e grava o seu snapshot parcial
+
+    Args:
+        folder: pasta do corpus (a mesma em todos os processos)
+        output_dir: pasta compartilhada onde os snapshots parciais são gravados
+        shard, shards: índice do fragmento (0 a shards - 1) e total de fragmentos
+        processes: processos de contagem locais (ver paralelo.count_files)
+
+    Returns:
+        caminho do snapshot gravado
+    """
+    folder = Path(folder)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    files = shard_files(folder, shard, shards, file_extensions)
+    analyzer = TextFrequencyAnalyzer(verbose=verbose)
+    analyzer.load_files(files, file_extensions, encoding, processes=processes, keep_texts=False)
+    analyzer.build_index()
+    for text_data in analyzer.texts:
+        text_data['relpath'] = _relative(text_data['path'], folder)
+
+    target = shard_path(output_dir, shard, shards)
+    write_snapshot(target, analyzer.vocabulary, analyzer.texts, extra_metadata={
+        'fragmento': shard,
+        'fragmentos': shards,
+        'arquivos': len(files),
+        'ignorados': [[_relative(path, folder), kind] for path, kind in analyzer.skipped_files],
+        'maquina': socket.gethostname(),
+    })
+    print(f"✓ Fragmento {shard + 1}/{shards}: {len(analyzer.texts)} documento(s) em {target.name}")
+    return target
+
+
+def claim_shards(folder, output_dir, shards, file_extensions=None, encoding='utf-8', processes=1, verbose=1):
+    """
+    Reivindica e conta fragmentos ainda livres até não restar nenhum
+
+    Vários processos (em uma ou várias máquinas) podem rodar ao mesmo tempo
+    com os mesmos argumentos: cada fragmento é reivindicado criando o arquivo
+    '<snapshot>.claim' com O_CREAT | O_EXCL, que só um processo consegue.
+    Fragmentos já gravados são pulados; para refazer um fragmento cujo
+    processo morreu, apague o .claim dele e rode de novo.
+
+    Returns:
+        lista dos snapshots gravados por este processo
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for shard in range(shards):
+        target = shard_path(output_dir, shard, shards)
+        if target.exists():
+            continue
+        claim = target.with_name(target.name + '.claim')
+        try:
+            descriptor = os.open(claim, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            continue
+        with os.fdopen(descriptor, 'w') as file:
+            file.write(f"{socket.gethostname()} {os.getpid()}\n")
+        written.append(run_shard(folder, output_dir, shard, shards, file_extensions, encoding,
+                                 processes, verbose))
+    return written
+
+
+def merge_shards(output_dir, normalizer=None):
+    """
+    Junta os snapshots parciais de uma pasta de saída em um único analisador
+
+    Os vocabulários dos fragmentos são unidos (cada token distinto é
+    cadastrado uma vez) e as contagens traduzidas para os ids globais; os
+    documentos ficam em ordem de caminho relativo, então o resultado não
+    depende de quantos processos participaram nem de quem terminou primeiro.
+    Fragmentos ausentes (ainda em andamento ou interrompidos) são avisados.
+
+    Returns:
+        TextFrequencyAnalyzer com o corpus completo, ou None se não houver
+        snapshots parciais
+    """
+    paths = sorted(Path(output_dir).glob(f"{SHARD_PREFIX}*{SHARD_SUFFIX}"))
+    if not paths:
+        print(f"✗ Nenhum fragmento encontrado em: {output_dir}")
+        return None
+
+    vocabulary = Vocabulary()
+    texts = []
+    skipped = []
+    expected = None
+    merged = set()
+    for path in paths:
+        try:
+            shard_vocabulary, shard_texts, extra = read_snapshot(path)
+        except Exception as e:
+            print(f"✗ Erro ao abrir {path.name}: {e}")
+            continue
+        if expected is None:
+            expected = extra.get('fragmentos')
+        if extra.get('fragmentos') != expected:
+            print(f"⚠️ {path.name} é de uma divisão em {extra.get('fragmentos')} fragmentos "
+                  f"(esperado: {expected}); ignorado")
+            continue
+
+        translate = vocabulary.add_all(shard_vocabulary.tokens)
+        for text_data in shard_texts:
+            text_data['counts'] = text_data['counts'].remap(translate)
+            texts.append(text_data)
+        skipped.extend(tuple(item) for item in extra.get('ignorados', []))
+        merged.add(extra.get('fragmento'))
+
+    missing = sorted(set(range(expected or 0)) - merged)
+    if missing:
+        print(f"⚠️ Fragmentos ausentes ({len(missing)} de {expected}): "
+              f"{', '.join(str(shard) for shard in missing[:20])}")
+
+    texts.sort(key=lambda text_data: text_data.get('relpath') or text_data['source'])
+    analyzer = TextFrequencyAnalyzer(normalizer)
+    analyzer.vocabulary = vocabulary
+    analyzer.texts = texts
+    analyzer.skipped_files = sorted(skipped)
+    print(f"✓ {len(merged)} fragmento(s) juntados: {len(texts)} documentos, {len(vocabulary):,} termos")
+    return analyzer
@@ -0,0 +1,76 @@
+"""Relatório de progresso em uma única linha"""
+import sys
+import time
+import threading
+
+
+class ProgressReporter:
+    """
+    Progresso de operações longas em uma única linha (arquivos/s, MB/s,
+    tokens/s e tempo restante estimado)
+    
+    É seguro para várias threads: os workers chamam update() e a linha é
+    redesenhada no máximo a cada `interval` segundos, então o custo de console
+    não cresce com o número de arquivos.
+    """
+    
+    def __init__(self, description, total_files=None, total_bytes=None, enabled=True,
+                 interval=0.5, stream=None):
+        self.description = description
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.enabled = enabled
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stderr
+        self.files = 0
+        self.bytes = 0
+        self.tokens = 0
+        self.started = time.perf_counter()
+        self._last_render = 0.0
+        self._lock = threading.Lock()
+    
+    def update(self, files=0, nbytes=0, tokens=0):
+        """Soma o trabalho concluído por um worker"""
+        with self._lock:
+            self.files += files
+            self.bytes += nbytes
+            self.tokens += tokens
+            now = time.perf_counter()
+            if self.enabled and now - self._last_render >= self.interval:
+                self._last_render = now
+                self._render(now)
+    
+    def eta(self, now=None):
+        """Segundos restantes estimados (pelos bytes se o total for conhecido, senão pelos arquivos)"""
+        elapsed = (now or time.perf_counter()) - self.started
+        if self.total_bytes and self.bytes:
+            return elapsed * (self.total_bytes - self.bytes) / self.bytes
+        if self.total_files and self.files:
+            return elapsed * (self.total_files - self.files) / self.files
+        return None
+    
+    def summary(self, now=None):
+        now = now or time.perf_counter()
+        elapsed = max(now - self.started, 1e-9)
+        parts = [f"{self.files:,}" + (f"/{self.total_files:,}" if self.total_files else "") + " arquivos",
+                 f"{self.files / elapsed:,.1f} arq/s"]
+        if self.bytes:
+            parts.append(f"{self.bytes / elapsed / 1e6:,.1f} MB/s")
+        if self.tokens:
+            parts.append(f"{self.tokens / elapsed:,.0f} tokens/s")
+        return " | ".join(parts)
+    
+    def _render(self, now):
+        line = f"\r⏳ {self.description}: {self.summary(now)}"
+        eta = self.eta(now)
+        if eta is not None:
+            line += f" | restante ~{eta:,.0f}s"
+        self.stream.write(line.ljust(100)[:120])
+        self.stream.flush()
+    
+    def close(self):
+        """Finaliza a linha de progresso com o resumo final"""
+        if self.enabled:
+            now = time.perf_counter()
+            self.stream.write(f"\r✓ {self.description}: {self.summary(now)} | {now - self.started:,.1f}s".ljust(100) + "\n")
+            self.stream.flush()
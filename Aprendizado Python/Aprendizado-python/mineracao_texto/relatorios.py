@@ -0,0 +1,292 @@
+"""Relatórios, tabelas (pandas) e exportação dos resultados do analisador"""
+import pandas as pd
+
+from .estatisticas import RunningStats
+
+
+def show_text_info(analyzer):
+    """Mostra informações sobre os textos carregados"""
+    if not analyzer.texts:
+        print("Nenhum texto carregado.")
+        return
+
+    print("\n=== TEXTOS CARREGADOS ===")
+    for i, text_data in enumerate(analyzer.texts, 1):
+        text = text_data['text']
+        print(f"{i}. Fonte: {text_data['source']}")
+        if text is None:
+            # Snapshot ou texto despejado: só as contagens estão disponíveis
+            print(f"   Palavras: {analyzer.document_counts(text_data).total:,}")
+            print("   Prévia: (texto original indisponível)")
+        else:
+            print(f"   Caracteres: {len(text):,}")
+            print(f"   Palavras: {len(text.split()):,}")
+            print(f"   Prévia: {text[:100]}...")
+        print()
+
+
+def print_concordance(analyzer, target_word, width=5, case_sensitive=False, page=1, page_size=20):
+    """Exibe uma página da concordância KWIC alinhada pela palavra-chave"""
+    result = analyzer.concordance(target_word, width, case_sensitive, page, page_size)
+
+    print(f"\n🔎 CONCORDÂNCIA: '{target_word}' - {result['total']} ocorrência(s)"
+          f" | página {result['pagina']}/{result['paginas']}")
+    print("-" * 80)
+    for line in result['linhas']:
+        left = line['esquerda'][-40:]
+        print(f"{line['fonte'][:20]:<20} {left:>40} [{line['palavra']}] {line['direita']}")
+
+    if result['total'] and not result['linhas']:
+        print("⚠️  Ocorrências apenas em documentos sem texto original (snapshot)")
+    return result
+
+
+def create_frequency_dataframe(analyzer):
+    """Cria um DataFrame com os resultados da análise"""
+    if not analyzer.word_frequencies:
+        print("✗ Erro: Execute analyze_frequency() primeiro!")
+        return pd.DataFrame()
+
+    data = []
+    for word, freq_list in analyzer.word_frequencies.items():
+        for freq_data in freq_list:
+            data.append({
+                'palavra': word,
+                'fonte': freq_data['source'],
+                'frequencia': freq_data['frequency']
+            })
+
+    return pd.DataFrame(data)
+
+
+def create_detailed_report(analyzer, target_words, case_sensitive=False, individual_results=None):
+    """
+    Cria relatório detalhado da análise individual
+
+    Args:
+        individual_results: resultados já calculados (ex.: um perfil de
+            analyze_profiles); se None, executa analyze_individual_files
+    """
+    if individual_results is None:
+        individual_results = analyzer.analyze_individual_files(target_words, case_sensitive)
+
+    print("=" * 80)
+    print("RELATÓRIO DETALHADO - ANÁLISE POR ARQUIVO")
+    print("=" * 80)
+
+    for arquivo, dados in individual_results.items():
+        print(f"\n📄 ARQUIVO: {arquivo}")
+        print(f"   Total de palavras: {dados['total_palavras']}")
+        print("   Palavras analisadas:")
+
+        for palavra in target_words:
+            freq = dados['palavras_encontradas'].get(palavra, 0)
+            perc = dados['percentuais'].get(palavra, 0)
+            print(f"   • {palavra}: {freq} ocorrências ({perc}%)")
+
+    return individual_results
+
+
+def export_results_to_csv(analyzer, target_words, filename="resultados_mineracao.csv", case_sensitive=False,
+                          individual_results=None):
+    """Exporta resultados para CSV"""
+    df_csv = analyzer.results_dataframe(target_words, case_sensitive, individual_results)
+    df_csv.to_csv(filename, index=False, encoding='utf-8')
+    print(f"✓ Resultados exportados para: {filename}")
+    return df_csv
+
+
+def export_results(analyzer, target_words, filename, case_sensitive=False, individual_results=None):
+    """Exporta resultados para CSV ou Parquet, conforme a extensão do arquivo"""
+    if str(filename).endswith('.parquet'):
+        df = analyzer.results_dataframe(target_words, case_sensitive, individual_results)
+        try:
+            df.to_parquet(filename, index=False)
+        except ImportError as e:
+            print(f"✗ Exportação Parquet indisponível ({e}); instale pyarrow ou use .csv")
+            return df
+        print(f"✓ Resultados exportados para: {filename}")
+        return df
+    return analyzer.export_results_to_csv(target_words, filename, case_sensitive, individual_results)
+
+
+def results_dataframe(analyzer, target_words, case_sensitive=False, individual_results=None):
+    """Tabela exportada: uma linha por arquivo com frequência e percentual de cada palavra"""
+    if individual_results is not None or len(analyzer.texts) > 1:
+        if individual_results is None:
+            individual_results = analyzer.analyze_individual_files(target_words, case_sensitive)
+
+        # Preparar dados para CSV
+        data_for_csv = []
+        for arquivo, dados in individual_results.items():
+            row = {'Arquivo': arquivo, 'Total_Palavras': dados['total_palavras']}
+
+            for palavra in target_words:
+                freq = dados['palavras_encontradas'].get(palavra, 0)
+                perc = dados['percentuais'].get(palavra, 0)
+                row[f'{palavra}_Frequencia'] = freq
+                row[f'{palavra}_Percentual'] = perc
+
+            data_for_csv.append(row)
+
+        df_csv = pd.DataFrame(data_for_csv)
+    else:
+        # Para arquivo único, usar o DataFrame básico
+        df_csv = analyzer.create_frequency_dataframe()
+
+    return df_csv
+
+
+def report_profiles(analyzer, profiles, case_sensitive=False, export_pattern=None, plot=False):
+    """
+    Relatório detalhado, exportação e gráfico de cada perfil de palavras-alvo,
+    todos a partir da mesma contagem (analyzer.analyze_profiles)
+
+    Args:
+        profiles: {nome do perfil: lista de palavras}
+        export_pattern: nome dos arquivos exportados com '{perfil}', ex.:
+            'resultados_{perfil}.csv' ou '.parquet' (None = não exporta)
+        plot: se True, desenha a comparação por arquivo de cada perfil
+
+    Returns:
+        {perfil: resultados por arquivo}
+    """
+    results = analyzer.analyze_profiles(profiles, case_sensitive)
+
+    for name, individual_results in results.items():
+        words = [word for word in profiles[name] if word.strip()]
+        if not case_sensitive:
+            words = [word.lower() for word in words]
+
+        print(f"\n🗂️  PERFIL: {name} ({', '.join(words)})")
+        create_detailed_report(analyzer, words, case_sensitive, individual_results)
+        if export_pattern:
+            export_results(analyzer, words, export_pattern.format(perfil=name), case_sensitive, individual_results)
+        if plot:
+            analyzer.plot_individual_comparison(words, case_sensitive, individual_results=individual_results,
+                                                title=f'Frequência de Palavras por Arquivo - {name}')
+
+    return results
+
+
+def keyness_dataframe(comparison):
+    """Tabela da comparação entre corpora (contraste.keyness), uma linha por termo, já ordenada"""
+    name_a, name_b = comparison['corpus_a'], comparison['corpus_b']
+    df = pd.DataFrame(comparison['termos'], columns=['termo', 'freq_a', 'freq_b', 'por_milhao_a', 'por_milhao_b',
+                                                     'log_likelihood', 'log_ratio', 'p_valor', 'favorece'])
+    df.insert(0, 'Posicao', range(1, len(df) + 1))
+    return df.rename(columns={
+        'termo': 'Termo',
+        'freq_a': f'Frequencia_{name_a}',
+        'freq_b': f'Frequencia_{name_b}',
+        'por_milhao_a': f'Por_Milhao_{name_a}',
+        'por_milhao_b': f'Por_Milhao_{name_b}',
+        'log_likelihood': 'Log_Likelihood',
+        'log_ratio': 'Log_Ratio',
+        'p_valor': 'P_Valor',
+        'favorece': 'Favorece',
+    })
+
+
+def report_keyness(comparison, top=20, filename=None, plot=False):
+    """
+    Relatório dos termos mais característicos de cada corpus, com exportação
+    da tabela completa e gráfico opcionais
+
+    Args:
+        comparison: resultado de contraste.keyness / compare_corpora
+        top: termos listados por corpus
+        filename: CSV ou .parquet com todos os termos (None = não exporta)
+        plot: se True, desenha o gráfico de log-ratio dos termos listados
+    """
+    name_a, name_b = comparison['corpus_a'], comparison['corpus_b']
+    print("=" * 80)
+    print(f"COMPARAÇÃO DE CORPORA - {name_a} x {name_b}")
+    print("=" * 80)
+    print(f"Tokens: {name_a} = {comparison['tokens_a']:,} | {name_b} = {comparison['tokens_b']:,}")
+    print(f"Termos comparados: {len(comparison['termos']):,}")
+
+    for name in (name_a, name_b):
+        terms = [item for item in comparison['termos'] if item['favorece'] == name][:top]
+        print(f"\n🔑 Mais característicos de {name}:")
+        print(f"   {'Termo':<25} {'Freq ' + name_a[:10]:>16} {'Freq ' + name_b[:10]:>16} {'LL':>10} {'Log-ratio':>10}")
+        for item in terms:
+            print(f"   {item['termo'][:25]:<25} {item['freq_a']:>16,} {item['freq_b']:>16,} "
+                  f"{item['log_likelihood']:>10.1f} {item['log_ratio']:>+10.2f}")
+
+    df = keyness_dataframe(comparison)
+    if filename:
+        try:
+            if str(filename).endswith('.parquet'):
+                df.to_parquet(filename, index=False)
+            else:
+                df.to_csv(filename, index=False, encoding='utf-8')
+            print(f"\n✓ Resultados exportados para: {filename}")
+        except ImportError as e:
+            print(f"✗ Exportação Parquet indisponível ({e}); instale pyarrow ou use .csv")
+    if plot:
+        from . import graficos
+        graficos.plot_keyness(comparison, top)
+    return df
+
+
+def sections_dataframe(analyzer, target_words, case_sensitive=False):
+    """Tabela com uma linha por arquivo e seção: totais, sentenças, parágrafos e frequência de cada palavra"""
+    section_results = analyzer.analyze_sections(target_words, case_sensitive)
+
+    rows = []
+    for arquivo, secoes in section_results.items():
+        for secao, dados in secoes.items():
+            total = dados['total_palavras']
+            row = {
+                'Arquivo': arquivo,
+                'Secao': secao,
+                'Total_Palavras': total,
+                'Sentencas': dados['sentencas'],
+                'Paragrafos': dados['paragrafos'],
+            }
+            for palavra, freq in dados['palavras_encontradas'].items():
+                row[f'{palavra}_Frequencia'] = freq
+                row[f'{palavra}_Percentual'] = round(freq / total * 100, 2) if total else 0
+            rows.append(row)
+
+    return pd.DataFrame(rows)
+
+
+def get_summary_stats(analyzer, quantiles=False):
+    """
+    Retorna estatísticas resumidas da análise
+
+    Lê as estatísticas incrementais (analyzer.running_stats) atualizadas por
+    analyze_frequency a cada documento, então o custo é proporcional ao
+    número de palavras, não de documentos, e o resumo pode ser consultado no
+    meio de uma análise longa.
+
+    Args:
+        quantiles: se True, inclui os quartis aproximados (P²)
+    """
+    if set(analyzer.running_stats) != set(analyzer.word_frequencies):
+        # word_frequencies preenchido por fora de analyze_frequency
+        analyzer.running_stats = {}
+        for word, freq_list in analyzer.word_frequencies.items():
+            stats = analyzer.running_stats[word] = RunningStats()
+            for freq_data in freq_list:
+                stats.add(freq_data['frequency'])
+
+    columns = ['Total', 'Média', 'Desvio Padrão', 'Máximo', 'Mínimo']
+    if quantiles:
+        columns += ['Q1', 'Mediana', 'Q3']
+
+    rows = {}
+    for word in sorted(analyzer.running_stats):
+        stats = analyzer.running_stats[word]
+        if stats.count == 0:
+            continue
+        row = [stats.total, stats.total / stats.count, stats.std(), stats.maximum, stats.minimum]
+        if quantiles:
+            row += [stats.quantile(0.25), stats.quantile(0.5), stats.quantile(0.75)]
+        rows[word] = row
+
+    summary = pd.DataFrame.from_dict(rows, orient='index', columns=columns).round(2)
+    summary.index.name = 'palavra'
+    return summary
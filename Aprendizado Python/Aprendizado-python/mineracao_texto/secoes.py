@@ -0,0 +1,152 @@
+"""Segmentação de artigos em seções (resumo, corpo, referências), parágrafos e sentenças"""
+import io
+import re
+from collections import Counter
+
+from .tokenizacao import TOKEN_PATTERN
+
+SECTIONS = ('resumo', 'corpo', 'referencias')
+
+# Títulos (linha inteira, sem diferenciar maiúsculas) que iniciam cada seção
+SECTION_HEADINGS = {
+    'abstract': 'resumo', 'resumo': 'resumo', 'summary': 'resumo', 'resumen': 'resumo',
+    'references': 'referencias', 'reference list': 'referencias', 'referências': 'referencias',
+    'referencias': 'referencias', 'referências bibliográficas': 'referencias',
+    'referencias bibliograficas': 'referencias', 'bibliography': 'referencias',
+    'bibliografia': 'referencias', 'works cited': 'referencias', 'literature cited': 'referencias',
+    'introduction': 'corpo', 'introdução': 'corpo', 'introducao': 'corpo',
+    'keywords': 'corpo', 'key words': 'corpo', 'index terms': 'corpo', 'palavras-chave': 'corpo',
+    'appendix': 'corpo', 'apêndice': 'corpo', 'apendice': 'corpo', 'anexo': 'corpo',
+}
+
+# Numeração opcional antes do título: "1.", "2.3", "IV.", "A)"
+_NUMBERING = re.compile(r'^(?:\d+(?:\.\d+)*|[IVXLC]+|[A-Z])[.)]?\s+')
+# Título genérico curto (até 6 palavras só com letras), ex.: "Related Work"
+_TITLE_WORDS = re.compile(r'^[^\W\d_]+(?:[ -][^\W\d_]+){0,5}$')
+# Resumo na mesma linha do título: "Abstract— We present...", "Resumo: Este trabalho..."
+_INLINE_ABSTRACT = re.compile(r'^\s*(?:abstract|resumo|summary)\s*[-—–:.]\s*(?=\S)', re.IGNORECASE)
+# Fim de sentença: mesma regra de SENTENCE_TOKEN_PATTERN
+_SENTENCE_END = re.compile(r'[.!?]+(?=\s|$)')
+
+
+def classify_heading(line, current):
+    """
+    Seção iniciada pela linha, se ela for um título; None caso contrário
+
+    Títulos numerados genéricos ("2. Methods") encerram o resumo, mas não as
+    referências, cujas entradas costumam ser numeradas ("1. Smith, J.").
+    """
+    stripped = line.strip()
+    if not stripped or len(stripped) > 60:
+        return None
+    numbered = _NUMBERING.match(stripped)
+    title = stripped[numbered.end():] if numbered else stripped
+    title = title.rstrip(':.').strip().lower()
+    section = SECTION_HEADINGS.get(title)
+    if section is not None:
+        return section
+    if numbered and current == 'resumo' and _TITLE_WORDS.match(title):
+        return 'corpo'
+    return None
+
+
+class SectionSegmenter:
+    """
+    Segmenta um texto linha a linha em seções, parágrafos e sentenças,
+    contando os tokens de cada seção na mesma passada
+
+    Parágrafos são separados por linhas em branco; sentenças terminam em
+    . ! ? seguidos de espaço (ou no fim do parágrafo). Linhas de título não
+    abrem parágrafo, mas seus tokens contam na seção que iniciam, então a soma
+    das seções é igual à contagem do documento inteiro. Texto antes do
+    primeiro título conta como corpo.
+    """
+
+    def __init__(self):
+        self.section = 'corpo'
+        self.counts = {name: Counter() for name in SECTIONS}
+        self.stats = {name: {'paragrafos': 0, 'sentencas': 0, 'tokens': 0} for name in SECTIONS}
+        self._in_paragraph = False
+        self._open_sentence = False
+
+    def advance(self, line):
+        """
+        Atualiza a seção corrente com uma linha
+
+        Returns:
+            True se a linha é um título (ela passa a pertencer à nova seção)
+        """
+        heading = classify_heading(line, self.section)
+        if heading is not None:
+            self._close_paragraph()
+            self.section = heading
+            return True
+        if _INLINE_ABSTRACT.match(line):
+            self._close_paragraph()
+            self.section = 'resumo'
+        return False
+
+    def feed(self, line):
+        """Processa uma linha do texto"""
+        if self.advance(line):
+            tokens = TOKEN_PATTERN.findall(line)
+            self.counts[self.section].update(tokens)
+            self.stats[self.section]['tokens'] += len(tokens)
+            return
+        if not line.strip():
+            self._close_paragraph()
+            return
+
+        stats = self.stats[self.section]
+        counts = self.counts[self.section]
+        if not self._in_paragraph:
+            stats['paragrafos'] += 1
+            self._in_paragraph = True
+
+        # Cada trecho entre fins de sentença é contado de uma vez (Counter em C)
+        pieces = _SENTENCE_END.split(line)
+        last = len(pieces) - 1
+        for index, piece in enumerate(pieces):
+            tokens = TOKEN_PATTERN.findall(piece)
+            if tokens:
+                counts.update(tokens)
+                stats['tokens'] += len(tokens)
+                self._open_sentence = True
+            if index < last and self._open_sentence:
+                stats['sentencas'] += 1
+                self._open_sentence = False
+
+    def _close_paragraph(self):
+        if self._open_sentence:
+            self.stats[self.section]['sentencas'] += 1
+            self._open_sentence = False
+        self._in_paragraph = False
+
+    def finish(self):
+        """
+        Encerra o texto
+
+        Returns:
+            (Counter de tokens por seção, estatísticas por seção)
+        """
+        self._close_paragraph()
+        return self.counts, self.stats
+
+
+def segment_text(text):
+    """Segmenta um texto completo (ver SectionSegmenter) sem copiá-lo em lista de linhas"""
+    segmenter = SectionSegmenter()
+    for line in io.StringIO(text):
+        segmenter.feed(line)
+    return segmenter.finish()
+
+
+def section_text(text, exclude_sections):
+    """Texto sem as linhas das seções excluídas (usado na contagem de n-gramas)"""
+    segmenter = SectionSegmenter()
+    kept = []
+    for line in io.StringIO(text):
+        segmenter.advance(line)
+        if segmenter.section not in exclude_sections:
+            kept.append(line)
+    return ''.join(kept)
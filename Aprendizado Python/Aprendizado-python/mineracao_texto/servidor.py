@@ -0,0 +1,171 @@
+"""Serviço HTTP local de consultas JSON sobre um corpus carregado"""
+import json
+import threading
+from collections import Counter, OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class CorpusQueryService:
+    """
+    Consultas JSON sobre um corpus já carregado (usado pelo servidor HTTP)
+    
+    O corpus é indexado uma única vez na criação; as consultas só leem as
+    contagens e o índice posicional e rodam em paralelo. Só o estado mutável
+    compartilhado tem lock: o cache LRU de respostas (lock próprio, curto) e
+    as tabelas de consulta que o analisador monta sob demanda.
+    """
+    
+    def __init__(self, analyzer, cache_size=256):
+        self.analyzer = analyzer
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        
+        analyzer.build_index()
+        for text_data in analyzer.texts:
+            analyzer.document_positions(text_data)
+        self.routes = {
+            '/info': self.info,
+            '/frequencias': self.frequencies,
+            '/relatorio': self.report,
+            '/top': self.top_terms,
+            '/kwic': self.kwic,
+        }
+    
+    @staticmethod
+    def _words(params):
+        words = [word.strip() for word in params.get('palavras', '').split(',') if word.strip()]
+        if not words:
+            raise ValueError("Parâmetro 'palavras' é obrigatório (separadas por vírgula)")
+        return words
+    
+    @staticmethod
+    def _flag(params, name):
+        return params.get(name, '').lower() in ('1', 'true', 'sim', 's')
+    
+    def info(self, params):
+        analyzer = self.analyzer
+        return {
+            'documentos': len(analyzer.texts),
+            'vocabulario': len(analyzer.vocabulary),
+            'fontes': [text_data['source'] for text_data in analyzer.texts],
+        }
+    
+    def frequencies(self, params):
+        """Totais por palavra no corpus"""
+        results = self.analyzer.analyze_individual_files(self._words(params), self._flag(params, 'case_sensitive'))
+        totals = Counter()
+        for dados in results.values():
+            totals.update(dados['palavras_encontradas'])
+        return {'palavras': dict(totals), 'documentos': len(results)}
+    
+    def report(self, params):
+        """Relatório por arquivo (como create_detailed_report)"""
+        return self.analyzer.analyze_individual_files(self._words(params), self._flag(params, 'case_sensitive'))
+    
+    def top_terms(self, params):
+        """Termos (ou n-gramas, com ngrama=2, 3...) mais frequentes do corpus"""
+        top = int(params.get('n', 20))
+        order = int(params.get('ngrama', 1))
+        if order > 1:
+            df = self.analyzer.top_ngrams(order, top=top, min_count=1)
+            return {'termos': df.to_dict(orient='records')}
+        
+        totals = self.analyzer.corpus_counts()
+        tokens = self.analyzer.vocabulary.tokens
+        if not self._flag(params, 'case_sensitive'):
+            folded = Counter()
+            for term_id, count in totals.items():
+                folded[self.analyzer.lookup_key(tokens[term_id])] += count
+            ranked = folded.most_common(top)
+        else:
+            ranked = sorted(((tokens[i], c) for i, c in totals.items()), key=lambda item: -item[1])[:top]
+        return {'termos': [{'termo': term, 'frequencia': count} for term, count in ranked]}
+    
+    def kwic(self, params):
+        word = params.get('palavra', '').strip()
+        if not word:
+            raise ValueError("Parâmetro 'palavra' é obrigatório")
+        return self.analyzer.concordance(
+            word,
+            width=int(params.get('largura', 5)),
+            case_sensitive=self._flag(params, 'case_sensitive'),
+            page=int(params.get('pagina', 1)),
+            page_size=int(params.get('por_pagina', 20)),
+        )
+    
+    def _prepare(self, params):
+        """Monta (uma vez por modo) a tabela chave -> ids usada pelas consultas"""
+        with self._index_lock:
+            self.analyzer._key_map(self._flag(params, 'case_sensitive'))
+    
+    def handle(self, path, params):
+        """
+        Responde uma consulta
+        
+        Returns:
+            (status HTTP, dicionário serializável em JSON)
+        """
+        route = self.routes.get(path)
+        if route is None:
+            return 404, {'erro': f"Rota desconhecida: {path}", 'rotas': sorted(self.routes)}
+        
+        cache_key = (path, tuple(sorted(params.items())))
+        with self._cache_lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return 200, self._cache[cache_key]
+        
+        try:
+            self._prepare(params)
+            response = route(params)
+        except ValueError as e:
+            return 400, {'erro': str(e)}
+        except Exception as e:
+            # Qualquer outra falha vira resposta JSON em vez de derrubar a conexão
+            return 500, {'erro': f"{type(e).__name__}: {e}"}
+        
+        with self._cache_lock:
+            self._cache[cache_key] = response
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return 200, response
+
+
+def serve_corpus(analyzer, host='127.0.0.1', port=8000, cache_size=256):
+    """
+    Sobe um servidor HTTP local com consultas JSON sobre o corpus carregado
+    
+    Rotas: /info, /frequencias?palavras=a,b, /relatorio?palavras=a,b,
+    /top?n=20&ngrama=1 e /kwic?palavra=x&largura=5&pagina=1&por_pagina=20
+    (case_sensitive=1 opcional nas consultas de palavras).
+    """
+    service = CorpusQueryService(analyzer, cache_size)
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, payload = service.handle(url.path.rstrip('/') or '/info', params)
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            if analyzer.verbose >= 2:
+                super().log_message(format, *args)
+    
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"🌐 Servindo {len(analyzer.texts)} documento(s) em http://{host}:{server.server_port} (Ctrl+C para parar)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  Servidor encerrado.")
+    finally:
+        server.server_close()
@@ -0,0 +1,276 @@
+"""
+Similaridade entre documentos: vetores TF-IDF esparsos, cosseno e busca dos
+vizinhos mais próximos
+
+A busca exata percorre um índice invertido (coluna -> documentos), então cada
+consulta só toca os documentos que compartilham termos com ela, em vez de
+comparar todos os pares. Opcionalmente, um índice LSH de projeções aleatórias
+(SimHash) reduz os candidatos a poucos buckets antes do cálculo exato.
+"""
+import math
+import heapq
+from array import array
+from operator import itemgetter
+
+from .indice import _mix64, _MASK64
+
+# Fração máxima padrão de documentos de um termo: termos em quase todos os
+# documentos pesam pouco no cosseno e teriam listas invertidas do tamanho do
+# corpus, e cada consulta percorreria todas elas
+DEFAULT_MAX_DF = 0.9
+
+
+class SimilarityIndex:
+    """
+    Vetores TF-IDF (normalizados, cosseno = produto interno) dos documentos
+    de um corpus, com índice invertido e LSH opcional
+
+    Cada coluna é uma chave de consulta (lookup_key do analisador: formas que
+    diferem só em maiúsculas ou normalização viram a mesma coluna).
+    """
+
+    def __init__(self, sources, vectors, columns, idf, lsh_tables=0, lsh_bits=8, seed=0):
+        """
+        Args:
+            sources: nome de cada documento
+            vectors: (colunas, pesos) de cada documento, já normalizados
+            columns: dicionário chave -> coluna
+            idf: peso IDF de cada coluna
+            lsh_tables: tabelas LSH (0 = só busca exata)
+            lsh_bits: hiperplanos (bits da assinatura) por tabela; mais bits
+                deixam os buckets menores, mais tabelas recuperam mais vizinhos
+        """
+        self.sources = sources
+        self.vectors = vectors
+        self.columns = columns
+        self.idf = idf
+        self.lsh_tables = lsh_tables
+        self.lsh_bits = lsh_bits
+        self.seed = seed
+        # Coluna -> hiperplano e sinal em cada tabela (ver _signatures)
+        self._projection = {}
+        self._positions = {}
+        for position, source in enumerate(sources):
+            self._positions.setdefault(source, position)
+
+        # Índice invertido: coluna -> (documentos, pesos)
+        self.postings = {}
+        for position, (cols, weights) in enumerate(vectors):
+            for column, weight in zip(cols, weights):
+                entry = self.postings.get(column)
+                if entry is None:
+                    entry = self.postings[column] = (array('I'), array('d'))
+                entry[0].append(position)
+                entry[1].append(weight)
+
+        self.buckets = [{} for _ in range(lsh_tables)]
+        for position, (cols, weights) in enumerate(vectors):
+            for table, signature in enumerate(self._signatures(cols, weights)):
+                self.buckets[table].setdefault(signature, array('I')).append(position)
+
+    @classmethod
+    def from_analyzer(cls, analyzer, case_sensitive=False, min_df=1, max_df=DEFAULT_MAX_DF, sublinear_tf=True,
+                      lsh_tables=0, lsh_bits=8, seed=0):
+        """
+        Monta o índice a partir das contagens do analisador (sem reler textos)
+
+        Args:
+            min_df: número mínimo de documentos em que um termo aparece
+            max_df: fração máxima de documentos (termos mais comuns, como
+                artigos e preposições, são descartados e aceleram a busca);
+                1.0 mantém todos os termos
+            sublinear_tf: se True, usa 1 + log(tf) em vez da contagem bruta
+        """
+        analyzer.build_index()
+        column_of = array('i', [-1]) * len(analyzer.vocabulary)
+        keys = list(analyzer._key_map(case_sensitive).items())
+        for column, (_, term_ids) in enumerate(keys):
+            for term_id in term_ids:
+                column_of[term_id] = column
+
+        # Contagem por coluna de cada documento e frequência de documentos
+        document_frequency = array('I', bytes(4 * len(keys)))
+        raw_vectors = []
+        for text_data in analyzer.texts:
+            tf = {}
+            for term_id, count in text_data['counts'].items():
+                column = column_of[term_id]
+                tf[column] = tf.get(column, 0) + count
+            for column in tf:
+                document_frequency[column] += 1
+            raw_vectors.append(tf)
+
+        n_docs = len(raw_vectors)
+        max_count = max_df * n_docs if max_df < 1 else n_docs
+        idf = array('d', [math.log((1 + n_docs) / (1 + df)) + 1 if min_df <= df <= max_count else 0.0
+                          for df in document_frequency])
+
+        vectors = []
+        for tf in raw_vectors:
+            weighted = sorted((column, ((1 + math.log(count)) if sublinear_tf else count) * idf[column])
+                              for column, count in tf.items() if idf[column])
+            norm = math.sqrt(sum(weight * weight for _, weight in weighted)) or 1.0
+            vectors.append((array('I', [column for column, _ in weighted]),
+                            array('d', [weight / norm for _, weight in weighted])))
+
+        columns = {key: column for column, (key, _) in enumerate(keys)}
+        sources = [text_data['source'] for text_data in analyzer.texts]
+        return cls(sources, vectors, columns, idf, lsh_tables, lsh_bits, seed)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def text_vector(self, key_counts, sublinear_tf=True):
+        """
+        Vetor normalizado de um texto externo ao corpus
+
+        Args:
+            key_counts: Counter de chaves de consulta (lookup_key) do texto;
+                chaves fora do vocabulário do índice são ignoradas
+        """
+        weighted = []
+        for key, count in key_counts.items():
+            column = self.columns.get(key)
+            if column is not None and self.idf[column]:
+                weighted.append((column, ((1 + math.log(count)) if sublinear_tf else count) * self.idf[column]))
+        weighted.sort()
+        norm = math.sqrt(sum(weight * weight for _, weight in weighted)) or 1.0
+        return (array('I', [column for column, _ in weighted]),
+                array('d', [weight / norm for _, weight in weighted]))
+
+    def position(self, source):
+        """Posição de um documento pelo nome (None se não existir)"""
+        return self._positions.get(source)
+
+    def similarity(self, source_a, source_b):
+        """Cosseno entre dois documentos do índice"""
+        cols_a, weights_a = self.vectors[self._positions[source_a]]
+        vector_b = dict(zip(*self.vectors[self._positions[source_b]]))
+        return sum(weight * vector_b.get(column, 0.0) for column, weight in zip(cols_a, weights_a))
+
+    def search(self, vector, k=10, approximate=False, exclude=None):
+        """
+        Os k documentos mais próximos de um vetor (ver text_vector)
+
+        Args:
+            approximate: se True (e o índice tiver tabelas LSH), só os
+                documentos dos mesmos buckets são comparados
+            exclude: posição de documento a ignorar (a própria consulta)
+
+        Returns:
+            lista de (fonte, similaridade), da mais parecida para a menos
+        """
+        if approximate and self.lsh_tables:
+            top = self._approximate(vector, k, exclude)
+        else:
+            top = self._exact_block([vector], k, [exclude])[0]
+        return [(self.sources[position], score) for position, score in top]
+
+    def most_similar(self, source, k=10, approximate=False):
+        """Os k documentos mais parecidos com um documento do índice (sem ele mesmo)"""
+        position = self._positions.get(source)
+        if position is None:
+            return []
+        return self.search(self.vectors[position], k, approximate, exclude=position)
+
+    def neighbors(self, k=5, block_size=256, approximate=False):
+        """
+        Vizinhos mais próximos de todos os documentos, em blocos
+
+        Cada bloco de consultas busca cada lista do índice invertido uma única
+        vez; a memória fica limitada aos acumuladores do bloco (no máximo
+        block_size x documentos), mesmo em corpora grandes.
+
+        Yields:
+            (fonte, [(fonte vizinha, similaridade), ...])
+        """
+        for start in range(0, len(self.vectors), block_size):
+            block = range(start, min(start + block_size, len(self.vectors)))
+            if approximate and self.lsh_tables:
+                results = [self._approximate(self.vectors[position], k, position) for position in block]
+            else:
+                results = self._exact_block([self.vectors[position] for position in block], k, block)
+            for position, top in zip(block, results):
+                yield self.sources[position], [(self.sources[other], score) for other, score in top]
+
+    def _exact_block(self, queries, k, exclude):
+        """Top-k exato de um bloco de vetores pelo índice invertido"""
+        by_column = {}
+        for index, (cols, weights) in enumerate(queries):
+            for column, weight in zip(cols, weights):
+                by_column.setdefault(column, []).append((index, weight))
+
+        accumulators = [{} for _ in queries]
+        for column, entries in by_column.items():
+            postings = self.postings.get(column)
+            if postings is None:
+                continue
+            documents, doc_weights = postings
+            for index, weight in entries:
+                scores = accumulators[index]
+                get = scores.get
+                for position, doc_weight in zip(documents, doc_weights):
+                    scores[position] = get(position, 0.0) + weight * doc_weight
+
+        results = []
+        for scores, skip in zip(accumulators, exclude):
+            scores.pop(skip, None)
+            # Seleção parcial O(n log k): só os k maiores são ordenados
+            results.append(heapq.nlargest(k, scores.items(), key=itemgetter(1)))
+        return results
+
+    def _approximate(self, vector, k, exclude):
+        """Top-k entre os documentos que caem nos mesmos buckets LSH do vetor"""
+        candidates = set()
+        for table, signature in enumerate(self._signatures(*vector)):
+            candidates.update(self.buckets[table].get(signature, ()))
+        candidates.discard(exclude)
+
+        query = dict(zip(*vector))
+        scores = []
+        for position in candidates:
+            cols, weights = self.vectors[position]
+            score = sum(weight * query.get(column, 0.0) for column, weight in zip(cols, weights))
+            if score > 0:
+                scores.append((position, score))
+        return heapq.nlargest(k, scores, key=itemgetter(1))
+
+    def _signatures(self, cols, weights):
+        """
+        Assinatura de um vetor em cada tabela LSH, por projeção aleatória esparsa
+
+        Em cada tabela, cada coluna entra em um único hiperplano, com sinal +1
+        ou -1, tirados de um hash (splitmix64) da coluna: não há matriz
+        aleatória guardada e o custo por documento é termos x tabelas. Cada
+        bit é o sinal de uma projeção, então vetores com cosseno alto tendem a
+        ter a mesma assinatura.
+        """
+        if not self.lsh_tables:
+            return []
+        sums = [[0.0] * self.lsh_bits for _ in range(self.lsh_tables)]
+        for column, weight in zip(cols, weights):
+            codes = self._projection.get(column)
+            if codes is None:
+                codes = self._projection[column] = self._projection_codes(column)
+            for table_sums, code in zip(sums, codes):
+                if code & 1:
+                    table_sums[code >> 1] += weight
+                else:
+                    table_sums[code >> 1] -= weight
+
+        signatures = []
+        for table_sums in sums:
+            signature = 0
+            for plane, total in enumerate(table_sums):
+                if total > 0:
+                    signature |= 1 << plane
+            signatures.append(signature)
+        return signatures
+
+    def _projection_codes(self, column):
+        """Hiperplano e sinal (hiperplano * 2 + sinal) de uma coluna em cada tabela"""
+        codes = []
+        for table in range(self.lsh_tables):
+            bits = _mix64((((self.seed << 40) ^ (column << 8) ^ table) + 1) & _MASK64)
+            codes.append((bits >> 1) % self.lsh_bits << 1 | bits & 1)
+        return tuple(codes)
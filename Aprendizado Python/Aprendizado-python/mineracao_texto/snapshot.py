@@ -0,0 +1,151 @@
+"""Snapshot binário do corpus indexado, reaberto via mmap"""
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from pathlib import Path
+
+from .indice import Vocabulary, DocumentCounts, PresenceFilter
+
+
+# Snapshot binário do corpus: cabeçalho fixo seguido de seções alinhadas em 8 bytes
+#   vocabulário    UTF-8, um token por linha (tokens nunca contêm '\n')
+#   doc_offsets    uint64[n_docs + 1], início das entradas de cada documento
+#   ids            uint32[n_entries], ids ordenados de cada documento
+#   counts         uint32[n_entries], contagens paralelas aos ids
+#   metadados      JSON (fontes, totais, hashes, caminhos)
+#   filtros        uint64[n_docs + 1] de início de cada filtro, seguido dos
+#                  PresenceFilter de todos os documentos (opcional: o último
+#                  campo do cabeçalho, antes reservado, guarda o offset ou 0)
+SNAPSHOT_MAGIC = b'TFASNAP\x00'
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('<8sIIQQQ' + 'Q' * 8)
+
+
+def _align8(offset):
+    return (offset + 7) & ~7
+
+
+def _little_endian(values):
+    """Retorna os bytes de um array em little-endian, independente da plataforma"""
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(path, vocabulary, texts, extra_metadata=None):
+    """
+    Grava vocabulário e contagens por documento em um snapshot versionado
+    
+    Args:
+        path: arquivo de destino
+        vocabulary: Vocabulary compartilhado pelas contagens
+        texts: registros de texto já indexados (com 'counts')
+        extra_metadata: dicionário opcional gravado junto aos metadados
+    """
+    vocab_blob = '\n'.join(vocabulary.tokens).encode('utf-8')
+    doc_offsets = array('Q', [0])
+    all_ids = array('I')
+    all_counts = array('I')
+    filter_offsets = array('Q', [0])
+    filters = bytearray()
+    probe_cache = {}
+    documents = []
+    
+    for text_data in texts:
+        counts = text_data['counts']
+        all_ids.extend(counts.ids)
+        all_counts.extend(counts.counts)
+        doc_offsets.append(len(all_ids))
+        presence = counts.presence or PresenceFilter.from_ids(counts.ids, probe_cache)
+        filters += presence.bits
+        filter_offsets.append(len(filters))
+        info = {key: value for key, value in text_data.items() if key not in ('text', 'counts', 'positions', 'sections')}
+        info['total'] = counts.total
+        documents.append(info)
+    
+    metadata = json.dumps({
+        'documents': documents,
+        'extra': extra_metadata or {},
+    }, ensure_ascii=False).encode('utf-8')
+    
+    sections = [vocab_blob, _little_endian(doc_offsets), _little_endian(all_ids),
+                _little_endian(all_counts), metadata, _little_endian(filter_offsets) + filters]
+    offsets = []
+    position = _align8(_SNAPSHOT_HEADER.size)
+    for section in sections:
+        offsets.append(position)
+        position = _align8(position + len(section))
+    
+    header = _SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0,
+        len(vocabulary), len(documents), len(all_ids),
+        offsets[0], len(vocab_blob), offsets[1], offsets[2], offsets[3],
+        offsets[4], len(metadata), offsets[5],
+    )
+    
+    tmp_path = Path(str(path) + '.tmp')
+    with open(tmp_path, 'wb') as file:
+        file.write(header)
+        for offset, section in zip(offsets, sections):
+            file.write(b'\x00' * (offset - file.tell()))
+            file.write(section)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    """
+    Abre um snapshot via mmap, sem copiar as contagens para a memória
+    
+    Returns:
+        (vocabulary, texts, extra_metadata), onde cada registro de texto tem
+        'text' = None e 'counts' apontando para fatias do arquivo mapeado
+    """
+    with open(path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    view = memoryview(buffer)
+    (magic, version, _, n_terms, n_docs, n_entries,
+     vocab_offset, vocab_length, doc_offsets_offset, ids_offset, counts_offset,
+     metadata_offset, metadata_length, filters_offset) = _SNAPSHOT_HEADER.unpack_from(buffer)
+    
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"Arquivo não é um snapshot válido: {path}")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Versão de snapshot não suportada: {version} (esperada {SNAPSHOT_VERSION})")
+    
+    def section(offset, count, typecode):
+        data = view[offset:offset + count * array(typecode).itemsize]
+        if sys.byteorder == 'little':
+            return data.cast(typecode)
+        values = array(typecode, data)
+        values.byteswap()
+        return values
+    
+    doc_offsets = section(doc_offsets_offset, n_docs + 1, 'Q')
+    ids = section(ids_offset, n_entries, 'I')
+    counts = section(counts_offset, n_entries, 'I')
+    metadata = json.loads(bytes(view[metadata_offset:metadata_offset + metadata_length]).decode('utf-8'))
+    
+    vocabulary = Vocabulary.from_blob(view[vocab_offset:vocab_offset + vocab_length])
+    
+    # Snapshots gravados antes dos filtros têm 0 no campo: consultas sem pré-filtro
+    filters = None
+    if filters_offset:
+        filter_offsets = section(filters_offset, n_docs + 1, 'Q')
+        filters = view[filters_offset + 8 * (n_docs + 1):]
+    
+    texts = []
+    for doc_index, info in enumerate(metadata['documents']):
+        start, end = doc_offsets[doc_index], doc_offsets[doc_index + 1]
+        info = dict(info)
+        total = info.pop('total')
+        presence = None
+        if filters is not None:
+            presence = PresenceFilter(filters[filter_offsets[doc_index]:filter_offsets[doc_index + 1]])
+        texts.append(dict(info, text=None, counts=DocumentCounts(ids[start:end], counts[start:end], total, presence)))
+    
+    return vocabulary, texts, metadata['extra']
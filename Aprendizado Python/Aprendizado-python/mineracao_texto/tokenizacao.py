@@ -0,0 +1,164 @@
+"""Tokenização e normalização de tokens (núcleo, sem dependências externas)"""
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+
+# Um token é uma sequência contínua de caracteres de palavra (letras, dígitos, _).
+# Equivale a preprocess_text() + split(), mas sem gerar o texto intermediário.
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def fold_case_counts(raw_counts):
+    """Agrupa um Counter sensível a maiúsculas em um Counter em minúsculas"""
+    folded = Counter()
+    for token, count in raw_counts.items():
+        folded[token.lower()] += count
+    return folded
+
+
+_VOWELS = frozenset('aeiouyáéíóúâêôãõàü')
+
+
+def _has_vowel(stem):
+    """Condição *v* do Porter/RSLP: o radical contém vogal (evita str<-string)"""
+    return any(ch in _VOWELS for ch in stem)
+
+
+def _open_stem(stem):
+    """
+    Radical aceito para -ing/-ed: tem vogal e não termina em consoante dobrada
+    (evita app<-apply, add<-added)
+    """
+    return (_has_vowel(stem)
+            and not (len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] not in _VOWELS))
+
+
+def _ly_stem(stem):
+    """Radical aceito para -ly: como _open_stem e terminado em consoante (evita fami<-family)"""
+    return _open_stem(stem) and stem[-1] not in _VOWELS
+
+
+# Regras de sufixo (sufixo, substituição, tamanho mínimo do radical, condição
+# sobre o radical ou None), testadas em ordem: a primeira que casar e cumprir
+# o tamanho e a condição é aplicada
+_PORTUGUESE_SUFFIXES = [
+    ('ões', 'ão', 2, None), ('oes', 'ao', 2, None), ('ães', 'ão', 2, None), ('aes', 'ao', 2, None),
+    ('ais', 'al', 2, _has_vowel), ('éis', 'el', 2, _has_vowel), ('eis', 'el', 2, _has_vowel),
+    ('óis', 'ol', 2, _has_vowel), ('ois', 'ol', 2, _has_vowel), ('les', 'l', 2, _has_vowel),
+    ('res', 'r', 2, _has_vowel), ('zes', 'z', 2, _has_vowel), ('ns', 'm', 2, _has_vowel),
+    ('is', 'il', 3, _has_vowel), ('s', '', 3, _has_vowel),
+]
+
+_ENGLISH_SUFFIXES = [
+    ('sses', 'ss', 2, None), ('ies', 'y', 2, None), ('ied', 'y', 2, None), ('ss', 'ss', 2, None),
+    ('us', 'us', 2, None), ('is', 'is', 2, None),
+    # -eed: agreed -> agree, mas speed/need/feed ficam inteiros
+    ('eed', 'ee', 3, _has_vowel), ('eed', 'eed', 0, None),
+    ('ing', '', 3, _open_stem), ('edly', '', 3, _open_stem), ('ed', '', 3, _open_stem),
+    ('ly', '', 3, _ly_stem), ('s', '', 3, _has_vowel),
+]
+
+# Palavras que as regras de plural deformariam (listas de exceção do RSLP)
+_PORTUGUESE_EXCEPTIONS = frozenset([
+    'lápis', 'cais', 'mais', 'demais', 'crúcis', 'biquínis', 'pois', 'depois', 'dois', 'leis',
+    'tênis', 'pires', 'oásis', 'grátis', 'íris', 'atlas', 'ônibus', 'vírus', 'através', 'simples',
+    'ourives', 'óculos', 'férias', 'parabéns', 'três',
+])
+
+_ENGLISH_EXCEPTIONS = frozenset([
+    'series', 'species', 'news', 'always', 'perhaps', 'thus', 'various', 'during', 'nothing',
+    'something', 'anything', 'everything', 'morning', 'evening', 'ceiling',
+])
+
+
+def _strip_suffix(word, rules, exceptions=frozenset()):
+    """Aplica a primeira regra de sufixo cujo radical restante seja grande o bastante e cumpra a condição"""
+    if word.lower() in exceptions:
+        return word
+    for suffix, replacement, min_stem, condition in rules:
+        if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+            stem = word[:len(word) - len(suffix)]
+            if condition is None or condition(stem.lower()):
+                return stem + replacement
+    return word
+
+
+def stem_portuguese(word):
+    """Radicalizador leve para português (redução de plural, no estilo do RSLP)"""
+    return _strip_suffix(word, _PORTUGUESE_SUFFIXES, _PORTUGUESE_EXCEPTIONS)
+
+
+def stem_english(word):
+    """Radicalizador leve para inglês (plural e sufixos -ing/-ed/-ly, com as condições do Porter)"""
+    return _strip_suffix(word, _ENGLISH_SUFFIXES, _ENGLISH_EXCEPTIONS)
+
+
+STEMMERS = {
+    'pt': stem_portuguese,
+    'en': stem_english,
+}
+
+
+def strip_accents(word):
+    """Remove acentos decompondo o texto (NFD) e descartando as marcas combinantes"""
+    decomposed = unicodedata.normalize('NFD', word)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+class TextNormalizer:
+    """
+    Pipeline opcional de normalização de tokens
+    
+    Etapas, nesta ordem: forma Unicode (NFKC), minúsculas, radicalização e
+    remoção de acentos. Cada token distinto passa pelo pipeline uma única vez
+    graças a uma tabela LRU, então o custo cresce com o tamanho do vocabulário
+    e não com o número de tokens do texto.
+    """
+    
+    def __init__(self, unicode_form='NFKC', remove_accents=False, stemmer=None, cache_size=262144):
+        """
+        Args:
+            unicode_form: forma de normalização Unicode ('NFKC', 'NFC'...) ou None
+            remove_accents: se True, "segurança" e "seguranca" viram o mesmo token
+            stemmer: 'pt', 'en', uma função palavra -> radical, ou None
+            cache_size: número máximo de tokens memorizados
+        """
+        if isinstance(stemmer, str):
+            if stemmer not in STEMMERS:
+                raise ValueError(f"Radicalizador desconhecido: {stemmer} (use {list(STEMMERS)})")
+            stemmer = STEMMERS[stemmer]
+        
+        self.unicode_form = unicode_form
+        self.remove_accents = remove_accents
+        self.stemmer = stemmer
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize_token)
+    
+    def _normalize_token(self, token, fold_case=True):
+        """Executa o pipeline completo para um único token (sem memória)"""
+        if self.unicode_form:
+            token = unicodedata.normalize(self.unicode_form, token)
+        if fold_case:
+            token = token.lower()
+        if self.stemmer is not None:
+            token = self.stemmer(token)
+        if self.remove_accents:
+            token = strip_accents(token)
+        return token
+    
+    def normalize_counts(self, raw_counts, fold_case=True):
+        """Agrupa um Counter de tokens originais pelas suas formas normalizadas"""
+        normalize = self.normalize
+        normalized = Counter()
+        for token, count in raw_counts.items():
+            normalized[normalize(token, fold_case)] += count
+        return normalized
+    
+    def cache_info(self):
+        """Estatísticas da tabela de memorização (acertos, falhas, tamanho)"""
+        return self.normalize.cache_info()
+
+
+# Tokens e fins de sentença em uma única varredura: grupo 1 = token, grupo 2 = pontuação final
+SENTENCE_TOKEN_PATTERN = re.compile(r'(\w+)|([.!?]+)(?=\s|$)')
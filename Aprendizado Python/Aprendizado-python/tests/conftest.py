@@ -0,0 +1,36 @@
+"""Corpora sintéticos compartilhados pelos testes"""
+import random
+
+import pytest
+
+PALAVRAS = ['dados', 'Dados', 'análise', 'modelo', 'Python', 'python', 'texto', 'corpus',
+            'frequência', 'mineração', 'estatística', 'aprendizado', 'rede', 'neural', 'big',
+            'data', 'gráfico', 'relatório', 'ciência', 'máquina', 'algoritmo', 'teste']
+ALVOS = ['dados', 'python', 'análise', 'modelo']
+
+
+def escrever_corpus(pasta, documentos=12, palavras=400, seed=7):
+    """Grava `documentos` arquivos .txt com palavras sorteadas (reprodutível)"""
+    rng = random.Random(seed)
+    pasta.mkdir(parents=True, exist_ok=True)
+    for numero in range(documentos):
+        linhas = []
+        for _ in range(palavras // 20):
+            linhas.append(' '.join(rng.choice(PALAVRAS) for _ in range(20)) + '.')
+        (pasta / f"doc_{numero:02d}.txt").write_text('\n'.join(linhas), encoding='utf-8')
+    return pasta
+
+
+def contagens_por_fonte(analyzer):
+    """{fonte: {token: ocorrências}}, independente dos ids do vocabulário"""
+    tokens = analyzer.vocabulary.tokens
+    return {
+        text_data['source']: {tokens[term_id]: count
+                              for term_id, count in analyzer.document_counts(text_data).items()}
+        for text_data in analyzer.texts
+    }
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    return escrever_corpus(tmp_path / 'corpus')
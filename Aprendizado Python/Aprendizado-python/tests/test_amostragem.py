@@ -0,0 +1,68 @@
+"""Prévia por amostragem com intervalos de confiança"""
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer
+from mineracao_texto.carregadores import read_chunk
+from conftest import escrever_corpus
+
+
+@pytest.fixture(scope='module')
+def corpus_grande(tmp_path_factory):
+    pasta = escrever_corpus(tmp_path_factory.mktemp('amostra') / 'corpus', documentos=40, palavras=600)
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.load_folder(pasta, ['.txt'])
+    totais = {palavra: sum(item['frequency'] for item in itens)
+              for palavra, itens in analyzer.analyze_frequency(['dados', 'big data']).items()}
+    return pasta, totais
+
+
+def test_trechos_consecutivos_cobrem_o_arquivo(tmp_path):
+    arquivo = tmp_path / 'grande.txt'
+    linhas = [f'linha {i} ' + 'x' * (i % 17) + '\n' for i in range(500)]
+    arquivo.write_text(''.join(linhas), encoding='utf-8')
+    tamanho = arquivo.stat().st_size
+
+    for passo in (1, 7, 100, 4096):
+        trechos = [read_chunk(arquivo, inicio, min(inicio + passo, tamanho))
+                   for inicio in range(0, tamanho, passo)]
+        assert ''.join(trechos) == ''.join(linhas)
+
+
+def test_amostra_completa_e_exata(corpus_grande):
+    pasta, totais = corpus_grande
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    resultado = analyzer.estimate_frequency(pasta, ['dados', 'big data'], sample_size=100, seed=1)
+
+    assert resultado['exato'] and resultado['unidades_lidas'] == 40
+    for palavra, total in totais.items():
+        estimativa = resultado['palavras'][palavra]
+        assert estimativa['estimativa'] == estimativa['inferior'] == estimativa['superior'] == total
+
+
+def test_intervalo_cobre_o_total(corpus_grande):
+    pasta, totais = corpus_grande
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    cobertos = 0
+    for seed in range(40):
+        resultado = analyzer.estimate_frequency(pasta, ['dados'], sample_size=10, seed=seed)
+        estimativa = resultado['palavras']['dados']
+        assert resultado['unidades_lidas'] == 10 and not resultado['exato']
+        cobertos += estimativa['inferior'] <= totais['dados'] <= estimativa['superior']
+    # Intervalos de 95%: a grande maioria deve conter o total real
+    assert cobertos >= 32
+
+
+def test_palavra_ausente_tem_limite_superior(corpus_grande):
+    pasta, _ = corpus_grande
+    resultado = TextFrequencyAnalyzer(verbose=0).estimate_frequency(pasta, ['inexistente'], sample_size=10, seed=3)
+    estimativa = resultado['palavras']['inexistente']
+    assert estimativa['estimativa'] == estimativa['inferior'] == 0
+    assert 0 < estimativa['superior'] < float('inf')
+
+
+def test_precisao_amplia_a_amostra(corpus_grande):
+    pasta, _ = corpus_grande
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    resultado = analyzer.estimate_frequency(pasta, ['dados'], sample_size=5, precision=0.02, seed=2)
+    assert resultado['unidades_lidas'] > 5
+    assert resultado['palavras']['dados']['erro_relativo'] <= 0.02
@@ -0,0 +1,55 @@
+"""Classificação de arquivos pelos primeiros bytes e leitura limitada de pastas"""
+from concurrent.futures import ThreadPoolExecutor
+
+from mineracao_texto import TextFrequencyAnalyzer
+from mineracao_texto.analisador import _bounded_map
+from mineracao_texto.carregadores import sniff_bytes
+
+
+def test_assinatura_curta_imprimivel_em_texto():
+    assert sniff_bytes(b'MZ era a sigla usada no relatorio.\n') == 'texto'
+    assert sniff_bytes(b'ID3 resultados da terceira rodada\n') == 'texto'
+
+
+def test_assinatura_curta_em_binario():
+    assert sniff_bytes(b'MZ\x90\x00\x03\x00\x00\x00\x04\x00') == 'executavel'
+
+
+def test_assinatura_longa_vale_sempre():
+    assert sniff_bytes(b'\x89PNG\r\n\x1a\n' + b'abc') == 'imagem'
+    assert sniff_bytes(b'') == 'vazio'
+    assert sniff_bytes('﻿dados'.encode('utf-16')) == 'utf16'
+
+
+def test_pasta_ignora_binarios_sem_le_los(tmp_path):
+    (tmp_path / 'a.txt').write_text('dados e modelos', encoding='utf-8')
+    (tmp_path / 'b.txt').write_text('dados', encoding='utf-16')
+    (tmp_path / 'figura.txt').write_bytes(b'\x89PNG\r\n\x1a\n' + bytes(200))
+    (tmp_path / 'vazio.txt').write_text('  ', encoding='utf-8')
+
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    assert analyzer.load_folder(tmp_path, ['.txt']) == 2
+    assert sorted((path.name, kind) for path, kind in analyzer.skipped_files) == [
+        ('figura.txt', 'imagem'), ('vazio.txt', 'vazio')]
+    textos = {text_data['source']: text_data['text'] for text_data in analyzer.texts}
+    assert textos['b'].lstrip('﻿') == 'dados'
+
+
+class ExecutorContado(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enviadas = 0
+
+    def submit(self, *args, **kwargs):
+        self.enviadas += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_leituras_pendentes_limitadas():
+    with ExecutorContado(max_workers=2) as executor:
+        resultados = _bounded_map(executor, str, range(100), 4)
+        assert next(resultados) == '0'
+        # Só a janela foi enviada aos workers; o resto espera o consumo
+        assert executor.enviadas == 4
+        assert list(resultados) == [str(n) for n in range(1, 100)]
+        assert executor.enviadas == 100
@@ -0,0 +1,80 @@
+"""Leitura de corpora direto de arquivos .zip, .tar.gz e .gz"""
+import gzip
+import tarfile
+import zipfile
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer
+from mineracao_texto.carregadores import archive_format
+
+MEMBROS = {'a.txt': 'dados e mais dados', 'sub/b.txt': 'modelo de dados', 'c.md': 'dados'}
+
+
+def contagens(analyzer):
+    return {text_data['source']: analyzer.analyze_individual_files(['dados'])[text_data['source']]
+            ['palavras_encontradas']['dados'] for text_data in analyzer.texts}
+
+
+@pytest.fixture
+def compactado_zip(tmp_path):
+    caminho = tmp_path / 'corpus.zip'
+    with zipfile.ZipFile(caminho, 'w') as zf:
+        for nome, texto in MEMBROS.items():
+            zf.writestr(nome, texto)
+        zf.writestr('figura.txt', b'\x89PNG\r\n\x1a\n' + bytes(100))
+    return caminho
+
+
+def test_formatos():
+    assert archive_format('x.zip') == 'zip'
+    assert archive_format('x.tar.gz') and archive_format('x.tgz')
+    assert archive_format('x.txt.gz')
+    assert not archive_format('x.txt')
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_zip_filtra_membros_por_extensao(compactado_zip, workers):
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    assert analyzer.load_folder(compactado_zip, ['.txt'], workers=workers) == 2
+
+    assert contagens(analyzer) == {'corpus.zip/a': 2, 'corpus.zip/sub/b': 1}
+    assert [kind for _, kind in analyzer.skipped_files] == ['imagem']
+
+
+def test_tar_gz_igual_ao_zip(tmp_path, compactado_zip):
+    pasta = tmp_path / 'fontes'
+    for nome, texto in MEMBROS.items():
+        (pasta / nome).parent.mkdir(parents=True, exist_ok=True)
+        (pasta / nome).write_text(texto, encoding='utf-8')
+    caminho = tmp_path / 'corpus.tar.gz'
+    with tarfile.open(caminho, 'w:gz') as tar:
+        for nome in MEMBROS:
+            tar.add(pasta / nome, arcname=nome)
+
+    de_tar = TextFrequencyAnalyzer(verbose=0)
+    de_zip = TextFrequencyAnalyzer(verbose=0)
+    assert de_tar.load_archive(caminho) == de_zip.load_archive(compactado_zip) == 3
+    assert sorted(contagens(de_tar).values()) == sorted(contagens(de_zip).values())
+
+
+def test_compactados_dentro_da_pasta(tmp_path, compactado_zip):
+    (tmp_path / 'solto.txt').write_text('dados soltos', encoding='utf-8')
+    with gzip.open(tmp_path / 'notas.txt.gz', 'wt', encoding='utf-8') as gz:
+        gz.write('dados comprimidos e dados')
+
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.load_folder(tmp_path, ['.txt'])
+
+    assert contagens(analyzer) == {'solto': 1, 'corpus.zip/a': 2, 'corpus.zip/sub/b': 1,
+                                   'notas.txt.gz/notas': 2}
+
+
+def test_membros_sem_texto(compactado_zip):
+    com_textos = TextFrequencyAnalyzer(verbose=0)
+    com_textos.load_archive(compactado_zip)
+    sem_textos = TextFrequencyAnalyzer(verbose=0)
+    sem_textos.load_archive(compactado_zip, keep_texts=False)
+
+    assert all(text_data['text'] is None for text_data in sem_textos.texts)
+    assert contagens(sem_textos) == contagens(com_textos)
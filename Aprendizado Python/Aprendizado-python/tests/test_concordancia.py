@@ -0,0 +1,48 @@
+"""Concordância KWIC paginada"""
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer
+
+
+@pytest.fixture
+def analisador():
+    analyzer = TextFrequencyAnalyzer()
+    analyzer.add_text('um dados dois Dados três dados quatro', 'a')
+    analyzer.add_text('nada aqui', 'b')
+    analyzer.add_text('dados no fim', 'c')
+    return analyzer
+
+
+def test_linhas_com_contexto(analisador):
+    resultado = analisador.concordance('dados', width=1, page_size=10)
+
+    assert resultado['total'] == 4
+    assert [(linha['fonte'], linha['posicao']) for linha in resultado['linhas']] == [
+        ('a', 1), ('a', 3), ('a', 5), ('c', 0)]
+    assert resultado['linhas'][1] == {'fonte': 'a', 'posicao': 3, 'esquerda': 'dois',
+                                      'palavra': 'Dados', 'direita': 'três'}
+    assert resultado['linhas'][3]['esquerda'] == ''
+
+
+def test_paginas(analisador):
+    segunda = analisador.concordance('dados', page=2, page_size=3)
+
+    assert (segunda['pagina'], segunda['paginas']) == (2, 2)
+    assert [linha['fonte'] for linha in segunda['linhas']] == ['c']
+
+
+@pytest.mark.parametrize('pedida, esperada', [(0, 1), (-5, 1), (99, 2)])
+def test_pagina_fora_do_intervalo_e_limitada(analisador, pedida, esperada):
+    resultado = analisador.concordance('dados', page=pedida, page_size=3)
+    assert resultado['pagina'] == esperada
+    assert resultado['linhas']
+
+
+def test_palavra_ausente(analisador):
+    assert analisador.concordance('inexistente') == {'total': 0, 'pagina': 1, 'paginas': 1, 'linhas': []}
+
+
+@pytest.mark.parametrize('opcoes', [{'page_size': 0}, {'page_size': -3}, {'width': -1}])
+def test_argumentos_invalidos(analisador, opcoes):
+    with pytest.raises(ValueError):
+        analisador.concordance('dados', **opcoes)
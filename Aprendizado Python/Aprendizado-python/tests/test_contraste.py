@@ -0,0 +1,72 @@
+"""Comparação entre dois corpora por log-verossimilhança e log-ratio"""
+import math
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer
+from mineracao_texto.contraste import load_corpus, keyness
+from mineracao_texto.estatisticas import log_likelihood, log_ratio, chi2_p_value
+from mineracao_texto.relatorios import report_keyness
+
+
+def analisador(*textos):
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    for numero, texto in enumerate(textos):
+        analyzer.add_text(texto, f"doc_{numero}")
+    return analyzer
+
+
+def test_medidas_conferem_com_a_formula():
+    # Exemplo clássico: 10 em 1000 tokens x 2 em 1000 tokens
+    esperado = 2 * (10 * math.log(10 / 6) + 2 * math.log(2 / 6))
+    assert log_likelihood(10, 2, 1000, 1000) == pytest.approx(esperado)
+    assert log_ratio(10, 2, 1000, 1000) == pytest.approx(math.log2(5))
+    assert log_ratio(4, 0, 1000, 1000) == pytest.approx(math.log2(8))
+    assert chi2_p_value(3.841458820694124) == pytest.approx(0.05)
+
+
+def test_keyness_favorece_o_corpus_certo():
+    a = analisador('dados ' * 30 + 'texto ' * 10, 'dados modelo ' * 5)
+    b = analisador('rede ' * 30 + 'texto ' * 10, 'rede modelo ' * 5)
+
+    comparacao = keyness(a, b, min_count=1, name_a='A', name_b='B')
+    por_termo = {item['termo']: item for item in comparacao['termos']}
+
+    assert por_termo['dados']['favorece'] == 'A' and por_termo['dados']['freq_b'] == 0
+    assert por_termo['rede']['favorece'] == 'B'
+    assert comparacao['termos'][0]['termo'] in ('dados', 'rede')
+    assert [item['log_likelihood'] for item in comparacao['termos']] == sorted(
+        (item['log_likelihood'] for item in comparacao['termos']), reverse=True)
+
+
+def test_mesma_frequencia_relativa_e_neutra(capsys):
+    a = analisador('texto ' * 10 + 'dados ' * 10)
+    b = analisador('texto ' * 30 + 'rede ' * 30)
+
+    comparacao = keyness(a, b, min_count=1, name_a='A', name_b='B')
+    texto = next(item for item in comparacao['termos'] if item['termo'] == 'texto')
+
+    assert texto['log_ratio'] == 0.0 and texto['log_likelihood'] == pytest.approx(0.0)
+    assert texto['favorece'] is None
+    report_keyness(comparacao)
+    listados = [linha.split()[0] for linha in capsys.readouterr().out.splitlines() if linha.startswith('   ')]
+    assert 'texto' not in listados and {'dados', 'rede'} <= set(listados)
+
+
+def test_cache_separado_por_extensoes(tmp_path, capsys):
+    pasta = tmp_path / 'corpus'
+    pasta.mkdir()
+    (pasta / 'a.txt').write_text('dados dados modelo', encoding='utf-8')
+    (pasta / 'b.md').write_text('rede rede rede', encoding='utf-8')
+    cache = tmp_path / 'cache'
+
+    todos = load_corpus(pasta, cache)
+    so_txt = load_corpus(pasta, cache, ['.txt'])
+    assert len(todos.texts) == 2 and len(so_txt.texts) == 1
+    assert len(list(cache.iterdir())) == 2
+
+    capsys.readouterr()
+    de_novo = load_corpus(pasta, cache, ['.txt'])
+    assert 'reaproveitadas' in capsys.readouterr().out
+    assert [text_data['source'] for text_data in de_novo.texts] == ['a']
+    assert de_novo.corpus_counts().total == 3
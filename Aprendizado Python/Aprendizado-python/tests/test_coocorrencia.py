@@ -0,0 +1,44 @@
+"""Co-ocorrência por janela de tokens e por sentença"""
+from mineracao_texto import TextFrequencyAnalyzer
+
+
+def coocorrencias(*textos, window=3):
+    analyzer = TextFrequencyAnalyzer()
+    for numero, texto in enumerate(textos):
+        analyzer.add_text(texto, f"doc{numero}")
+    return analyzer.analyze_cooccurrence(['dados', 'modelo', 'python'], window=window)
+
+
+def test_janela_e_sentenca():
+    resultados = coocorrencias('Dados x x modelo. Python dados')
+    janela, sentenca = resultados['janela'], resultados['sentenca']
+
+    # dados(1)-modelo(4), modelo(4)-python(5), modelo(4)-dados(6), python(5)-dados(6)
+    assert janela.get('dados', 'modelo') == 2
+    assert janela.get('modelo', 'python') == 1
+    assert janela.get('python', 'dados') == 1
+    assert sentenca.get('dados', 'modelo') == 1
+    assert sentenca.get('dados', 'python') == 1
+    assert sentenca.get('modelo', 'python') == 0
+
+
+def test_janela_nao_alcanca_termos_distantes():
+    resultados = coocorrencias('dados a b c d modelo', window=4)
+    assert resultados['janela'].get('dados', 'modelo') == 0
+    assert resultados['sentenca'].get('dados', 'modelo') == 1
+
+
+def test_par_conta_uma_vez_por_sentenca():
+    resultados = coocorrencias('dados modelo dados modelo. dados')
+    assert resultados['sentenca'].get('dados', 'modelo') == 1
+
+
+def test_corpus_soma_os_arquivos():
+    resultados = coocorrencias('dados modelo', 'modelo dados. dados')
+    por_arquivo = resultados['por_arquivo']
+
+    assert set(por_arquivo) == {'doc0', 'doc1'}
+    assert resultados['janela'].get('dados', 'modelo') == sum(
+        matrizes['janela'].get('dados', 'modelo') for matrizes in por_arquivo.values())
+    df = resultados['janela'].to_dataframe()
+    assert df.loc['dados', 'modelo'] == df.loc['modelo', 'dados'] == 3
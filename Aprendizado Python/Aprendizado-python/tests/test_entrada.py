@@ -0,0 +1,59 @@
+"""Texto colado e entrada padrão contados linha a linha"""
+import hashlib
+import io
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, cli
+from mineracao_texto.carregadores import LineCounter
+from mineracao_texto.secoes import SectionSegmenter
+
+TEXTO = "Dados e modelos.\nMais dados, mais Modelos!\n\nfim"
+
+
+def test_contador_de_linhas():
+    contador = LineCounter()
+    for linha in io.StringIO(TEXTO):
+        contador.feed(linha)
+
+    assert contador.characters == len(TEXTO)
+    assert contador.lines == 4
+    assert contador.words == 8
+    assert contador.raw_counts['dados'] == 1 and contador.raw_counts['Dados'] == 1
+    assert contador.sha1 == hashlib.sha1(TEXTO.encode('utf-8')).hexdigest()
+
+
+def test_contador_com_segmentador_conta_as_mesmas_palavras():
+    contador = LineCounter(SectionSegmenter())
+    for linha in io.StringIO(TEXTO):
+        contador.feed(linha)
+    assert contador.words == 8
+    assert contador.raw_counts == {}
+
+
+@pytest.mark.parametrize('segment_sections', [False, True])
+def test_fluxo_conta_igual_ao_texto(segment_sections):
+    fluxo = TextFrequencyAnalyzer(verbose=0, segment_sections=segment_sections)
+    assert fluxo.add_text_stream(io.StringIO(TEXTO), 'entrada')
+    texto = TextFrequencyAnalyzer(verbose=0, segment_sections=segment_sections)
+    texto.add_text(TEXTO, 'entrada')
+
+    assert fluxo.texts[0]['text'] is None
+    assert fluxo.texts[0]['sha1'] == hashlib.sha1(TEXTO.encode('utf-8')).hexdigest()
+    alvos = ['dados', 'modelos']
+    assert fluxo.analyze_individual_files(alvos) == texto.analyze_individual_files(alvos)
+
+
+def test_entrada_padrao_so_com_hifen(monkeypatch, capsys):
+    abertos = []
+    monkeypatch.setattr(cli.TextFrequencyAnalyzer, 'interactive_menu', lambda self: abertos.append(True))
+    monkeypatch.setattr('sys.stdin', io.StringIO('5\n'))
+
+    # Sem argumentos o menu continua lendo as opções da entrada redirecionada
+    assert cli.main([]) == 0
+    assert abertos == [True]
+
+    monkeypatch.setattr('sys.stdin', io.StringIO('dados modelo dados\n'))
+    cli.main(['-', 'dados'])
+    saida = capsys.readouterr().out
+    assert 'stdin' in saida and abertos == [True]
@@ -0,0 +1,59 @@
+"""Estatísticas incrementais do resumo"""
+import math
+import random
+
+import pandas as pd
+import pandas.testing as pdt
+
+from mineracao_texto import TextFrequencyAnalyzer, RunningStats, P2Quantile
+from conftest import ALVOS
+
+
+def test_resumo_igual_ao_groupby_do_pandas(corpus):
+    analyzer = TextFrequencyAnalyzer()
+    analyzer.load_folder(corpus, ['.txt'])
+    analyzer.analyze_frequency(ALVOS)
+    resumo = analyzer.get_summary_stats()
+
+    df = analyzer.create_frequency_dataframe()
+    esperado = df.groupby('palavra')['frequencia'].agg(['sum', 'mean', 'std', 'max', 'min']).round(2)
+    esperado.columns = ['Total', 'Média', 'Desvio Padrão', 'Máximo', 'Mínimo']
+
+    pdt.assert_frame_equal(resumo, esperado, check_names=False)
+
+
+def test_welford_e_extremos():
+    valores = [4, 8, 15, 16, 23, 42]
+    stats = RunningStats()
+    for valor in valores:
+        stats.add(valor)
+
+    serie = pd.Series(valores)
+    assert stats.total == sum(valores)
+    assert math.isclose(stats.mean, serie.mean())
+    assert math.isclose(stats.std(), serie.std())
+    assert (stats.minimum, stats.maximum) == (4, 42)
+
+
+def test_desvio_indefinido_com_um_valor():
+    stats = RunningStats()
+    stats.add(3)
+    assert math.isnan(stats.std())
+
+
+def test_quantil_exato_com_poucos_valores():
+    estimador = P2Quantile(0.5)
+    for valor in [5, 1, 3]:
+        estimador.add(valor)
+    assert estimador.value() == 3
+
+
+def test_quantil_p2_aproxima_o_exato():
+    rng = random.Random(11)
+    valores = [rng.gauss(100, 15) for _ in range(5000)]
+    estimador = P2Quantile(0.75)
+    for valor in valores:
+        estimador.add(valor)
+
+    exato = pd.Series(valores).quantile(0.75)
+    assert abs(estimador.value() - exato) < 1.5
@@ -0,0 +1,98 @@
+"""Filtros de presença e pré-filtros de documentos"""
+import random
+import struct
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, DocumentCounts, PresenceFilter, Vocabulary, read_snapshot
+from mineracao_texto.memoria import resident_bytes
+from mineracao_texto.snapshot import _SNAPSHOT_HEADER
+from conftest import contagens_por_fonte
+
+TEXTOS = {'a': 'os dados e o big data', 'b': 'um modelo de dados', 'c': 'nada de interessante aqui'}
+
+
+@pytest.mark.parametrize('tamanho', [0, 1, 7, 8, 9, 100, 1000, 5000])
+def test_filtro_nunca_da_falso_negativo(tamanho):
+    rng = random.Random(tamanho)
+    ids = sorted(rng.sample(range(10 * tamanho + 10), tamanho))
+    filtro = PresenceFilter.from_ids(ids)
+
+    assert all(filtro.may_contain(PresenceFilter.probes(term_id)) for term_id in ids)
+    ausentes = range(10 * tamanho + 10, 10 * tamanho + 10010)
+    falsos_positivos = sum(filtro.may_contain(PresenceFilter.probes(term_id)) for term_id in ausentes)
+    assert falsos_positivos <= 0.1 * len(ausentes)
+
+
+def test_contagens_filtradas_iguais_as_exatas():
+    rng = random.Random(4)
+    vocabulary = Vocabulary()
+    counts = DocumentCounts.from_tokens([f"t{rng.randrange(300)}" for _ in range(800)], vocabulary)
+    filtrado = DocumentCounts(counts.ids, counts.counts, counts.total, PresenceFilter.from_ids(counts.ids))
+
+    assert all(filtrado.get(term_id) == counts.get(term_id) for term_id in range(len(vocabulary) + 50))
+
+
+def analisador(**opcoes):
+    analyzer = TextFrequencyAnalyzer(verbose=0, **opcoes)
+    for fonte, texto in TEXTOS.items():
+        analyzer.add_text(texto, fonte)
+    analyzer.build_index()
+    return analyzer
+
+
+def test_runs_guardam_os_filtros_no_disco(tmp_path):
+    limitado = analisador(memory_budget_mb=0.00001, spill_dir=tmp_path)
+
+    assert all(text_data['counts'].presence is not None for text_data in limitado.texts)
+    # Filtros mapeados do run não ocupam o orçamento de memória
+    assert sum(resident_bytes(text_data) for text_data in limitado.texts) == 0
+    assert contagens_por_fonte(limitado) == contagens_por_fonte(analisador())
+
+
+def test_orcamento_nao_despeja_a_cada_documento(tmp_path):
+    analyzer = TextFrequencyAnalyzer(verbose=0, memory_budget_mb=0.05, spill_dir=tmp_path)
+    despejos = []
+    original = analyzer.spill_to_disk
+    analyzer.spill_to_disk = lambda: despejos.append(1) or original()
+    rng = random.Random(8)
+    for numero in range(300):
+        analyzer.add_text(' '.join(f"w{rng.randrange(5000)}" for _ in range(800)), f'd{numero}')
+    analyzer.build_index()
+
+    assert len(despejos) < 60
+    assert analyzer._spill_store.runs == 1
+
+
+def test_snapshot_antigo_sem_filtros(tmp_path):
+    original = analisador()
+    caminho = tmp_path / 'antigo.tfasnap'
+    assert original.save_snapshot(caminho)
+
+    # Snapshots anteriores aos filtros: último campo do cabeçalho zerado e sem a seção
+    dados = bytearray(caminho.read_bytes())
+    filters_offset = _SNAPSHOT_HEADER.unpack_from(dados)[-1]
+    struct.pack_into('<Q', dados, _SNAPSHOT_HEADER.size - 8, 0)
+    caminho.write_bytes(bytes(dados[:filters_offset]))
+
+    _, textos, _ = read_snapshot(caminho)
+    assert all(text_data['counts'].presence is None for text_data in textos)
+    reaberto = TextFrequencyAnalyzer.from_snapshot(caminho)
+    assert contagens_por_fonte(reaberto) == contagens_por_fonte(original)
+    assert (reaberto.analyze_individual_files(['dados', 'modelo'])
+            == original.analyze_individual_files(['dados', 'modelo']))
+
+
+def test_documentos_sem_as_partes_da_expressao_nao_sao_tokenizados(monkeypatch):
+    analyzer = analisador()
+    esperado = analyzer.analyze_individual_files(['big data', 'dados'])
+    tokenizados = []
+    original = analyzer._key_id_stream
+
+    def registrar(text, *args):
+        tokenizados.append(text)
+        return original(text, *args)
+
+    monkeypatch.setattr(analyzer, '_key_id_stream', registrar)
+    assert analyzer.analyze_individual_files(['big data', 'dados']) == esperado
+    assert tokenizados == [TEXTOS['a']]
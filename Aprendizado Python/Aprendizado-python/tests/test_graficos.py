@@ -0,0 +1,71 @@
+"""Mapas de calor e barras no modo escalável (muitos arquivos)"""
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from mineracao_texto import graficos
+
+
+def matriz(colunas):
+    """Matriz palavras x arquivos a partir de {arquivo: [frequências]}"""
+    return pd.DataFrame(colunas, index=['dados', 'modelo', 'python'])
+
+
+def test_faixas_agrupam_pela_media():
+    df = matriz({f"f{numero}": [numero, 2 * numero, 0] for numero in range(10)})
+
+    agrupado, tamanho = graficos.bin_files(df, 4)
+
+    assert tamanho == 3
+    assert list(agrupado.columns) == ['f0 (+2)', 'f3 (+2)', 'f6 (+2)', 'f9 (+0)']
+    assert agrupado.loc['dados'].tolist() == [1.0, 4.0, 7.0, 9.0]
+    assert agrupado.loc['modelo'].tolist() == [2.0, 8.0, 14.0, 18.0]
+
+
+def test_sem_faixas_quando_cabe():
+    df = matriz({'a': [1, 2, 3], 'b': [4, 5, 6]})
+    agrupado, tamanho = graficos.bin_files(df, 2)
+    assert tamanho == 1
+    assert agrupado is df
+
+
+def test_ordem_deixa_perfis_parecidos_lado_a_lado():
+    perfis = {'dados': [10, 1, 0], 'modelo': [0, 10, 1], 'python': [1, 0, 10], 'vazio': [0, 0, 0]}
+    colunas = {}
+    for numero in range(12):
+        nome = list(perfis)[numero % 4]
+        colunas[f"{nome}_{numero}"] = [valor * (1 + numero) for valor in perfis[nome]]
+
+    ordenado = graficos.order_files_by_similarity(matriz(colunas))
+
+    grupos = [coluna.split('_')[0] for coluna in ordenado.columns]
+    assert sorted(ordenado.columns) == sorted(colunas)
+    # Cada perfil forma um bloco contíguo e os arquivos vazios ficam no fim
+    assert grupos[-3:] == ['vazio'] * 3
+    assert sum(1 for anterior, atual in zip(grupos, grupos[1:]) if anterior != atual) == 3
+
+
+def test_mapa_de_calor_escalavel_limita_colunas_e_rotulos(monkeypatch):
+    monkeypatch.setattr(plt, 'show', lambda: None)
+    desenhados = []
+    original = graficos.sns.heatmap
+
+    def heatmap(data, **opcoes):
+        desenhados.append((data.shape, opcoes))
+        return original(data, **opcoes)
+
+    monkeypatch.setattr(graficos.sns, 'heatmap', heatmap)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.integers(0, 20, size=(3, 3000)), index=['dados', 'modelo', 'python'],
+                      columns=[f"arquivo_{numero}" for numero in range(3000)])
+
+    graficos._draw_file_heatmap(df, 'Mapa', 'Arquivos', 'Palavras', (10, 6))
+    plt.close('all')
+
+    (linhas, colunas), opcoes = desenhados[0]
+    limite = int(10 * plt.rcParams['figure.dpi'] / graficos.HEATMAP_PIXELS_PER_FILE)
+    assert linhas == 3 and colunas <= limite
+    assert opcoes['annot'] is False and opcoes['rasterized'] is True
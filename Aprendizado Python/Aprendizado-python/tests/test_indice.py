@@ -0,0 +1,47 @@
+"""Vocabulário compartilhado e contagens por id"""
+from mineracao_texto import TextFrequencyAnalyzer, Vocabulary, DocumentCounts
+from conftest import ALVOS
+
+
+def test_vocabulario_guarda_cada_token_uma_vez():
+    vocabulary = Vocabulary()
+    ids = [vocabulary.add(token) for token in ['dados', 'modelo', 'dados', 'Dados']]
+
+    assert ids == [0, 1, 0, 2]
+    assert len(vocabulary) == 3
+    assert vocabulary[2] == 'Dados'
+    assert vocabulary.get('texto') is None
+
+
+def test_contagens_ordenadas_por_id():
+    vocabulary = Vocabulary()
+    vocabulary.add('zeta')
+    counts = DocumentCounts.from_tokens(['alfa', 'zeta', 'alfa', 'beta'], vocabulary)
+
+    assert list(counts.items()) == [(0, 1), (1, 2), (2, 1)]
+    assert counts.total == 4
+    assert counts.get(vocabulary.get('alfa')) == 2
+    assert counts.get(99) == 0
+    assert counts.frequency([0, 1]) == 3
+
+
+def test_modos_consultam_as_mesmas_contagens():
+    analyzer = TextFrequencyAnalyzer()
+    analyzer.add_text('Dados dados DADOS modelo', 'a')
+    insensivel = analyzer.analyze_individual_files(['dados'])
+    contagens = analyzer.texts[0]['counts']
+    sensivel = analyzer.analyze_individual_files(['Dados'], case_sensitive=True)
+
+    assert analyzer.texts[0]['counts'] is contagens
+    assert insensivel['a']['palavras_encontradas'] == {'dados': 3}
+    assert sensivel['a']['palavras_encontradas'] == {'Dados': 1}
+
+
+def test_compactar_descarta_textos_sem_mudar_resultados(corpus):
+    analyzer = TextFrequencyAnalyzer()
+    analyzer.load_folder(corpus, ['.txt'])
+    antes = analyzer.analyze_individual_files(ALVOS)
+    analyzer.compact()
+
+    assert all(text_data['text'] is None for text_data in analyzer.texts)
+    assert analyzer.analyze_individual_files(ALVOS) == antes
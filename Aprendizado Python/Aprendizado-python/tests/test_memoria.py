@@ -0,0 +1,66 @@
+"""Orçamento de memória com despejo das contagens em runs no disco"""
+import os
+import random
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, SpillStore, DocumentCounts, Vocabulary
+from conftest import ALVOS, contagens_por_fonte, escrever_corpus
+
+
+def test_orcamento_de_memoria_nao_muda_contagens(tmp_path, corpus):
+    completo = TextFrequencyAnalyzer(verbose=0)
+    completo.load_folder(corpus, ['.txt'])
+    # Orçamento minúsculo: os textos são despejados em disco a cada arquivo
+    limitado = TextFrequencyAnalyzer(verbose=0, memory_budget_mb=0.001, spill_dir=tmp_path)
+    limitado.load_folder(corpus, ['.txt'])
+
+    assert limitado._spill_store is not None
+    assert all(text_data['text'] is None for text_data in limitado.texts)
+    assert contagens_por_fonte(limitado) == contagens_por_fonte(completo)
+    assert limitado.analyze_individual_files(ALVOS) == completo.analyze_individual_files(ALVOS)
+    assert list(limitado.corpus_counts().items()) == list(completo.corpus_counts().items())
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason="precisa de /proc/self/fd")
+def test_runs_e_descritores_limitados(tmp_path, monkeypatch):
+    pasta = escrever_corpus(tmp_path / 'grande', documentos=300, palavras=200)
+    abertos_antes = len(os.listdir('/proc/self/fd'))
+    maximo = [0]
+    analyzer = TextFrequencyAnalyzer(verbose=0, memory_budget_mb=0.001, spill_dir=tmp_path)
+    original = SpillStore.spill
+
+    def espiar(store, documents):
+        resultado = original(store, documents)
+        maximo[0] = max(maximo[0], store.runs)
+        return resultado
+
+    monkeypatch.setattr(SpillStore, 'spill', espiar)
+    analyzer.load_folder(pasta, ['.txt'])
+
+    # Um despejo por arquivo, mas os runs são juntados por tamanho e no fim da carga
+    assert maximo[0] <= 12
+    assert analyzer._spill_store.runs == 1
+    assert len(os.listdir('/proc/self/fd')) - abertos_antes <= 1
+    assert len(list(analyzer._spill_store.directory.iterdir())) == 1
+
+
+def test_juncao_descarta_documentos_que_sairam(tmp_path):
+    rng = random.Random(5)
+    vocabulary = Vocabulary()
+    store = SpillStore(tmp_path)
+    vivos = []
+    for numero in range(20):
+        counts = DocumentCounts.from_tokens([f"t{rng.randrange(40)}" for _ in range(30)], vocabulary)
+        esperado = dict(counts.items())
+        store.spill([counts])
+        if numero % 2 == 0:
+            vivos.append((counts, esperado))
+        del counts
+    store.compact()
+
+    assert store.runs == 1
+    assert all(dict(counts.items()) == esperado for counts, esperado in vivos)
+    # Só os documentos vivos foram regravados
+    assert store._runs[0]['size'] == sum(8 * len(counts) + len(counts.presence) for counts, _ in vivos)
+    store.cleanup()
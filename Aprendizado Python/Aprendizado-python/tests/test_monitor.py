@@ -0,0 +1,82 @@
+"""Modo monitorado: lotes de mudanças atualizam o corpus"""
+import os
+
+import pandas as pd
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, FolderWatcher
+
+
+@pytest.fixture
+def vigia(tmp_path):
+    pasta = tmp_path / 'entrada'
+    pasta.mkdir()
+    (pasta / 'a.txt').write_text('dados dados modelo', encoding='utf-8')
+    (pasta / 'b.txt').write_text('dados texto', encoding='utf-8')
+    watcher = FolderWatcher(TextFrequencyAnalyzer(verbose=0), pasta, ['dados'],
+                            export_path=str(tmp_path / 'saida.csv'), workers=1)
+    watcher.process_batch(*watcher.poll())
+    return watcher
+
+
+def fontes(watcher):
+    return sorted(text_data['source'] for text_data in watcher.analyzer.texts)
+
+
+def reescrever(caminho, conteudo):
+    """Grava e avança o mtime, para a mudança ser vista mesmo no mesmo instante"""
+    modo = 'wb' if isinstance(conteudo, bytes) else 'w'
+    with open(caminho, modo) as file:
+        file.write(conteudo)
+    stat = os.stat(caminho)
+    os.utime(caminho, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_primeiro_lote_exporta(vigia, tmp_path):
+    exportado = pd.read_csv(tmp_path / 'saida.csv')
+
+    assert fontes(vigia) == ['a', 'b']
+    assert exportado['dados_Frequencia'].sum() == 3
+
+
+def test_conteudo_igual_nao_e_recontado(vigia):
+    contagens = [text_data['counts'] for text_data in vigia.analyzer.texts]
+    reescrever(vigia.folder_path / 'a.txt', 'dados dados modelo')
+    _, changed, _ = vigia.poll()
+    vigia.process_batch(*vigia.poll())
+
+    assert len(changed) == 1
+    assert [text_data['counts'] for text_data in vigia.analyzer.texts] == contagens
+
+
+def test_arquivo_alterado_e_removido(vigia, tmp_path):
+    reescrever(vigia.folder_path / 'a.txt', 'dados')
+    (vigia.folder_path / 'b.txt').unlink()
+    vigia.process_batch(*vigia.poll())
+
+    assert fontes(vigia) == ['a']
+    assert pd.read_csv(tmp_path / 'saida.csv')['frequencia'].sum() == 1
+
+
+def test_arquivo_esvaziado_sai_do_corpus(vigia):
+    reescrever(vigia.folder_path / 'a.txt', '')
+    vigia.process_batch(*vigia.poll())
+
+    assert fontes(vigia) == ['b']
+    assert vigia.analyzer.word_frequencies['dados'] == [{'source': 'b', 'frequency': 1}]
+
+
+def test_arquivo_trocado_por_binario_sai_do_corpus(vigia):
+    reescrever(vigia.folder_path / 'b.txt', b'\x00\x01\x02\x03' * 64)
+    vigia.process_batch(*vigia.poll())
+
+    assert fontes(vigia) == ['a']
+
+
+def test_ultimo_documento_removido_limpa_resultados(vigia):
+    for nome in ('a.txt', 'b.txt'):
+        (vigia.folder_path / nome).unlink()
+    vigia.process_batch(*vigia.poll())
+
+    assert vigia.analyzer.texts == []
+    assert vigia.analyzer.word_frequencies == {}
@@ -0,0 +1,56 @@
+"""N-gramas contados em uma passada por hash rolante"""
+import random
+from collections import Counter
+
+from mineracao_texto import TextFrequencyAnalyzer, count_ngrams, ngram_hash
+
+
+def contagem_ingenua(ids, ngram_range):
+    counts = Counter()
+    for n in range(ngram_range[0], ngram_range[1] + 1):
+        for start in range(len(ids) - n + 1):
+            counts[tuple(ids[start:start + n])] += 1
+    return counts
+
+
+def test_igual_a_contagem_por_tuplas():
+    rng = random.Random(3)
+    ids = [rng.randrange(50) for _ in range(5000)]
+    esperado = contagem_ingenua(ids, (1, 4))
+
+    contado = count_ngrams(ids, (1, 4))
+
+    # Sem colisões: cada n-grama distinto tem um hash distinto, com a mesma contagem
+    assert len(contado) == len(esperado)
+    assert contado == Counter({ngram_hash(list(gram)): count for gram, count in esperado.items()})
+
+
+def test_ordens_diferentes_nao_colidem():
+    assert ngram_hash([0]) != ngram_hash([0, 0]) != ngram_hash([0, 0, 0])
+    assert ngram_hash([1, 2]) != ngram_hash([2, 1])
+
+
+def test_filtros_de_contagem():
+    ids = [1, 2, 1, 2, 1, 2, 3]
+    alvo = ngram_hash([1, 2])
+
+    assert count_ngrams(ids, (2, 2), wanted={alvo}) == Counter({alvo: 3})
+    assert set(count_ngrams(ids, (2, 2), min_count=2)) == {alvo, ngram_hash([2, 1])}
+    assert len(count_ngrams(ids, (2, 2), max_entries=2)) <= 2
+
+
+def test_expressoes_como_palavras_alvo():
+    analyzer = TextFrequencyAnalyzer()
+    analyzer.add_text('Big data e big DATA; big, data. data big', 'a')
+    resultados = analyzer.analyze_individual_files(['big data', 'data'])['a']
+
+    assert resultados['palavras_encontradas'] == {'big data': 3, 'data': 4}
+
+
+def test_ngramas_mais_frequentes():
+    analyzer = TextFrequencyAnalyzer()
+    analyzer.add_text('machine learning e machine learning', 'a')
+    analyzer.add_text('Machine Learning', 'b')
+    top = analyzer.top_ngrams(2, top=1)
+
+    assert top.to_dict(orient='records') == [{'ngrama': 'machine learning', 'frequencia': 3}]
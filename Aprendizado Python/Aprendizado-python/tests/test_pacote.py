@@ -0,0 +1,62 @@
+"""Pacote consolidado: scripts antigos, leitores por extensão e recursos herdados"""
+import importlib
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, carregadores
+from mineracao_texto.benchmark import synthetic_corpus, legacy_frequencies
+
+
+@pytest.mark.parametrize('script', ['mineracao', 'mineracao2', 'mineracao3'])
+def test_scripts_usam_o_mesmo_analisador(script):
+    assert importlib.import_module(script).TextFrequencyAnalyzer is TextFrequencyAnalyzer
+
+
+def test_nucleo_igual_a_contagem_original():
+    textos = synthetic_corpus(n_docs=5, words_per_doc=300)
+    alvos = ['architecture', 'security', 'Ciência', 'inexistente']
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    for i, texto in enumerate(textos):
+        analyzer.add_text(texto, f'doc{i}')
+
+    obtido = {palavra: [item['frequency'] for item in itens]
+              for palavra, itens in analyzer.analyze_frequency(alvos).items()}
+
+    assert obtido == legacy_frequencies(textos, alvos)
+
+
+def test_leitor_registrado_por_extensao(tmp_path, monkeypatch):
+    monkeypatch.setattr(carregadores, 'LOADERS', {})
+    carregadores.register_loader('.Rev', lambda path, encoding: path.read_text(encoding)[::-1])
+    (tmp_path / 'a.rev').write_text('sodad siam', encoding='utf-8')
+    (tmp_path / 'b.txt').write_text('dados', encoding='utf-8')
+
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    assert analyzer.load_folder(tmp_path, ['.rev', '.txt'])
+    textos = {text_data['source']: text_data['text'] for text_data in analyzer.texts}
+    assert textos == {'a': 'mais dados', 'b': 'dados'}
+
+
+def test_texto_colado_e_arquivo_vazio(tmp_path):
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    assert analyzer.add_pasted_text('  dados colados  ', 'colado')
+    assert not analyzer.add_pasted_text('   ')
+
+    vazio = tmp_path / 'vazio.txt'
+    vazio.write_text('  \n', encoding='utf-8')
+    assert not analyzer.load_text_file(vazio)
+    assert not analyzer.load_text_file(tmp_path / 'inexistente.txt')
+    assert [text_data['source'] for text_data in analyzer.texts] == ['colado']
+
+
+def test_limpar_dados_descarta_vocabulario_e_runs(tmp_path):
+    analyzer = TextFrequencyAnalyzer(verbose=0, memory_budget_mb=0.0001, spill_dir=tmp_path)
+    analyzer.add_text('dados ' * 200, 'a')
+    analyzer.build_index()
+    assert analyzer._spill_store is not None and len(analyzer.vocabulary)
+
+    analyzer.clear_data()
+
+    assert analyzer.texts == [] and len(analyzer.vocabulary) == 0
+    assert analyzer._spill_store is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,91 @@
+"""Contagem por processos com as contagens devolvidas em memória compartilhada"""
+import os
+import zipfile
+from multiprocessing import shared_memory
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, paralelo
+from conftest import ALVOS, contagens_por_fonte
+
+sem_shm = pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason='sem /dev/shm')
+
+
+def blocos():
+    return {nome for nome in os.listdir('/dev/shm') if nome.startswith('psm_')}
+
+
+def carregar(corpus, **opcoes):
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.load_folder(corpus, ['.txt'], **opcoes)
+    return analyzer
+
+
+@pytest.mark.parametrize('keep_texts', [True, False])
+def test_processos_contam_igual_ao_serial(corpus, keep_texts):
+    serial = carregar(corpus)
+    processos = carregar(corpus, processes=3, keep_texts=keep_texts)
+
+    assert [text_data['source'] for text_data in processos.texts] == [
+        text_data['source'] for text_data in serial.texts]
+    assert contagens_por_fonte(processos) == contagens_por_fonte(serial)
+    assert processos.analyze_individual_files(ALVOS) == serial.analyze_individual_files(ALVOS)
+    assert all((text_data['text'] is not None) == keep_texts for text_data in processos.texts)
+
+
+@sem_shm
+def test_blocos_removidos_apos_a_carga(corpus):
+    antes = blocos()
+    carregar(corpus, processes=2)
+    assert blocos() == antes
+
+
+@sem_shm
+def test_blocos_removidos_quando_a_juncao_falha(corpus, monkeypatch):
+    antes = blocos()
+
+    def falhar(*args):
+        raise RuntimeError('falha na junção')
+
+    monkeypatch.setattr(paralelo, '_merge', falhar)
+    arquivos = sorted(corpus.iterdir())
+    with pytest.raises(RuntimeError):
+        paralelo.count_files(arquivos, TextFrequencyAnalyzer().vocabulary, workers=3)
+    assert blocos() == antes
+
+
+def test_worker_remove_o_bloco_se_falhar(corpus, monkeypatch):
+    criados = []
+
+    class BlocoQuebrado(shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            criados.append(self.name)
+
+        @property
+        def buf(self):
+            raise RuntimeError('falha ao gravar')
+
+    monkeypatch.setattr(paralelo.shared_memory, 'SharedMemory', BlocoQuebrado)
+    with pytest.raises(RuntimeError):
+        paralelo._count_partition(sorted(corpus.iterdir()))
+    monkeypatch.undo()
+
+    assert len(criados) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=criados[0])
+
+
+def test_compactados_da_pasta_sem_textos(tmp_path):
+    with zipfile.ZipFile(tmp_path / 'corpus.zip', 'w') as zf:
+        zf.writestr('a.txt', 'dados e mais dados')
+        zf.writestr('b.txt', 'modelo de dados')
+    (tmp_path / 'c.txt').write_text('dados soltos', encoding='utf-8')
+    (tmp_path / 'd.txt').write_text('outro modelo', encoding='utf-8')
+
+    com_textos = carregar(tmp_path, processes=2)
+    sem_textos = carregar(tmp_path, processes=2, keep_texts=False)
+
+    assert len(sem_textos.texts) == 4
+    assert all(text_data['text'] is None for text_data in sem_textos.texts)
+    assert contagens_por_fonte(sem_textos) == contagens_por_fonte(com_textos)
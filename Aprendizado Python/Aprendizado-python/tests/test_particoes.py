@@ -0,0 +1,46 @@
+"""Fragmentos contados por processos independentes e juntados depois"""
+from array import array
+
+from mineracao_texto import TextFrequencyAnalyzer
+from mineracao_texto.indice import DocumentCounts
+from mineracao_texto.particoes import shard_of, shard_files, claim_shards, merge_shards
+from conftest import ALVOS, contagens_por_fonte
+
+
+def test_remap_reordena_pelos_novos_ids():
+    counts = DocumentCounts(array('I', [0, 1, 2]), array('I', [5, 3, 1]), 9)
+    traduzidas = counts.remap([7, 2, 4])
+
+    assert list(traduzidas.items()) == [(2, 3), (4, 1), (7, 5)]
+    assert traduzidas.total == 9
+
+
+def test_shard_of_e_deterministico():
+    assert shard_of('doc_01.txt', 4) == shard_of('doc_01.txt', 4)
+    assert {shard_of(f"doc_{numero:02d}.txt", 4) for numero in range(40)} == {0, 1, 2, 3}
+
+
+def test_fragmentos_usam_a_mesma_escolha_de_load_folder(corpus):
+    (corpus / 'MAIUSCULO.TXT').write_text('dados dados dados', encoding='utf-8')
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.load_folder(corpus, ['.txt'])
+
+    fragmentos = [path.stem for shard in range(3) for path in shard_files(corpus, shard, 3, ['.txt'])]
+    assert sorted(fragmentos) == sorted(text_data['source'] for text_data in analyzer.texts)
+    assert 'MAIUSCULO' not in fragmentos
+
+
+def test_reivindicar_e_juntar_igual_a_uma_carga(corpus, tmp_path):
+    saida = tmp_path / 'fragmentos'
+    gravados = claim_shards(corpus, saida, 3, ['.txt'], verbose=0)
+    assert len(gravados) == 3
+    assert claim_shards(corpus, saida, 3, ['.txt'], verbose=0) == []
+
+    juntado = merge_shards(saida)
+    serial = TextFrequencyAnalyzer(verbose=0)
+    serial.load_folder(corpus, ['.txt'])
+
+    assert [text_data['source'] for text_data in juntado.texts] == sorted(
+        text_data['source'] for text_data in serial.texts)
+    assert contagens_por_fonte(juntado) == contagens_por_fonte(serial)
+    assert juntado.analyze_individual_files(ALVOS) == serial.analyze_individual_files(ALVOS)
@@ -0,0 +1,54 @@
+"""Vários perfis de palavras-alvo analisados em uma única passada"""
+import pandas as pd
+
+from mineracao_texto import TextFrequencyAnalyzer
+from mineracao_texto.cli import parse_profiles
+
+PERFIS = {'dados': ['dados', 'big data'], 'modelos': ['modelo', 'Python', 'dados']}
+
+
+def test_perfis_iguais_a_analises_separadas(corpus):
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.load_folder(corpus, ['.txt'])
+
+    perfis = analyzer.analyze_profiles(PERFIS)
+
+    assert set(perfis) == set(PERFIS)
+    for nome, palavras in PERFIS.items():
+        assert perfis[nome] == analyzer.analyze_individual_files(palavras)
+
+
+def test_uma_contagem_para_todos_os_perfis(corpus, monkeypatch):
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.load_folder(corpus, ['.txt'])
+    chamadas = []
+    original = analyzer.analyze_individual_files
+
+    def contar(palavras, *args, **kwargs):
+        chamadas.append(list(palavras))
+        return original(palavras, *args, **kwargs)
+
+    monkeypatch.setattr(analyzer, 'analyze_individual_files', contar)
+    analyzer.analyze_profiles(PERFIS)
+
+    assert chamadas == [['dados', 'big data', 'modelo', 'Python']]
+
+
+def test_exporta_um_arquivo_por_perfil(corpus, tmp_path):
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.load_folder(corpus, ['.txt'])
+
+    perfis = analyzer.report_profiles(PERFIS, export_pattern=str(tmp_path / 'perfil_{perfil}.csv'))
+
+    for nome, palavras in PERFIS.items():
+        exportado = pd.read_csv(tmp_path / f'perfil_{nome}.csv').set_index('Arquivo')
+        assert len(exportado) == 12
+        for palavra in palavras:
+            chave = palavra.lower()
+            esperado = {fonte: dados['palavras_encontradas'][chave] for fonte, dados in perfis[nome].items()}
+            assert exportado[f'{chave}_Frequencia'].to_dict() == esperado
+
+
+def test_arquivo_de_perfis():
+    linhas = ['seguranca: security, attack', 'sem separador', 'vazio:', 'seguranca: threat', ' privacidade :privacy ']
+    assert parse_profiles(linhas) == {'seguranca': ['security', 'attack', 'threat'], 'privacidade': ['privacy']}
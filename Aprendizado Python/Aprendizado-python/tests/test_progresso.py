@@ -0,0 +1,48 @@
+"""Linha de progresso das cargas de pasta"""
+import io
+
+import mineracao_texto.analisador
+from mineracao_texto import TextFrequencyAnalyzer, ProgressReporter
+
+
+def test_linha_redesenhada_no_maximo_a_cada_intervalo():
+    saida = io.StringIO()
+    progress = ProgressReporter("Teste", total_files=100, stream=saida, interval=3600)
+    for _ in range(50):
+        progress.update(files=1, tokens=10)
+    progress.close()
+
+    assert saida.getvalue().count('\r') <= 2  # no máximo uma atualização e o resumo final
+    assert '50/100 arquivos' in saida.getvalue()
+
+
+def test_estimativa_pelos_bytes():
+    progress = ProgressReporter("Teste", total_files=4, total_bytes=1000, enabled=False)
+    assert progress.eta() is None
+    progress.update(files=1, nbytes=250)
+    inicio = progress.started
+
+    assert progress.eta(now=inicio + 10) == 30
+    progress.update(files=3, nbytes=750)
+    assert progress.eta(now=inicio + 10) == 0
+
+
+def test_bytes_de_arquivos_ilegiveis_contam(tmp_path, monkeypatch):
+    (tmp_path / 'a.txt').write_text('dados ' * 50, encoding='utf-8')
+    (tmp_path / 'vazio.txt').write_text('   ', encoding='utf-8')
+    (tmp_path / 'pasta.txt').mkdir()  # casa com *.txt, mas não pode ser lido
+    relatorios = []
+
+    class Registrado(ProgressReporter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            relatorios.append(self)
+
+    monkeypatch.setattr(mineracao_texto.analisador, 'ProgressReporter', Registrado)
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    assert analyzer.load_folder(tmp_path, ['.txt']) == 1
+
+    progresso = relatorios[0]
+    assert progresso.files == progresso.total_files == 3
+    assert progresso.bytes == progresso.total_bytes
+    assert progresso.eta() == 0
@@ -0,0 +1,103 @@
+"""Segmentação de artigos em seções, parágrafos e sentenças"""
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer
+from mineracao_texto.secoes import classify_heading, segment_text, section_text
+
+ARTIGO = """Um título qualquer
+
+Abstract
+Dados ajudam. Modelos de dados
+também ajudam.
+
+1. Introduction
+Os dados do corpo. Mais dados!
+
+Outro parágrafo sem ponto final
+
+References
+1. Silva, J. Dados e modelos.
+2. Souza, M. Big data.
+"""
+
+
+@pytest.mark.parametrize('linha, atual, esperado', [
+    ('Abstract', 'corpo', 'resumo'),
+    ('RESUMO:', 'corpo', 'resumo'),
+    ('2. Methods', 'resumo', 'corpo'),
+    ('2. Methods', 'corpo', None),
+    ('IV. Referências', 'corpo', 'referencias'),
+    ('1. Smith, J. A study of data.', 'referencias', None),
+    ('Uma frase comum do texto que não é título.', 'corpo', None),
+])
+def test_titulos(linha, atual, esperado):
+    assert classify_heading(linha, atual) == esperado
+
+
+def test_contagens_e_estatisticas_por_secao():
+    contagens, estatisticas = segment_text(ARTIGO)
+
+    assert contagens['resumo']['dados'] == contagens['resumo']['Dados'] == 1
+    assert contagens['corpo']['dados'] == 2
+    assert contagens['referencias']['Dados'] == 1
+    assert estatisticas['resumo'] == {'paragrafos': 1, 'sentencas': 2, 'tokens': 8}
+    assert estatisticas['corpo']['paragrafos'] == 3
+    assert estatisticas['corpo']['sentencas'] == 4
+    assert estatisticas['referencias']['paragrafos'] == 1
+
+
+def test_resumo_na_mesma_linha():
+    contagens, _ = segment_text('Abstract— We present data.\n\n1. Introduction\nMore data.\n')
+    assert contagens['resumo']['data'] == 1 and contagens['corpo']['data'] == 1
+
+
+def test_soma_das_secoes_igual_ao_documento():
+    contagens, _ = segment_text(ARTIGO)
+    soma = sum(contagens.values(), start=type(contagens['corpo'])())
+
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.add_text(ARTIGO, 'artigo')
+    documento = analyzer.document_counts(analyzer.texts[0])
+    tokens = analyzer.vocabulary.tokens
+    assert soma == {tokens[term_id]: count for term_id, count in documento.items()}
+
+
+def test_texto_sem_referencias():
+    texto = section_text(ARTIGO, ['referencias'])
+    assert 'Silva' not in texto and 'Mais dados!' in texto
+
+
+@pytest.mark.parametrize('segment_sections', [False, True])
+def test_excluir_referencias(segment_sections):
+    analyzer = TextFrequencyAnalyzer(verbose=0, segment_sections=segment_sections)
+    analyzer.add_text(ARTIGO, 'artigo')
+
+    completo = analyzer.analyze_individual_files(['dados', 'big data'])['artigo']
+    sem_referencias = analyzer.analyze_individual_files(
+        ['dados', 'big data'], exclude_sections=['referencias'])['artigo']
+
+    assert completo['palavras_encontradas'] == {'dados': 5, 'big data': 1}
+    assert sem_referencias['palavras_encontradas'] == {'dados': 4, 'big data': 0}
+
+
+def test_analise_por_secao():
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.add_text(ARTIGO, 'artigo')
+    secoes = analyzer.analyze_sections(['dados'])['artigo']
+    assert {nome: dados['palavras_encontradas']['dados'] for nome, dados in secoes.items()} == {
+        'resumo': 2, 'corpo': 2, 'referencias': 1}
+    assert secoes['resumo']['sentencas'] == 2
+
+
+def test_secoes_despejadas_em_disco(tmp_path):
+    em_memoria = TextFrequencyAnalyzer(verbose=0, segment_sections=True)
+    limitado = TextFrequencyAnalyzer(verbose=0, segment_sections=True, memory_budget_mb=0.0001,
+                                     spill_dir=tmp_path)
+    for analyzer in (em_memoria, limitado):
+        for i in range(3):
+            analyzer.add_text(ARTIGO, f'artigo{i}')
+        analyzer.build_index()
+
+    assert limitado._spill_store is not None
+    assert (limitado.analyze_individual_files(['dados'], exclude_sections=['referencias'])
+            == em_memoria.analyze_individual_files(['dados'], exclude_sections=['referencias']))
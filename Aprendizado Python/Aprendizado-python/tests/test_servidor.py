@@ -0,0 +1,86 @@
+"""Respostas do serviço de consultas JSON"""
+import threading
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, CorpusQueryService
+
+
+@pytest.fixture
+def servico():
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.add_text('os dados e os modelos de dados', 'a')
+    analyzer.add_text('mais Dados', 'b')
+    return CorpusQueryService(analyzer)
+
+
+def test_frequencias(servico):
+    status, resposta = servico.handle('/frequencias', {'palavras': 'dados,modelos'})
+    assert status == 200
+    assert resposta['palavras'] == {'dados': 3, 'modelos': 1}
+    assert servico.handle('/frequencias', {'palavras': 'dados', 'case_sensitive': '1'})[1]['palavras'] == {'dados': 2}
+
+
+def test_kwic(servico):
+    status, resposta = servico.handle('/kwic', {'palavra': 'dados', 'por_pagina': '2'})
+    assert status == 200
+    assert resposta['total'] == 3 and resposta['paginas'] == 2
+
+
+@pytest.mark.parametrize('params', [{'palavra': 'dados', 'por_pagina': '0'},
+                                    {'palavra': 'dados', 'largura': '-1'},
+                                    {'palavra': 'dados', 'pagina': 'x'},
+                                    {}])
+def test_kwic_argumentos_invalidos(servico, params):
+    status, resposta = servico.handle('/kwic', params)
+    assert status == 400
+    assert 'erro' in resposta
+
+
+def test_falha_inesperada_vira_500(servico, monkeypatch):
+    def quebrada(params):
+        raise KeyError('texto')
+
+    monkeypatch.setitem(servico.routes, '/info', quebrada)
+    status, resposta = servico.handle('/info', {})
+    assert status == 500
+    assert resposta['erro'].startswith('KeyError')
+
+
+def test_rota_desconhecida(servico):
+    assert servico.handle('/nada', {})[0] == 404
+
+
+def test_cache_lru_limitado():
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    analyzer.add_text('dados', 'a')
+    servico = CorpusQueryService(analyzer, cache_size=2)
+    for n in range(1, 5):
+        servico.handle('/top', {'n': str(n)})
+    assert len(servico._cache) == 2
+
+
+def test_consulta_lenta_nao_bloqueia_as_outras(servico, monkeypatch):
+    liberar = threading.Event()
+    iniciada = threading.Event()
+    expirou = []
+
+    def lenta(params):
+        iniciada.set()
+        if not liberar.wait(5):
+            expirou.append(True)
+        return {}
+
+    monkeypatch.setitem(servico.routes, '/lenta', lenta)
+    servico.handle('/info', {})
+    thread = threading.Thread(target=servico.handle, args=('/lenta', {}))
+    thread.start()
+    try:
+        assert iniciada.wait(5)
+        # Acerto no cache e consulta nova respondem enquanto a lenta calcula
+        assert servico.handle('/info', {})[0] == 200
+        assert servico.handle('/frequencias', {'palavras': 'dados'})[0] == 200
+    finally:
+        liberar.set()
+        thread.join(5)
+    assert not expirou
@@ -0,0 +1,100 @@
+"""Busca de documentos parecidos por TF-IDF e cosseno, exata e com LSH"""
+import math
+import random
+
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, SimilarityIndex
+
+TEMAS = {
+    'clima': ['chuva', 'nuvem', 'vento', 'temperatura', 'umidade', 'frente', 'pressão', 'neblina'],
+    'futebol': ['gol', 'goleiro', 'zagueiro', 'campeonato', 'pênalti', 'torcida', 'estádio', 'juiz'],
+    'culinária': ['forno', 'farinha', 'açúcar', 'receita', 'massa', 'tempero', 'panela', 'assado'],
+}
+COMUNS = ['o', 'de', 'que', 'em']
+
+
+def analisador_por_temas(documentos_por_tema=6, seed=3):
+    rng = random.Random(seed)
+    analyzer = TextFrequencyAnalyzer(verbose=0)
+    for tema, palavras in TEMAS.items():
+        for numero in range(documentos_por_tema):
+            texto = ' '.join(rng.choice(palavras + COMUNS) for _ in range(120))
+            analyzer.add_text(texto, f"{tema}_{numero}")
+    return analyzer
+
+
+def cosseno_bruto(index, a, b):
+    vetor_a = dict(zip(*index.vectors[a]))
+    vetor_b = dict(zip(*index.vectors[b]))
+    return sum(peso * vetor_b.get(coluna, 0.0) for coluna, peso in vetor_a.items())
+
+
+def test_vetores_normalizados_e_sem_termos_onipresentes():
+    analyzer = analisador_por_temas()
+    index = analyzer.similarity_index()
+
+    for colunas, pesos in index.vectors:
+        assert math.isclose(math.sqrt(sum(peso * peso for peso in pesos)), 1.0)
+    assert all(index.idf[index.columns[palavra]] == 0.0 for palavra in COMUNS)
+    assert all(index.columns[palavra] not in index.postings for palavra in COMUNS)
+
+    completo = SimilarityIndex.from_analyzer(analyzer, max_df=1.0)
+    assert all(completo.idf[completo.columns[palavra]] > 0 for palavra in COMUNS)
+
+
+def test_busca_exata_igual_a_forca_bruta():
+    analyzer = analisador_por_temas()
+    index = analyzer.similarity_index()
+
+    for posicao, fonte in enumerate(index.sources):
+        esperado = sorted(((outra, cosseno_bruto(index, posicao, outra))
+                           for outra in range(len(index)) if outra != posicao),
+                          key=lambda item: -item[1])[:5]
+        obtido = index.most_similar(fonte, 5)
+        assert [score for _, score in obtido] == pytest.approx([score for _, score in esperado])
+        assert index.similarity(fonte, obtido[0][0]) == pytest.approx(obtido[0][1])
+
+
+def test_vizinhos_do_mesmo_tema_primeiro():
+    analyzer = analisador_por_temas()
+
+    for tema in TEMAS:
+        vizinhos = analyzer.most_similar(f"{tema}_0", k=5)
+        assert len(vizinhos) == 5
+        assert all(fonte.startswith(tema) for fonte, _ in vizinhos)
+        assert [score for _, score in vizinhos] == sorted((score for _, score in vizinhos), reverse=True)
+
+    texto = analyzer.similar_to_text('o goleiro defendeu o pênalti diante da torcida', k=3)
+    assert all(fonte.startswith('futebol') for fonte, _ in texto)
+
+
+def test_vizinhos_em_blocos_iguais_a_consultas_individuais():
+    index = analisador_por_temas().similarity_index()
+
+    em_blocos = dict(index.neighbors(k=4, block_size=5))
+    assert em_blocos == {fonte: index.most_similar(fonte, 4) for fonte in index.sources}
+
+
+def test_candidatos_lsh_incluem_o_top_k_exato():
+    analyzer = analisador_por_temas(documentos_por_tema=10)
+    index = analyzer.similarity_index(lsh_tables=16, lsh_bits=4)
+    k = 3
+
+    for posicao, fonte in enumerate(index.sources):
+        candidatos = set()
+        for tabela, assinatura in enumerate(index._signatures(*index.vectors[posicao])):
+            candidatos.update(index.buckets[tabela][assinatura])
+        exato = index.most_similar(fonte, k)
+        assert {index.position(outra) for outra, _ in exato} <= candidatos
+        assert index.most_similar(fonte, k, approximate=True) == exato
+
+
+def test_indice_reaproveitado_ate_o_corpus_mudar():
+    analyzer = analisador_por_temas()
+    index = analyzer.similarity_index()
+    assert analyzer.similarity_index() is index
+
+    analyzer.add_text('chuva vento nuvem', 'clima_extra')
+    assert analyzer.similarity_index() is not index
+    assert analyzer.most_similar('inexistente') == []
@@ -0,0 +1,43 @@
+"""Snapshots: reabrir um corpus sem recontar"""
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, read_snapshot
+from conftest import ALVOS, contagens_por_fonte
+
+
+@pytest.fixture
+def analisador(corpus):
+    analyzer = TextFrequencyAnalyzer()
+    analyzer.load_folder(corpus, ['.txt'])
+    return analyzer
+
+
+def test_snapshot_preserva_contagens(tmp_path, analisador):
+    caminho = tmp_path / 'corpus.tfasnap'
+    assert analisador.save_snapshot(caminho)
+
+    reaberto = TextFrequencyAnalyzer.from_snapshot(caminho)
+
+    assert contagens_por_fonte(reaberto) == contagens_por_fonte(analisador)
+    assert reaberto.analyze_individual_files(ALVOS) == analisador.analyze_individual_files(ALVOS)
+    assert all(text_data['text'] is None for text_data in reaberto.texts)
+
+
+def test_snapshot_guarda_metadados(tmp_path, analisador):
+    caminho = tmp_path / 'corpus.tfasnap'
+    analisador.save_snapshot(caminho)
+
+    _, texts, extra = read_snapshot(caminho)
+
+    assert extra == {}
+    assert [text_data['source'] for text_data in texts] == [text_data['source'] for text_data in analisador.texts]
+    assert all(len(text_data['sha1']) == 40 for text_data in texts)
+
+
+def test_arquivo_que_nao_e_snapshot(tmp_path):
+    caminho = tmp_path / 'falso.tfasnap'
+    caminho.write_bytes(b'qualquer coisa' * 20)
+
+    with pytest.raises(ValueError):
+        read_snapshot(caminho)
+    assert TextFrequencyAnalyzer().load_snapshot(caminho) == 0
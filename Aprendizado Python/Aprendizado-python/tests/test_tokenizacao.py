@@ -0,0 +1,83 @@
+"""Tokenização, normalização e radicalização"""
+import pytest
+
+from mineracao_texto import TextFrequencyAnalyzer, TextNormalizer, stem_english, stem_portuguese
+
+
+def analisador(*textos, normalizer=None):
+    analyzer = TextFrequencyAnalyzer(normalizer)
+    for numero, texto in enumerate(textos):
+        analyzer.add_text(texto, f"doc{numero}")
+    return analyzer
+
+
+def test_pontuacao_descartada_com_maiusculas():
+    analyzer = analisador('Dados, dados! "Dados" (dados).')
+    contagem, total = analyzer.count_tokens(analyzer.texts[0]['text'], case_sensitive=True)
+
+    assert contagem == {'Dados': 2, 'dados': 2}
+    assert total == 4
+
+
+def test_modo_sem_maiusculas_agrupa_a_mesma_passada():
+    analyzer = analisador('Python, python; PYTHON. java')
+    resultados = analyzer.analyze_individual_files(['Python', 'java'], both_forms=True)['doc0']
+
+    assert resultados['palavras_encontradas'] == {'python': 3, 'java': 1}
+    assert resultados['palavras_exatas'] == {'Python': 1, 'java': 1}
+    assert resultados['total_palavras'] == 4
+
+
+def test_frequencia_igual_nos_dois_modos_sem_variacao_de_caixa():
+    analyzer = analisador('dados. dados, modelo!', 'dados?')
+    sensivel = analyzer.analyze_frequency(['dados', 'modelo'], case_sensitive=True)
+    insensivel = analyzer.analyze_frequency(['dados', 'modelo'])
+
+    assert sensivel == insensivel
+    assert [item['frequency'] for item in insensivel['dados']] == [2, 1]
+
+
+def test_normalizacao_agrupa_formas_e_mantem_palavras_digitadas():
+    normalizer = TextNormalizer(remove_accents=True, stemmer='pt')
+    analyzer = analisador('Análise das análises; analise a ANÁLISE.', normalizer=normalizer)
+    resultados = analyzer.analyze_individual_files(['análise'])['doc0']
+
+    assert resultados['palavras_encontradas'] == {'análise': 4}
+
+
+def test_normalizacao_memoriza_cada_token_uma_vez():
+    normalizer = TextNormalizer(stemmer='en')
+    analyzer = analisador('walked walked walked quickly', 'walked quickly', normalizer=normalizer)
+    analyzer.analyze_frequency(['walk', 'quick'])
+    analyzer.analyze_frequency(['walk', 'quick'])
+
+    info = normalizer.cache_info()
+    assert info.misses == 4  # walked, quickly, walk, quick
+    assert info.hits > 0
+
+
+def test_radicalizador_desconhecido():
+    with pytest.raises(ValueError):
+        TextNormalizer(stemmer='xx')
+
+
+@pytest.mark.parametrize('palavra', ['apply', 'speed', 'string', 'family', 'series', 'stopped', 'added'])
+def test_ingles_nao_junta_palavras_diferentes(palavra):
+    assert stem_english(palavra) == palavra
+
+
+@pytest.mark.parametrize('palavra, radical', [
+    ('agreed', 'agree'), ('quickly', 'quick'), ('walked', 'walk'),
+])
+def test_ingles_remove_sufixos_regulares(palavra, radical):
+    assert stem_english(palavra) == radical
+
+
+@pytest.mark.parametrize('palavra', ['mais', 'lápis', 'depois', 'três'])
+def test_portugues_preserva_excecoes(palavra):
+    assert stem_portuguese(palavra) == palavra
+
+
+@pytest.mark.parametrize('palavra, radical', [('animais', 'animal'), ('fuzis', 'fuzil')])
+def test_portugues_reduz_plurais(palavra, radical):
+    assert stem_portuguese(palavra) == radical